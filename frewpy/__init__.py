@@ -8,3 +8,6 @@ automation of design work.
 """
 
 from .frew_model import FrewModel
+from .batch import find_extremes
+from .diff import diff
+from .stream import peek
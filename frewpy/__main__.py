@@ -0,0 +1,6 @@
+import sys
+
+from frewpy.cli import main
+
+
+sys.exit(main())
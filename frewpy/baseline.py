@@ -0,0 +1,200 @@
+"""
+Baseline
+========
+
+This module holds the class `BaselineStore` which snapshots the results of
+reference Frew models into compact binary archives, so that later runs can be
+checked against them without re-reading the original json models.
+
+"""
+
+import os
+from typing import Dict, List, Tuple, Union
+
+import numpy as np  # type: ignore
+
+from frewpy.frew_model import FrewModel
+from frewpy.utils import (
+    check_result_dtype,
+    get_all_results,
+    get_design_case_names,
+    get_stage_names,
+    strip_json_extension,
+)
+from frewpy.models.exceptions import FrewError
+
+
+# Absolute (frewpy units) and relative tolerances used when none are given
+# for a field.
+DEFAULT_TOLERANCE: Tuple[float, float] = (1e-3, 1e-4)
+
+
+class BaselineStore:
+    """ A class used to store baseline results of Frew models and to check
+    new results against them.
+
+    ...
+
+    Attributes
+    ----------
+    folder_path : str
+        The folder holding a `.npz` archive for each baseline.
+    dtype : str
+        The data type new baselines are stored as, either 'float64' or
+        'float32' to halve their size. Defaults to 'float64'. Results are
+        rounded to the data type of their baseline before being checked, so
+        the rounding error, see `utils.get_float32_error`, is not counted
+        against the tolerances.
+
+    """
+
+    def __init__(self, folder_path: str, dtype: str = "float64") -> None:
+        if not os.path.isdir(folder_path):
+            raise FrewError(f"Path {folder_path} does not exist.")
+        check_result_dtype(dtype)
+        self.folder_path: str = folder_path
+        self.dtype: str = dtype
+
+    def snapshot(self, model: FrewModel, name: str = None) -> str:
+        """ Method to store the results and envelopes of a model as a
+        baseline.
+
+        Parameters
+        ----------
+        model : FrewModel
+            The analysed model to take the baseline from.
+        name : str, optional
+            The name of the baseline, defaults to the model's file name.
+
+        Returns
+        -------
+        baseline_path : str
+            The file path of the baseline archive.
+
+        """
+        baseline_path: str = self._get_path(model, name)
+        np.savez_compressed(
+            baseline_path,
+            **self._get_arrays(model, self.dtype),
+            design_cases=np.array(get_design_case_names(model.json_data)),
+            stage_names=np.array(get_stage_names(model.json_data)),
+        )
+        return baseline_path
+
+    def check(
+        self,
+        model: FrewModel,
+        name: str = None,
+        tolerances: Dict[str, Tuple[float, float]] = None,
+    ) -> List[Dict[str, Union[str, int, float, None]]]:
+        """ Method to check the results of a model against its baseline.
+
+        Parameters
+        ----------
+        model : FrewModel
+            The analysed model to check.
+        name : str, optional
+            The name of the baseline, defaults to the model's file name.
+        tolerances : Dict[str, Tuple[float, float]], optional
+            The absolute and relative tolerance for each field, e.g.
+            {'bending': (0.5, 1e-3)}. Envelopes use the tolerance of their
+            field. Other fields use `DEFAULT_TOLERANCE`.
+
+        Returns
+        -------
+        violations : List[Dict[str, Union[str, int, float, None]]]
+            A record for each field, stage and design case outside of the
+            tolerances, holding the worst node (or strut) number, the
+            baseline value and the new value, with a reason of 'nan' where
+            a value has become NaN or is no longer NaN. Records for envelopes have a
+            stage of None. An empty list means the check has passed.
+
+        Raises
+        ------
+        FrewError
+            If there is no baseline for the model.
+
+        """
+        baseline_path: str = self._get_path(model, name)
+        if not os.path.exists(baseline_path):
+            raise FrewError(f"No baseline at {baseline_path}.")
+        tolerances = tolerances or {}
+        arrays: Dict[str, np.ndarray] = self._get_arrays(model, "float64")
+
+        violations: List[Dict[str, Union[str, int, float, None]]] = []
+        with np.load(baseline_path) as baseline:
+            design_cases: List[str] = baseline["design_cases"].tolist()
+            if get_design_case_names(model.json_data) != design_cases:
+                return [{"field": "design_cases", "reason": "changed"}]
+            for field, values in arrays.items():
+                if field not in baseline.files:
+                    violations.append({"field": field, "reason": "missing"})
+                    continue
+                expected: np.ndarray = baseline[field]
+                if expected.shape != values.shape:
+                    violations.append({"field": field, "reason": "shape"})
+                    continue
+                values = values.astype(expected.dtype).astype(np.float64)
+                expected = expected.astype(np.float64)
+                atol, rtol = tolerances.get(
+                    field.split(":")[0], DEFAULT_TOLERANCE
+                )
+                violations.extend(
+                    _find_violations(
+                        field, expected, values, atol, rtol, design_cases
+                    )
+                )
+        return violations
+
+    def _get_path(self, model: FrewModel, name: Union[str, None]) -> str:
+        if name is None:
+            name = strip_json_extension(os.path.basename(model.file_path))
+        return os.path.join(self.folder_path, f"{name}.npz")
+
+    def _get_arrays(
+        self, model: FrewModel, dtype: str
+    ) -> Dict[str, np.ndarray]:
+        arrays: Dict[str, np.ndarray] = get_all_results(model.json_data, dtype)
+        # The NaN forces of struts which are not installed are skipped.
+        for field in list(arrays.keys()):
+            arrays[f"{field}:maximum"] = np.fmax.reduce(arrays[field], axis=0)
+            arrays[f"{field}:minimum"] = np.fmin.reduce(arrays[field], axis=0)
+        return arrays
+
+
+def _find_violations(
+    field: str,
+    expected: np.ndarray,
+    values: np.ndarray,
+    atol: float,
+    rtol: float,
+    design_cases: List[str],
+) -> List[Dict[str, Union[str, int, float, None]]]:
+    if values.size == 0:
+        return []
+    # Envelopes have no stage axis, so give them one to share the logic.
+    is_envelope: bool = expected.ndim == 2
+    if is_envelope:
+        expected, values = expected[np.newaxis], values[np.newaxis]
+    excess = np.abs(values - expected) - (atol + rtol * np.abs(expected))
+    # Struts which are not installed have NaN results in both, while a
+    # result which becomes NaN, or stops being NaN, is always reported.
+    nan_changed = np.isnan(values) != np.isnan(expected)
+    excess[np.isnan(excess)] = -np.inf
+    excess[nan_changed] = np.inf
+    worst = excess.argmax(axis=2)
+    stages, cases = np.nonzero(excess.max(axis=2, initial=-np.inf) > 0)
+    return [
+        {
+            "field": field,
+            "reason": "nan"
+            if nan_changed[stage, case, worst[stage, case]]
+            else "tolerance",
+            "stage": None if is_envelope else int(stage),
+            "design case": design_cases[case],
+            "location": int(worst[stage, case]) + 1,
+            "baseline": float(expected[stage, case, worst[stage, case]]),
+            "value": float(values[stage, case, worst[stage, case]]),
+        }
+        for stage, case in zip(stages, cases)
+    ]
@@ -0,0 +1,73 @@
+"""
+Batch
+=====
+
+This module holds functions which operate across a batch of Frew models,
+combining the results of each `FrewModel` into a single answer.
+
+"""
+
+from typing import Dict, List, Sequence
+
+from frewpy.frew_model import FrewModel
+from frewpy.models.exceptions import FrewError
+
+
+def find_extremes(
+    models: Sequence[FrewModel],
+    component: str = "wall",
+    num_values: int = 1,
+    **kwargs,
+) -> Dict[str, Dict[str, List[dict]]]:
+    """ Finds the governing maximum and minimum results across a batch of
+    Frew models.
+
+    Parameters
+    ----------
+    models : Sequence[FrewModel]
+        The Frew models to search.
+    component : str, optional
+        The part of the model to search: 'wall', 'water' or 'strut'. Defaults
+        to 'wall'.
+    num_values : int, optional
+        The number of governing values to return per field, defaults to 1.
+    **kwargs
+        Passed on to the `find_extremes` method of the component, e.g.
+        `fields`.
+
+    Returns
+    -------
+    extremes : Dict[str, Dict[str, List[dict]]]
+        The 'maximum' and 'minimum' records for each field, ordered from the
+        most onerous. Each record is as returned by the component with the
+        addition of the 'model' file path.
+
+    Raises
+    ------
+    FrewError
+        If `component` is not one of the options.
+
+    """
+    if component not in ["wall", "water", "strut"]:
+        raise FrewError("Component must be one of: wall, water, strut.")
+
+    extremes: Dict[str, Dict[str, List[dict]]] = {}
+    for model in models:
+        model_extremes = getattr(model, component).find_extremes(
+            num_values=num_values, **kwargs
+        )
+        for field, field_extremes in model_extremes.items():
+            extremes.setdefault(field, {"maximum": [], "minimum": []})
+            for extreme, records in field_extremes.items():
+                extremes[field][extreme].extend(
+                    {**record, "model": model.file_path} for record in records
+                )
+
+    for field_extremes in extremes.values():
+        field_extremes["maximum"] = sorted(
+            field_extremes["maximum"], key=lambda record: -record["value"]
+        )[:num_values]
+        field_extremes["minimum"] = sorted(
+            field_extremes["minimum"], key=lambda record: record["value"]
+        )[:num_values]
+    return extremes
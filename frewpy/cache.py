@@ -0,0 +1,178 @@
+"""
+Cache
+=====
+
+This module holds the class `ModelCache` which shares loaded `FrewModel`
+instances between the parts of a script or service which use the same
+models, within an estimated memory budget.
+
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Union
+
+from frewpy.frew_model import FrewModel
+from frewpy.interner import Interner
+from frewpy.utils import check_result_dtype, get_file_hash
+
+
+class ModelCache:
+    """ A class used to keep recently used Frew models loaded, so that asking
+    for the same model again returns the same instance rather than reading
+    and parsing the file again.
+
+    A model is loaded again when its file changes. The modification time and
+    size of the file are checked on each request, and if they have changed
+    the hash of the file decides whether its contents have. The models are
+    shared, so changes made to one are seen by everything using the cache.
+
+    ...
+
+    Attributes
+    ----------
+    max_bytes : int
+        The estimated memory budget of the loaded models, defaults to 512MB.
+        The least recently used models are unloaded to stay within it, but the
+        most recently used model is always kept.
+    interner : Interner
+        Shares the keys and repeated values of the loaded models, optional.
+        The memory estimate of each model still includes the values it
+        shares, so more models fit within the budget than it suggests.
+    result_dtype : str
+        The data type the loaded models keep their result arrays as, either
+        'float64' or 'float32' to halve their memory. Defaults to 'float64'.
+
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 512 * 1024 ** 2,
+        interner: Interner = None,
+        result_dtype: str = "float64",
+    ) -> None:
+        check_result_dtype(result_dtype)
+        self.max_bytes: int = max_bytes
+        self.interner: Union[Interner, None] = interner
+        self.result_dtype: str = result_dtype
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, file_path: str) -> bool:
+        return os.path.abspath(file_path) in self._entries
+
+    def get(self, file_path: str) -> FrewModel:
+        """ Method to get the model at a file path, loading it if it is not
+        in the cache or has changed since it was loaded.
+
+        Parameters
+        ----------
+        file_path : str
+            The file path to the json Frew model.
+
+        Returns
+        -------
+        model : FrewModel
+            The shared model instance.
+
+        """
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        file_stat = (stat.st_mtime, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is not None and entry["stat"] == file_stat:
+                return self._hit(file_path)
+        file_hash: str = get_file_hash(file_path)
+        with self._lock:
+            entry = self._entries.get(file_path)
+            # Files which are touched or copied over without being changed
+            # keep their loaded model.
+            if entry is not None and entry["hash"] == file_hash:
+                entry["stat"] = file_stat
+                return self._hit(file_path)
+        model = FrewModel(file_path, self.interner, self.result_dtype)
+        with self._lock:
+            self._stats["misses"] += 1
+            self._entries[file_path] = {
+                "stat": file_stat,
+                "hash": file_hash,
+                "model": model,
+                "data bytes": _estimate_size(model.json_data),
+            }
+            self._entries.move_to_end(file_path)
+            self._evict()
+        return model
+
+    def get_stats(self) -> Dict[str, int]:
+        """ Method to get the statistics of the cache.
+
+        Returns
+        -------
+        stats : Dict[str, int]
+            The number of 'hits', 'misses' and 'evictions' since the cache
+            was created, and the number of 'models' loaded with their
+            estimated total 'bytes'.
+
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                "models": len(self._entries),
+                "bytes": sum(
+                    _get_entry_size(entry) for entry in self._entries.values()
+                ),
+            }
+
+    def clear(self) -> None:
+        """ Method to unload all of the models.
+
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _hit(self, file_path: str) -> FrewModel:
+        self._stats["hits"] += 1
+        self._entries.move_to_end(file_path)
+        # Result arrays calculated since the last request count towards the
+        # budget, so it is checked on every request.
+        self._evict()
+        return self._entries[file_path]["model"]
+
+    def _evict(self) -> None:
+        total: int = sum(
+            _get_entry_size(entry) for entry in self._entries.values()
+        )
+        while total > self.max_bytes and len(self._entries) > 1:
+            _, entry = self._entries.popitem(last=False)
+            total -= _get_entry_size(entry)
+            self._stats["evictions"] += 1
+
+
+def _get_entry_size(entry: dict) -> int:
+    model: FrewModel = entry["model"]
+    return entry["data bytes"] + sum(
+        array.nbytes for array in model.wall._result_arrays.values()
+    )
+
+
+def _estimate_size(json_data: Union[dict, list]) -> int:
+    # The parsed json is walked once when a model is loaded, adding up the
+    # size of every container, key and value.
+    size: int = 0
+    stack: list = [json_data]
+    while stack:
+        item = stack.pop()
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return size
@@ -0,0 +1,479 @@
+"""
+CLI
+===
+
+This module holds the `frewpy` command line interface, which runs batch
+exports, plots, envelopes, indexing, conversion and diffs of Frew models from
+the shell, or watches and serves them. Inputs can be files, glob patterns
+or folders, and batches can be spread over several worker processes with `-j`.
+
+"""
+
+import os
+import sys
+import glob
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Sequence, Tuple, Union, cast
+
+import matplotlib  # type: ignore
+import pandas as pd  # type: ignore
+
+from frewpy.frew_model import FrewModel
+from frewpy.cache import ModelCache
+from frewpy.convert import BatchConverter
+from frewpy.diff import diff
+from frewpy.index import ModelIndex
+from frewpy.report import Report, REPORT_FORMATS
+from frewpy.server import ModelServer
+from frewpy.watch import FolderWatcher
+from frewpy.utils import JSON_EXTENSIONS, strip_json_extension
+from frewpy.workers import init_worker, run_task
+from frewpy.models import Wall
+from frewpy.models.exceptions import FrewError
+
+
+def main(argv: Sequence[str] = None) -> int:
+    """ Runs the `frewpy` command line interface.
+
+    Parameters
+    ----------
+    argv : Sequence[str], optional
+        The command line arguments, defaults to those given to Python.
+
+    Returns
+    -------
+    exit_code : int
+        0 on success, 1 if any input failed or, for `diff`, if the models
+        differ.
+
+    """
+    args = _create_parser().parse_args(argv)
+    # Figures are only ever saved to file, so no window toolkit is needed.
+    matplotlib.use("Agg")
+    try:
+        return args.command(args)
+    except FrewError as error:
+        message: str = " ".join(str(error).split())
+        print(f"frewpy: error: {message}", file=sys.stderr)
+        return 1
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="frewpy", description="Batch operations on Frew models."
+    )
+    subparsers = parser.add_subparsers(dest="subcommand", required=True)
+
+    export = subparsers.add_parser(
+        "export", help="Export the wall results of json models."
+    )
+    _add_batch_arguments(export)
+    export.add_argument(
+        "-f",
+        "--format",
+        nargs="+",
+        choices=list(REPORT_FORMATS.keys()),
+        default=["excel"],
+        help="The formats to export, defaults to excel.",
+    )
+    export.set_defaults(command=_export, compact=False)
+
+    plot = subparsers.add_parser(
+        "plot", help="Plot the wall results of json models."
+    )
+    _add_batch_arguments(plot)
+    plot.add_argument(
+        "-f",
+        "--format",
+        nargs="+",
+        choices=["pdf", "html"],
+        default=["pdf"],
+        help="The formats to plot, defaults to pdf.",
+    )
+    plot.add_argument(
+        "--compact",
+        action="store_true",
+        help="Plot html as one set of figures with a stage selector.",
+    )
+    plot.set_defaults(command=_export)
+
+    envelope = subparsers.add_parser(
+        "envelope",
+        help="Write the wall result envelopes of json models to csv.",
+    )
+    _add_batch_arguments(envelope)
+    envelope.set_defaults(command=_envelope)
+
+    index = subparsers.add_parser(
+        "index", help="Index folders of json models and search the index."
+    )
+    index.add_argument(
+        "folders", nargs="*", help="The folders to scan before searching."
+    )
+    index.add_argument(
+        "--db", default="frewpy_index.db", help="The index database file."
+    )
+    index.add_argument(
+        "--no-recursive", action="store_true", help="Do not scan subfolders.",
+    )
+    for criterion in [
+        "job-number",
+        "job-title",
+        "frew-version",
+        "stage-name",
+        "material",
+        "user",
+    ]:
+        index.add_argument(
+            f"--{criterion}", help=f"Print models with this {criterion}."
+        )
+    index.set_defaults(command=_index)
+
+    convert = subparsers.add_parser(
+        "convert", help="Convert .fwd models to json, requires Frew."
+    )
+    _add_batch_arguments(convert, out_folder=False)
+    convert.add_argument(
+        "--manifest",
+        help="A json file of model hashes, to also skip unchanged models.",
+    )
+    convert.add_argument(
+        "--compress",
+        choices=["gz", "zst"],
+        help="Compress the json models with gzip or zstandard.",
+    )
+    convert.set_defaults(command=_convert)
+
+    model_diff = subparsers.add_parser(
+        "diff", help="Compare the inputs and results of two json models."
+    )
+    model_diff.add_argument("model_a", help="The original model.")
+    model_diff.add_argument("model_b", help="The revised model.")
+    model_diff.add_argument(
+        "--rtol", type=float, default=1e-5, help="The relative tolerance."
+    )
+    model_diff.add_argument(
+        "--atol", type=float, default=1e-8, help="The absolute tolerance."
+    )
+    model_diff.set_defaults(command=_diff)
+
+    serve = subparsers.add_parser(
+        "serve", help="Serve the json models in a folder over local HTTP."
+    )
+    serve.add_argument("folder", help="The folder of models to serve.")
+    serve.add_argument(
+        "--host", default="127.0.0.1", help="The address to listen on."
+    )
+    serve.add_argument(
+        "--port", type=int, default=8765, help="The port to listen on."
+    )
+    serve.add_argument(
+        "--max-mb",
+        type=float,
+        default=512,
+        help="The memory budget of loaded models in MB, defaults to 512.",
+    )
+    serve.set_defaults(command=_serve)
+
+    watch = subparsers.add_parser(
+        "watch",
+        help="Export the reports of json models in a folder as they change.",
+    )
+    watch.add_argument("folder", help="The folder of models to watch.")
+    watch.add_argument(
+        "-o",
+        "--out-folder",
+        help="The folder to write to, defaults to the watched folder.",
+    )
+    watch.add_argument(
+        "-f",
+        "--format",
+        nargs="+",
+        choices=list(REPORT_FORMATS.keys()),
+        default=["excel", "pdf", "html"],
+        help="The formats to export, defaults to excel, pdf and html.",
+    )
+    watch.add_argument(
+        "-j", "--jobs", type=int, help="The number of worker processes."
+    )
+    watch.add_argument(
+        "--debounce",
+        type=float,
+        default=2.0,
+        help="Seconds a model must be unchanged before exporting it.",
+    )
+    watch.set_defaults(command=_watch)
+    return parser
+
+
+def _add_batch_arguments(
+    parser: argparse.ArgumentParser, out_folder: bool = True
+) -> None:
+    parser.add_argument(
+        "inputs", nargs="+", help="Model files, glob patterns or folders."
+    )
+    if out_folder:
+        parser.add_argument(
+            "-o",
+            "--out-folder",
+            help="The folder to write to, defaults to that of each model.",
+        )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="The number of worker processes, defaults to 1.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip models whose outputs are newer than the model.",
+    )
+
+
+def _find_inputs(
+    inputs: Sequence[str], extensions: Sequence[str]
+) -> List[str]:
+    file_paths: List[str] = []
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = glob.glob(os.path.join(item, "*"))
+        else:
+            matches = glob.glob(item, recursive=True)
+        file_paths.extend(
+            os.path.abspath(match)
+            for match in sorted(matches)
+            if match.lower().endswith(tuple(extensions))
+            and os.path.isfile(match)
+        )
+    if not file_paths:
+        raise FrewError(
+            f"No {', '.join(extensions)} files found in {list(inputs)}."
+        )
+    return list(dict.fromkeys(file_paths))
+
+
+def _get_out_path(file_path: str, out_folder: str, suffix: str) -> str:
+    stem: str = strip_json_extension(os.path.basename(file_path))
+    return os.path.join(
+        out_folder or os.path.dirname(file_path), f"{stem}{suffix}"
+    )
+
+
+def _is_up_to_date(file_path: str, out_paths: Sequence[str]) -> bool:
+    input_mtime: float = os.path.getmtime(file_path)
+    return all(
+        os.path.exists(out_path) and os.path.getmtime(out_path) >= input_mtime
+        for out_path in out_paths
+    )
+
+
+def _run_batch(
+    task: Callable,
+    jobs: List[Tuple[str, tuple]],
+    workers: int,
+    out_paths: List[List[str]],
+    incremental: bool,
+) -> int:
+    pending: List[Tuple[str, tuple]] = []
+    for (file_path, task_args), job_out_paths in zip(jobs, out_paths):
+        if incremental and _is_up_to_date(file_path, job_out_paths):
+            print(f"skipped {file_path}")
+        else:
+            pending.append((file_path, task_args))
+
+    failed: int = 0
+    if workers <= 1 or len(pending) <= 1:
+        errors = [
+            run_task(task, file_path, *task_args)
+            for file_path, task_args in pending
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=init_worker
+        ) as executor:
+            futures = [
+                executor.submit(run_task, task, file_path, *task_args)
+                for file_path, task_args in pending
+            ]
+            errors = [future.result() for future in futures]
+    for (file_path, _), error in zip(pending, errors):
+        if error is None:
+            print(f"done {file_path}")
+        else:
+            failed += 1
+            print(f"failed {file_path}: {error}", file=sys.stderr)
+    print(
+        f"{len(pending) - failed} done, {len(jobs) - len(pending)} skipped, "
+        f"{failed} failed"
+    )
+    return 1 if failed else 0
+
+
+def _export_model(
+    file_path: str, out_folder: str, formats: List[str], compact: bool
+) -> None:
+    file_stem: str = os.path.basename(
+        _get_out_path(file_path, out_folder, "_results")
+    )
+    Report(FrewModel(file_path), out_folder, file_stem).write(
+        formats, compact=compact
+    )
+
+
+def _export(args: argparse.Namespace) -> int:
+    file_paths: List[str] = _find_inputs(args.inputs, JSON_EXTENSIONS)
+    jobs: List[Tuple[str, tuple]] = []
+    out_paths: List[List[str]] = []
+    for file_path in file_paths:
+        out_folder: str = args.out_folder or os.path.dirname(file_path)
+        jobs.append((file_path, (out_folder, args.format, args.compact)))
+        out_paths.append(
+            [
+                _get_out_path(
+                    file_path,
+                    out_folder,
+                    f"_results.{REPORT_FORMATS[out_format]}",
+                )
+                for out_format in args.format
+            ]
+        )
+    return _run_batch(
+        _export_model, jobs, args.jobs, out_paths, args.incremental
+    )
+
+
+def _write_envelopes(file_path: str, out_path: str) -> None:
+    model = FrewModel(file_path)
+    node_levels: List[float] = model.wall.get_node_levels()
+    envelopes: Dict[str, dict] = model.wall.get_envelopes()
+    pd.DataFrame(
+        Wall.format_envelope_data(
+            len(node_levels), node_levels, envelopes, list(envelopes.keys())
+        )
+    ).to_csv(out_path, index=False)
+
+
+def _envelope(args: argparse.Namespace) -> int:
+    file_paths: List[str] = _find_inputs(args.inputs, JSON_EXTENSIONS)
+    out_paths: List[str] = [
+        _get_out_path(file_path, args.out_folder, "_envelopes.csv")
+        for file_path in file_paths
+    ]
+    return _run_batch(
+        _write_envelopes,
+        [
+            (file_path, (out_path,))
+            for file_path, out_path in zip(file_paths, out_paths)
+        ],
+        args.jobs,
+        [[out_path] for out_path in out_paths],
+        args.incremental,
+    )
+
+
+def _index(args: argparse.Namespace) -> int:
+    with ModelIndex(args.db) as model_index:
+        if args.folders:
+            summary = model_index.update(
+                args.folders, recursive=not args.no_recursive
+            )
+            print(
+                ", ".join(f"{count} {key}" for key, count in summary.items())
+            )
+        criteria = {
+            key: getattr(args, key)
+            for key in [
+                "job_number",
+                "job_title",
+                "frew_version",
+                "stage_name",
+                "material",
+                "user",
+            ]
+            if getattr(args, key) is not None
+        }
+        if criteria:
+            for file_path in model_index.find(**criteria):
+                print(file_path)
+    return 0
+
+
+def _convert(args: argparse.Namespace) -> int:
+    def print_error(file_path: str, error: Union[str, None]) -> None:
+        if error is None:
+            print(f"done {file_path}")
+        else:
+            print(f"failed {file_path}: {error}", file=sys.stderr)
+
+    summary = BatchConverter(
+        workers=args.jobs,
+        manifest_path=args.manifest,
+        extension=f".json.{args.compress}" if args.compress else ".json",
+    ).convert(
+        _find_inputs(args.inputs, [".fwd"]),
+        incremental=args.incremental,
+        callback=print_error,
+    )
+    print(
+        f"{summary['converted']} done, {summary['skipped']} skipped, "
+        f"{len(cast(dict, summary['failed']))} failed in "
+        f"{summary['seconds']:.1f}s "
+        f"({summary['files per second']:.2f} files/s)"
+    )
+    return 1 if summary["failed"] else 0
+
+
+def _diff(args: argparse.Namespace) -> int:
+    model_diff = diff(
+        FrewModel(args.model_a),
+        FrewModel(args.model_b),
+        rtol=args.rtol,
+        atol=args.atol,
+    )
+    for path in model_diff["changed"]:
+        print(f"changed {path}")
+    for result in model_diff["exceeded"]:
+        print(f"exceeded {result}")
+    return 1 if model_diff["changed"] or model_diff["exceeded"] else 0
+
+
+def _serve(args: argparse.Namespace) -> int:
+    server = ModelServer(
+        args.folder,
+        args.host,
+        args.port,
+        ModelCache(int(args.max_mb * 1024 ** 2)),
+    )
+    host, port = server.address
+    print(f"Serving {server.folder_path} at http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+def _watch(args: argparse.Namespace) -> int:
+    def print_errors(errors: Dict[str, Union[str, None]]) -> None:
+        for file_path, error in errors.items():
+            if error is None:
+                print(f"done {file_path}")
+            else:
+                print(f"failed {file_path}: {error}", file=sys.stderr)
+
+    with FolderWatcher(
+        args.folder, args.out_folder, args.format, args.debounce, args.jobs
+    ) as watcher:
+        print(f"Watching {watcher.folder_path}")
+        try:
+            watcher.run(callback=print_errors)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
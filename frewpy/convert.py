@@ -0,0 +1,208 @@
+"""
+Convert
+=======
+
+This module holds the class `BatchConverter` which converts many `.fwd` Frew
+models to `.json` at once, skipping models which are already converted. The
+conversion itself is done by a backend, which is Frew through COM by default.
+
+"""
+
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Union
+from uuid import uuid4
+
+from comtypes import CoInitialize, CoUninitialize  # type: ignore
+
+from frewpy.utils import (
+    JSON_EXTENSIONS,
+    copy_model,
+    get_file_hash,
+    model_to_json,
+    strip_json_extension,
+)
+from frewpy.models.exceptions import FrewError
+
+
+def com_backend(file_path: str, json_path: str) -> None:
+    """ Converts a `.fwd` Frew model to json using Frew through COM. COM is
+    initialised for the calling thread, so the backend can be used from
+    several threads at once.
+
+    Parameters
+    ----------
+    file_path : str
+        Absolute file path to the '.fwd' Frew model.
+    json_path : str
+        Absolute file path to save the json file at.
+
+    """
+    CoInitialize()
+    try:
+        model_to_json(file_path, json_path)
+    finally:
+        CoUninitialize()
+
+
+class BatchConverter:
+    """ A class used to convert batches of `.fwd` Frew models to `.json`
+    models saved alongside them.
+
+    Each model is converted to a temporary file which replaces the json file
+    only once the conversion has succeeded, and the `.fwd` models are never
+    changed.
+
+    ...
+
+    Attributes
+    ----------
+    backend : Callable[[str, str], None]
+        Called with the file path of a `.fwd` model and the json file path to
+        save it at. Defaults to `com_backend`, and can be replaced with any
+        function, for example to test without Frew. It is called from several
+        threads at once when using more than 1 worker.
+    workers : int
+        The number of models converted at once, defaults to 1.
+    manifest_path : str
+        A json file recording the hash of each converted model, optional. A
+        model whose json file is older than itself is not converted again if
+        its hash is unchanged, e.g. after copying a folder of models.
+    extension : str
+        The extension of the json models, one of `utils.JSON_EXTENSIONS`.
+        Defaults to '.json', and '.json.gz' or '.json.zst' compress each
+        model as it is converted.
+
+    """
+
+    def __init__(
+        self,
+        backend: Callable[[str, str], None] = com_backend,
+        workers: int = 1,
+        manifest_path: str = None,
+        extension: str = ".json",
+    ) -> None:
+        if extension not in JSON_EXTENSIONS:
+            raise FrewError(
+                f"The extension must be one of {', '.join(JSON_EXTENSIONS)}."
+            )
+        self.backend: Callable[[str, str], None] = backend
+        self.workers: int = max(workers, 1)
+        self.manifest_path: Union[str, None] = manifest_path
+        self.extension: str = extension
+        self._manifest: Dict[str, str] = {}
+        if manifest_path is not None and os.path.exists(manifest_path):
+            with open(manifest_path) as file:
+                self._manifest = json.loads(file.read())
+        self._lock = threading.Lock()
+
+    def convert(
+        self,
+        file_paths: Iterable[str],
+        incremental: bool = True,
+        callback: Callable[[str, Union[str, None]], None] = None,
+    ) -> Dict[str, Union[int, float, Dict[str, str]]]:
+        """ Method to convert `.fwd` Frew models to json.
+
+        Parameters
+        ----------
+        file_paths : Iterable[str]
+            The file paths to the '.fwd' Frew models.
+        incremental : bool, optional
+            Whether to skip models whose json file is up to date, defaults to
+            True.
+        callback : Callable[[str, Union[str, None]], None], optional
+            Called with the file path and error message, or None, of each
+            model as it is converted.
+
+        Returns
+        -------
+        summary : Dict[str, Union[int, float, Dict[str, str]]]
+            The number of models 'converted' and 'skipped', the error message
+            of each model which 'failed', and the total 'seconds' and 'files
+            per second' of the conversion.
+
+        """
+        start: float = time.perf_counter()
+        pending: List[str] = []
+        skipped: int = 0
+        for file_path in file_paths:
+            file_path = os.path.abspath(file_path)
+            if incremental and self._is_up_to_date(file_path):
+                skipped += 1
+            else:
+                pending.append(file_path)
+
+        failed: Dict[str, str] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for file_path, error in zip(
+                    pending, executor.map(self._convert_model, pending)
+                ):
+                    if error is not None:
+                        failed[file_path] = error
+                    if callback is not None:
+                        callback(file_path, error)
+        finally:
+            self._save_manifest()
+
+        seconds: float = time.perf_counter() - start
+        converted: int = len(pending) - len(failed)
+        return {
+            "converted": converted,
+            "skipped": skipped,
+            "failed": failed,
+            "seconds": seconds,
+            "files per second": converted / seconds if seconds else 0.0,
+        }
+
+    def _is_up_to_date(self, file_path: str) -> bool:
+        json_path: str = self._get_json_path(file_path)
+        if not os.path.exists(json_path):
+            return False
+        if os.path.getmtime(json_path) >= os.path.getmtime(file_path):
+            return True
+        return file_path in self._manifest and (
+            self._manifest[file_path] == get_file_hash(file_path)
+        )
+
+    def _convert_model(self, file_path: str) -> Union[str, None]:
+        json_path: str = self._get_json_path(file_path)
+        temp_stem: str = f"{strip_json_extension(json_path)}.{uuid4().hex[:8]}"
+        # Frew saves plain json, which is then compressed if required.
+        temp_path: str = f"{temp_stem}.tmp.json"
+        compressed_path: str = f"{temp_stem}.tmp{self.extension}"
+        try:
+            if not file_path.lower().endswith(".fwd"):
+                raise FrewError("Path must be to a valid Frew model.")
+            self.backend(file_path, temp_path)
+            if compressed_path != temp_path:
+                copy_model(temp_path, compressed_path)
+                os.remove(temp_path)
+            os.replace(compressed_path, json_path)
+            if self.manifest_path is not None:
+                file_hash: str = get_file_hash(file_path)
+                with self._lock:
+                    self._manifest[file_path] = file_hash
+        # A failed model must not stop the rest of the batch, whatever the
+        # backend raised.
+        except Exception as error:
+            for path in {temp_path, compressed_path}:
+                if os.path.exists(path):
+                    os.remove(path)
+            return " ".join(str(error).split()) or type(error).__name__
+        return None
+
+    def _save_manifest(self) -> None:
+        if self.manifest_path is None:
+            return
+        temp_path: str = f"{self.manifest_path}.tmp"
+        with open(temp_path, "w") as file:
+            file.write(json.dumps(self._manifest, indent=2))
+        os.replace(temp_path, self.manifest_path)
+
+    def _get_json_path(self, file_path: str) -> str:
+        return f"{os.path.splitext(file_path)[0]}{self.extension}"
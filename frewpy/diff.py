@@ -0,0 +1,191 @@
+"""
+Diff
+====
+
+This module holds the `diff` function which compares two Frew models, both
+their inputs and their results, to report what has changed between them.
+
+"""
+
+from typing import Dict, List, Tuple, Union
+
+import numpy as np  # type: ignore
+
+from frewpy.frew_model import FrewModel
+from frewpy.utils import (
+    get_all_results,
+    get_design_case_names,
+    get_num_stages,
+    get_num_nodes,
+)
+from frewpy.models.exceptions import NodeError
+
+
+# Input sections compared between models, with the key used to match their
+# records by name. Records of sections without a key are matched by index.
+INPUT_SECTIONS: Dict[str, Union[str, None]] = {
+    "Units": None,
+    "Materials": "Name",
+    "Struts": None,
+    "Loads": None,
+    "Stages": None,
+    "Partial Factor Sets": "Name",
+    "Node Generation": None,
+    "Integral Bridge Data": None,
+}
+
+
+def diff(
+    model_a: FrewModel,
+    model_b: FrewModel,
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+) -> Dict[str, Union[List[str], Dict[str, dict]]]:
+    """ Compares the inputs and results of two Frew models.
+
+    Parameters
+    ----------
+    model_a : FrewModel
+        The original model.
+    model_b : FrewModel
+        The revised model.
+    rtol : float, optional
+        The relative tolerance on results, as a fraction of `model_a`'s
+        result.
+    atol : float, optional
+        The absolute tolerance on results in frewpy units.
+
+    Returns
+    -------
+    model_diff : Dict[str, Union[List[str], Dict[str, dict]]]
+        'changed' holds the paths of the inputs which differ, e.g.
+        'Materials/Made Ground/Phi' or 'Stages/3/Name'. 'max deltas' holds,
+        for each result field and design case in both models, an array of the
+        maximum absolute change per stage. 'exceeded' holds the
+        'field/stage/design case' of results which changed by more than the
+        tolerances.
+
+    """
+    changed: List[str] = []
+    for section, name_key in INPUT_SECTIONS.items():
+        _diff_section(
+            model_a.json_data.get(section),
+            model_b.json_data.get(section),
+            section,
+            name_key,
+            changed,
+        )
+    max_deltas, exceeded = _diff_results(model_a, model_b, rtol, atol, changed)
+    return {"changed": changed, "max deltas": max_deltas, "exceeded": exceeded}
+
+
+def _diff_section(
+    section_a, section_b, path: str, name_key, changed: List[str]
+) -> None:
+    if section_a == section_b:
+        return
+    if (
+        name_key
+        and isinstance(section_a, list)
+        and isinstance(section_b, list)
+    ):
+        records_a = {record.get(name_key): record for record in section_a}
+        records_b = {record.get(name_key): record for record in section_b}
+        for name in [
+            *records_a,
+            *[n for n in records_b if n not in records_a],
+        ]:
+            _diff_value(
+                records_a.get(name),
+                records_b.get(name),
+                f"{path}/{name}",
+                changed,
+            )
+        return
+    _diff_value(section_a, section_b, path, changed)
+
+
+def _diff_value(value_a, value_b, path: str, changed: List[str]) -> None:
+    if value_a == value_b:
+        return
+    if isinstance(value_a, dict) and isinstance(value_b, dict):
+        for key in [*value_a, *[k for k in value_b if k not in value_a]]:
+            _diff_value(
+                value_a.get(key), value_b.get(key), f"{path}/{key}", changed
+            )
+    elif (
+        isinstance(value_a, list)
+        and isinstance(value_b, list)
+        and len(value_a) == len(value_b)
+    ):
+        for index, (item_a, item_b) in enumerate(zip(value_a, value_b)):
+            _diff_value(item_a, item_b, f"{path}/{index}", changed)
+    else:
+        changed.append(path)
+
+
+def _diff_results(
+    model_a: FrewModel,
+    model_b: FrewModel,
+    rtol: float,
+    atol: float,
+    changed: List[str],
+) -> Tuple[Dict[str, dict], List[str]]:
+    has_results = [
+        bool(model.json_data.get("Frew Results"))
+        for model in [model_a, model_b]
+    ]
+    if not any(has_results):
+        return {}, []
+    try:
+        comparable = all(has_results) and (
+            get_num_stages(model_a.json_data),
+            get_num_nodes(model_a.json_data),
+            len(model_a.json_data.get("Struts", [])),
+        ) == (
+            get_num_stages(model_b.json_data),
+            get_num_nodes(model_b.json_data),
+            len(model_b.json_data.get("Struts", [])),
+        )
+    except NodeError:
+        comparable = False
+    if not comparable:
+        changed.append("Frew Results")
+        return {}, []
+
+    cases_a: List[str] = get_design_case_names(model_a.json_data)
+    cases_b: List[str] = get_design_case_names(model_b.json_data)
+    common_cases: List[str] = [case for case in cases_a if case in cases_b]
+    changed.extend(
+        f"Frew Results/{case}"
+        for case in [*cases_a, *cases_b]
+        if case not in common_cases
+    )
+    index_a = [cases_a.index(case) for case in common_cases]
+    index_b = [cases_b.index(case) for case in common_cases]
+    results_a = get_all_results(model_a.json_data)
+    results_b = get_all_results(model_b.json_data)
+
+    max_deltas: Dict[str, dict] = {}
+    exceeded: List[str] = []
+    for field in results_a:
+        values_a = results_a[field][:, index_a]
+        values_b = results_b[field][:, index_b]
+        deltas = np.abs(values_b - values_a)
+        # The NaN forces of struts which are not installed are skipped.
+        field_max = np.fmax.reduce(deltas, axis=2, initial=0.0)
+        # A result which becomes NaN, or stops being NaN, has changed.
+        field_exceeded = np.any(
+            (deltas > atol + rtol * np.abs(values_a))
+            | (np.isnan(values_a) != np.isnan(values_b)),
+            axis=2,
+        )
+        max_deltas[field] = {
+            case: field_max[:, index]
+            for index, case in enumerate(common_cases)
+        }
+        exceeded.extend(
+            f"{field}/{stage}/{common_cases[case]}"
+            for stage, case in zip(*np.nonzero(field_exceeded))
+        )
+    return max_deltas, exceeded
@@ -9,16 +9,34 @@ to make it easier for the user to interact with the frewpy library.
 """
 
 import os
+import copy
 import json
-from typing import Dict, List, Union
+import pickle
+from collections import OrderedDict
+from itertools import zip_longest
+from typing import Any, Dict, List, Tuple, Union
 from uuid import uuid4
 
 from comtypes.client import CreateObject  # type: ignore
 from _ctypes import COMError  # type: ignore
 
-from frewpy.models import Wall, Soil, Water, Calculation, Strut
+from frewpy.models import (
+    Wall,
+    Soil,
+    Water,
+    Calculation,
+    Strut,
+    Results,
+    ChangeTracker,
+)
+from frewpy.stream import splice_members
+from frewpy.interner import Interner
 from frewpy.utils import (
     check_json_path,
+    check_result_dtype,
+    get_json_extension,
+    strip_json_extension,
+    open_model,
     load_data,
     get_titles,
     get_file_history,
@@ -27,14 +45,47 @@ from frewpy.utils import (
     get_num_stages,
     get_stage_names,
     get_num_nodes,
+    get_file_hash,
 )
 from frewpy.models.exceptions import FrewError
 
 
+# The sections which are not used to analyse the model.
+_UNANALYSED_SECTIONS: Tuple[str, ...] = (
+    "OasysHeader",
+    "JsonSchema",
+    "File history",
+    "Version",
+    "Frew Results",
+)
+
+# The sections whose records are added and removed at given stages, with the
+# keys holding those stages.
+_STAGED_SECTIONS: Dict[str, Tuple[str, ...]] = {
+    "Struts": ("StageIn", "StageOut"),
+    "Loads": ("Stage",),
+}
+
+
 class FrewModel:
     """ A class used to establish a connection to any Frew model and to
     manipulate it using the core methods or a child class's methods.
 
+    Models kept loaded in large numbers can share their keys and repeated
+    values by being loaded with the same `frewpy.interner.Interner`, and
+    can keep their result arrays with a `result_dtype` of 'float32' to halve
+    their memory, see `utils.get_float32_error`.
+
+    Models are cheap to send to other processes, e.g. through a
+    `ProcessPoolExecutor`. A model which is unmodified and whose file is
+    unchanged is pickled as its file path and hash with its calculated
+    result arrays, and is loaded from the file by the process receiving it.
+    Each process keeps the parsed data of the models it receives this way,
+    pickled, and only hashes a file again when its modification time or
+    size changes, so a model sent many times is only parsed once. Each model
+    received unpickles its own copy of the data. Other models are pickled
+    with their data, without their interner.
+
     ...
 
     Attributes
@@ -54,19 +105,92 @@ class FrewModel:
         All calculation methods based on Frew results.
     strut : class
         All strut related methods associated with a Frew model.
+    results : class
+        Selective queries of the results of a Frew model.
+    changes : ChangeTracker
+        The sections and records of the model modified through frewpy since
+        it was loaded or last saved, and the first stage they affect. See
+        `get_first_modified_stage` for the first stage whose results are out
+        of date.
 
     """
 
-    def __init__(self, file_path: str) -> None:
+    def __init__(
+        self,
+        file_path: str,
+        interner: Interner = None,
+        result_dtype: str = "float64",
+    ) -> None:
         check_json_path(file_path)
+        check_result_dtype(result_dtype)
 
         self.file_path: str = file_path
-        self.json_data: Dict[str, list] = load_data(self.file_path)
-        self.wall = Wall(self.json_data)
-        self.soil = Soil(self.json_data)
-        self.water = Water(self.json_data)
+        self._source_stat: Tuple[int, int] = _get_stat(file_path)
+        self._interner: Union[Interner, None] = interner
+        self.json_data: Dict[str, list] = load_data(self.file_path, interner)
+        self._source_keys: Tuple[str, ...] = tuple(self.json_data.keys())
+        self._source_hash: Union[str, None] = None
+        self.changes = ChangeTracker()
+        self._analysed_records: Dict[str, list] = _copy_staged_records(
+            self.json_data
+        )
+        self._create_children(result_dtype)
+
+    def __reduce__(self) -> tuple:
+        if (
+            self.changes.is_modified()
+            or self.get_first_modified_stage() is not None
+            or not self._can_splice()
+        ):
+            return self._reduce_data()
+        # The file is as it was when loaded, so its hash is only found once.
+        if self._source_hash is None:
+            self._source_hash = get_file_hash(self.file_path)
+        return (
+            _load_model,
+            (
+                os.path.abspath(self.file_path),
+                self._source_hash,
+                self.wall.result_dtype,
+                self.wall._get_cached_arrays(),
+            ),
+        )
+
+    def __copy__(self) -> "FrewModel":
+        # Copies are never taken from the cache of models sent by path.
+        function, args = self._reduce_data()
+        return function(*args)
+
+    def __deepcopy__(self, memo: dict) -> "FrewModel":
+        function, args = self._reduce_data()
+        return function(*copy.deepcopy(args, memo))
+
+    def _create_children(self, result_dtype: str) -> None:
+        self.wall = Wall(self.json_data, result_dtype)
+        self.soil = Soil(self.json_data, self.changes)
+        self.water = Water(self.json_data, result_dtype)
         self.calculation = Calculation(self.json_data)
-        self.strut = Strut(self.json_data)
+        self.strut = Strut(self.json_data, result_dtype)
+        self.results = Results(self.json_data, result_dtype)
+
+    def _reduce_data(self) -> tuple:
+        state: Dict[str, Any] = {
+            "file_path": self.file_path,
+            "_source_stat": self._source_stat,
+            "_source_keys": self._source_keys,
+            "_source_hash": self._source_hash,
+            "changes": self.changes,
+            "_analysed_records": self._analysed_records,
+        }
+        return (
+            _restore_model,
+            (
+                self.json_data,
+                self.wall.result_dtype,
+                self.wall._get_cached_arrays(),
+                state,
+            ),
+        )
 
     def get(self, request: str) -> Union[dict, str, int, list]:
         """ Method to get information about the model.
@@ -114,7 +238,8 @@ class FrewModel:
         num_stages: int = get_num_stages(self.json_data)
         folder_path: str = os.path.dirname(self.file_path)
         temp_file_path: str = os.path.join(folder_path, f"{uuid4()}.json")
-        self.save(temp_file_path)
+        # Saved in full, so Frew analyses edits which were not recorded.
+        self.save(temp_file_path, incremental=False)
         try:
             model = CreateObject("frewLib.FrewComAuto")
         except OSError:
@@ -129,46 +254,159 @@ class FrewModel:
         model.Analyse(num_stages)
         model.SaveAs(temp_file_path)
         model.Close()
-        new_data: Dict[str, list] = load_data(temp_file_path)
+        new_data: Dict[str, list] = load_data(temp_file_path, self._interner)
         os.remove(temp_file_path)
         self._clear_json_data()
         self._refill_json_data(new_data)
+        self.changes.mark_all()
+        self.changes.mark_analysed()
+        self._analysed_records = _copy_staged_records(self.json_data)
+
+    def mark_modified(self, section: str, record: int = None) -> None:
+        """ Records that a section of the model has been modified. Methods of
+        frewpy which modify the model do this themselves, but changes made
+        directly to `json_data` must be recorded to be saved, and for the
+        stages they affect to be known.
+
+        A modified stage affects its own results and those of the stages
+        after it. Modified struts and loads are found by comparing them with
+        the struts and loads the model was last analysed with, and affect
+        the results from the stage they are added or removed at, whichever
+        changed. Other sections used in the analysis affect every stage.
 
-    def save(self, save_path: str = None) -> None:
+        Parameters
+        ----------
+        section : str
+            The top level key of the section, e.g. 'Materials'.
+        record : int, optional
+            The index of the record modified within the section, defaults to
+            the whole section.
+
+        Raises
+        ------
+        FrewError
+            If the section is not in the model.
+
+        """
+        if section not in self.json_data:
+            raise FrewError(f"No section called {section} in the model.")
+        stage: Union[int, None] = 0
+        if section in _UNANALYSED_SECTIONS or section in _STAGED_SECTIONS:
+            stage = None
+        elif section == "Stages" and record is not None:
+            stage = record
+        self.changes.mark(section, record, stage)
+
+    def get_first_modified_stage(self) -> Union[int, None]:
+        """ Gets the first stage whose results are out of date, because the
+        model has been modified since it was loaded or last analysed. The
+        stages before it do not need to be analysed again.
+
+        Returns
+        -------
+        first_stage : Union[int, None]
+            The index of the first stage affected by the modifications, or
+            None if the results of every stage are up to date.
+
+        """
+        stages: List[int] = [
+            stage
+            for stage in [
+                self.changes.get_first_stage(),
+                *(
+                    _get_first_changed_stage(
+                        section,
+                        self._analysed_records[section],
+                        self.json_data.get(section, []),
+                    )
+                    for section in _STAGED_SECTIONS
+                ),
+            ]
+            if stage is not None
+        ]
+        return min(stages) if stages else None
+
+    def save(self, save_path: str = None, incremental: bool = False) -> None:
         """ Saves the current json Frew model to the original file or to a new
         path if provided to the method.
 
+        The model is written to a temporary file which then replaces the
+        saved file, so an interrupted save never leaves a partial model.
+        With `incremental`, and unless the original file has changed on disk
+        since it was loaded, only the sections recorded in `changes` are
+        serialised again, and the bytes of the other sections are copied
+        from the original file.
+
         Parameters
         ----------
         save_path : str, optional
-            The path including file name (.json) for the data to be saved to.
-            If this is not provided, the model at the original file path will
-            be overwritten.
+            The path including file name (.json) for the data to be saved to,
+            which is compressed if it ends with '.json.gz' or '.json.zst'. If
+            this is not provided, the model at the original file path will be
+            overwritten.
+        incremental : bool, optional
+            Whether to copy the unmodified sections from the original file,
+            defaults to False. Only use True if every change to `json_data`
+            has been recorded, by the frewpy methods or `mark_modified`, as
+            unrecorded changes are not saved.
 
         """
         if save_path:
-            if isinstance(save_path, str) and save_path.lower().endswith(
-                ".json"
+            if not (
+                isinstance(save_path, str)
+                and get_json_extension(save_path) is not None
             ):
-                try:
-                    with open(save_path, "w") as file:
-                        file.write(json.dumps(self.json_data))
-                except FileNotFoundError:
-                    raise FileNotFoundError(
-                        """
-                        Unable to save the model. File path is invalid.
-                    """
-                    )
-            else:
                 raise FrewError(
                     """
                     Unable to save the model. File path must be a valid string
-                    and end with ".json".
+                    and end with ".json", ".json.gz" or ".json.zst".
                 """
                 )
         else:
-            with open(self.file_path, "w") as file:
-                file.write(json.dumps(self.json_data))
+            save_path = self.file_path
+        temp_path: str = (
+            f"{strip_json_extension(save_path)}.{uuid4().hex[:8]}.tmp"
+            f"{get_json_extension(save_path)}"
+        )
+        try:
+            with open_model(temp_path, "wb") as file:
+                if incremental and self._can_splice():
+                    splice_members(
+                        self.file_path,
+                        file,
+                        {
+                            section: json.dumps(section_data).encode()
+                            for section, section_data in self.json_data.items()
+                            if self.changes.is_modified(section)
+                        },
+                    )
+                else:
+                    file.write(json.dumps(self.json_data).encode())
+            os.replace(temp_path, save_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                """
+                Unable to save the model. File path is invalid.
+            """
+            )
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        if os.path.abspath(save_path) == os.path.abspath(self.file_path):
+            self._source_stat = _get_stat(self.file_path)
+            self._source_keys = tuple(self.json_data.keys())
+            self._source_hash = None
+            self.changes.clear()
+
+    def _can_splice(self) -> bool:
+        if self.changes.is_all_modified():
+            return False
+        if tuple(self.json_data.keys()) != self._source_keys:
+            return False
+        try:
+            return _get_stat(self.file_path) == self._source_stat
+        except FileNotFoundError:
+            return False
 
     def _clear_json_data(self):
         keys: List[str] = list(self.json_data.keys())
@@ -178,3 +416,138 @@ class FrewModel:
     def _refill_json_data(self, new_data):
         for key in new_data.keys():
             self.json_data[key] = new_data[key]
+
+
+def _copy_staged_records(json_data: Dict[str, list]) -> Dict[str, list]:
+    return {
+        section: copy.deepcopy(json_data.get(section, []))
+        for section in _STAGED_SECTIONS
+    }
+
+
+def _get_first_changed_stage(
+    section: str, old_records: List[dict], new_records: List[dict]
+) -> Union[int, None]:
+    first_stage: Union[int, None] = None
+    for old_record, new_record in zip_longest(old_records, new_records):
+        if old_record == new_record:
+            continue
+        stage: int = _get_changed_stage(section, old_record, new_record)
+        if first_stage is None or stage < first_stage:
+            first_stage = stage
+    return first_stage
+
+
+def _get_changed_stage(
+    section: str, old_record: Union[dict, None], new_record: Union[dict, None]
+) -> int:
+    # Added and removed records affect the results from when they are added.
+    if old_record is None or new_record is None:
+        record: Union[dict, None] = (
+            new_record if old_record is None else old_record
+        )
+        # zip_longest only pads the shorter list, so one record is given.
+        if record is None:
+            return 0
+        return max(_get_stage_range(section, record)[0], 0)
+    old_in, old_out = _get_stage_range(section, old_record)
+    new_in, new_out = _get_stage_range(section, new_record)
+    stage_keys: Tuple[str, ...] = _STAGED_SECTIONS[section]
+    if old_in != new_in or any(
+        old_record.get(key) != new_record.get(key)
+        for key in set(old_record) | set(new_record)
+        if key not in stage_keys
+    ):
+        return max(min(old_in, new_in), 0)
+    # Only the stage the record is removed at has changed, where -1 is never.
+    # A change to the rest of a load's stage affects it from when it is added.
+    out_stages: List[int] = [
+        stage for stage in (old_out, new_out) if stage >= 0
+    ]
+    if not out_stages:
+        return max(min(old_in, new_in), 0)
+    return min(out_stages)
+
+
+def _get_stage_range(section: str, record: dict) -> Tuple[int, int]:
+    if section == "Struts":
+        return record["StageIn"], record["StageOut"]
+    return record["Stage"]["In"], record["Stage"]["Out"]
+
+
+def _get_stat(file_path: str) -> Tuple[int, int]:
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+# The models received by path in this process, holding the stat and hash of
+# each file with its parsed data pickled. The least recently received are
+# dropped once the pickled data is over the budget, keeping the last one.
+_received_models: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_RECEIVED_MAX_BYTES: int = 512 * 1024 ** 2
+
+
+def _load_model(
+    file_path: str, file_hash: str, result_dtype: str, result_arrays: dict
+) -> FrewModel:
+    changed_error = FrewError(
+        f"The model at {file_path} has changed since it was sent."
+    )
+    try:
+        file_stat: Tuple[int, int] = _get_stat(file_path)
+    except FileNotFoundError:
+        raise changed_error
+    entry: Union[Dict[str, Any], None] = _received_models.get(file_path)
+    # The file is only hashed again when its time or size changes.
+    if entry is None or entry["stat"] != file_stat:
+        entry = {
+            "stat": file_stat,
+            "hash": get_file_hash(file_path),
+            "data": None,
+        }
+        _received_models[file_path] = entry
+    if entry["hash"] != file_hash:
+        raise changed_error
+    if entry["data"] is None:
+        json_data: Dict[str, list] = load_data(file_path)
+        entry["data"] = pickle.dumps(json_data, pickle.HIGHEST_PROTOCOL)
+        # The parsed data is not handed out, so its staged sections are kept
+        # as the analysed records without copying them.
+        entry["analysed records"] = {
+            section: json_data.get(section, []) for section in _STAGED_SECTIONS
+        }
+    _received_models.move_to_end(file_path)
+    total: int = sum(
+        len(received["data"] or b"") for received in _received_models.values()
+    )
+    while total > _RECEIVED_MAX_BYTES and len(_received_models) > 1:
+        _, received = _received_models.popitem(last=False)
+        total -= len(received["data"] or b"")
+
+    # Each model received unpickles its own copy of the data, which is much
+    # quicker than parsing the file or deep copying a parsed model.
+    json_data = pickle.loads(entry["data"])
+    state: Dict[str, Any] = {
+        "file_path": file_path,
+        "_source_stat": file_stat,
+        "_source_keys": tuple(json_data.keys()),
+        "_source_hash": file_hash,
+        "changes": ChangeTracker(),
+        "_analysed_records": entry["analysed records"],
+    }
+    return _restore_model(json_data, result_dtype, result_arrays, state)
+
+
+def _restore_model(
+    json_data: Dict[str, list],
+    result_dtype: str,
+    result_arrays: dict,
+    state: Dict[str, Any],
+) -> FrewModel:
+    model: FrewModel = FrewModel.__new__(FrewModel)
+    model.__dict__.update(state)
+    model._interner = None
+    model.json_data = json_data
+    model._create_children(result_dtype)
+    model.wall._add_result_arrays(result_arrays)
+    return model
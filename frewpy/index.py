@@ -0,0 +1,399 @@
+"""
+Index
+=====
+
+This module holds the class `ModelIndex` which stores the metadata of many
+Frew models in a local SQLite database. Searching the index avoids opening
+every model to find the ones of interest.
+
+"""
+
+import os
+import json
+import sqlite3
+from typing import Dict, List, Iterable, Tuple, Union
+
+from frewpy.utils import (
+    MODEL_READ_ERRORS,
+    load_data,
+    get_file_hash,
+    get_json_extension,
+    get_titles,
+    get_file_history,
+    get_file_version,
+    get_frew_version,
+    get_stage_names,
+    get_num_nodes,
+)
+from frewpy.models.exceptions import FrewError, NodeError
+
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS models (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    job_number TEXT,
+    job_title TEXT,
+    titles TEXT,
+    file_version TEXT,
+    frew_version TEXT,
+    num_nodes INTEGER,
+    num_stages INTEGER,
+    num_design_cases INTEGER
+);
+CREATE TABLE IF NOT EXISTS stages (
+    path TEXT NOT NULL,
+    stage INTEGER NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS materials (
+    path TEXT NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS history (
+    path TEXT NOT NULL,
+    date TEXT,
+    time TEXT,
+    mode TEXT,
+    user TEXT,
+    comments TEXT
+);
+CREATE INDEX IF NOT EXISTS stages_name ON stages (TRIM(name));
+CREATE INDEX IF NOT EXISTS stages_path ON stages (path);
+CREATE INDEX IF NOT EXISTS materials_name ON materials (TRIM(name));
+CREATE INDEX IF NOT EXISTS materials_path ON materials (path);
+CREATE INDEX IF NOT EXISTS history_path ON history (path);
+CREATE INDEX IF NOT EXISTS models_job_number ON models (job_number);
+"""
+
+
+class ModelIndex:
+    """ A class used to index the metadata of Frew models in a local SQLite
+    database and to search it.
+
+    ...
+
+    Attributes
+    ----------
+    db_path : str
+        The file path to the SQLite database, created if it does not exist.
+
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path: str = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "ModelIndex":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """ Method to close the connection to the database.
+
+        """
+        self.connection.close()
+
+    def update(
+        self, folders: Union[str, Iterable[str]], recursive: bool = True
+    ) -> Dict[str, int]:
+        """ Method to scan folders for json Frew models and bring the index
+        up to date. Only files which have changed since they were last
+        indexed are read, and models which no longer exist are removed.
+
+        Parameters
+        ----------
+        folders : Union[str, Iterable[str]]
+            The folder or folders to scan.
+        recursive : bool, optional
+            Whether to scan subfolders as well, defaults to True.
+
+        Returns
+        -------
+        summary : Dict[str, int]
+            The number of models which were 'added', 'updated', 'unchanged',
+            'removed' or 'failed' to be read.
+
+        """
+        if isinstance(folders, str):
+            folders = [folders]
+        summary: Dict[str, int] = {
+            "added": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "removed": 0,
+            "failed": 0,
+        }
+        for folder in folders:
+            if not os.path.isdir(folder):
+                raise FrewError(f"Folder {folder} does not exist.")
+            folder = os.path.abspath(folder)
+            found: List[str] = []
+            for file_path in self._scan(folder, recursive):
+                found.append(file_path)
+                summary[self._update_model(file_path)] += 1
+            summary["removed"] += self._remove_missing(
+                folder, recursive, set(found)
+            )
+        self.connection.commit()
+        return summary
+
+    def find(
+        self,
+        job_number: str = None,
+        job_title: str = None,
+        frew_version: str = None,
+        stage_name: str = None,
+        material: str = None,
+        user: str = None,
+    ) -> List[str]:
+        """ Method to find the models in the index matching all of the given
+        criteria. Text is compared ignoring surrounding whitespace.
+
+        Parameters
+        ----------
+        job_number : str, optional
+            The job number in the model titles.
+        job_title : str, optional
+            The job title in the model titles.
+        frew_version : str, optional
+            The Frew version of the model, e.g. '19.4'.
+        stage_name : str, optional
+            The name of a stage within the model.
+        material : str, optional
+            The name of a material within the model.
+        user : str, optional
+            A user in the file history of the model.
+
+        Returns
+        -------
+        paths : List[str]
+            The file paths of the matching models.
+
+        """
+        conditions: List[str] = []
+        values: List[str] = []
+        for column, value in [
+            ("job_number", job_number),
+            ("job_title", job_title),
+            ("frew_version", frew_version),
+        ]:
+            if value is not None:
+                conditions.append(f"TRIM({column}) = TRIM(?)")
+                values.append(value)
+        for table, column, value in [
+            ("stages", "name", stage_name),
+            ("materials", "name", material),
+            ("history", "user", user),
+        ]:
+            if value is not None:
+                conditions.append(
+                    f"path IN (SELECT path FROM {table} "
+                    f"WHERE TRIM({column}) = TRIM(?))"
+                )
+                values.append(value)
+        query: str = "SELECT path FROM models"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        return [
+            row[0]
+            for row in self.connection.execute(
+                query + " ORDER BY path", values
+            )
+        ]
+
+    def get(self, file_path: str) -> Dict[str, Union[str, int, list, dict]]:
+        """ Method to get the indexed metadata of a single model.
+
+        Parameters
+        ----------
+        file_path : str
+            The file path to the model.
+
+        Returns
+        -------
+        metadata : Dict[str, Union[str, int, list, dict]]
+            The titles, file history, file version, frew version, stage
+            names, material names and number of nodes, stages and design
+            cases of the model.
+
+        Raises
+        ------
+        FrewError
+            If the model is not in the index.
+
+        """
+        file_path = os.path.abspath(file_path)
+        row = self.connection.execute(
+            """
+            SELECT titles, file_version, frew_version, num_nodes,
+                num_stages, num_design_cases
+            FROM models WHERE path = ?
+            """,
+            (file_path,),
+        ).fetchone()
+        if row is None:
+            raise FrewError(f"{file_path} is not in the index.")
+        return {
+            "titles": json.loads(row[0]),
+            "file history": [
+                dict(zip(["Date", "Time", "Mode", "User", "Comments"], item))
+                for item in self.connection.execute(
+                    """
+                    SELECT date, time, mode, user, comments
+                    FROM history WHERE path = ? ORDER BY rowid
+                    """,
+                    (file_path,),
+                )
+            ],
+            "file version": row[1],
+            "frew version": row[2],
+            "stage names": [
+                item[0]
+                for item in self.connection.execute(
+                    "SELECT name FROM stages WHERE path = ? ORDER BY stage",
+                    (file_path,),
+                )
+            ],
+            "materials": [
+                item[0]
+                for item in self.connection.execute(
+                    "SELECT name FROM materials WHERE path = ? ORDER BY rowid",
+                    (file_path,),
+                )
+            ],
+            "num nodes": row[3],
+            "num stages": row[4],
+            "num design cases": row[5],
+        }
+
+    def _scan(self, folder: str, recursive: bool) -> Iterable[str]:
+        if recursive:
+            for root, _, files in os.walk(folder):
+                for file in files:
+                    if get_json_extension(file) is not None:
+                        yield os.path.join(root, file)
+        else:
+            for file in os.listdir(folder):
+                file_path = os.path.join(folder, file)
+                if get_json_extension(file) is not None and os.path.isfile(
+                    file_path
+                ):
+                    yield file_path
+
+    def _update_model(self, file_path: str) -> str:
+        stat = os.stat(file_path)
+        row = self.connection.execute(
+            "SELECT mtime, size, hash FROM models WHERE path = ?",
+            (file_path,),
+        ).fetchone()
+        if row is not None and row[:2] == (stat.st_mtime, stat.st_size):
+            return "unchanged"
+        file_hash: str = get_file_hash(file_path)
+        if row is not None and row[2] == file_hash:
+            self.connection.execute(
+                "UPDATE models SET mtime = ?, size = ? WHERE path = ?",
+                (stat.st_mtime, stat.st_size, file_path),
+            )
+            return "unchanged"
+        # The row of a model which no longer reads is removed, so its old
+        # contents are not found.
+        self._delete(file_path)
+        try:
+            metadata = self._read_metadata(file_path)
+        except MODEL_READ_ERRORS:
+            return "failed"
+        self._insert(
+            file_path, (stat.st_mtime, stat.st_size, file_hash), metadata
+        )
+        return "added" if row is None else "updated"
+
+    def _read_metadata(self, file_path: str) -> dict:
+        json_data: Dict[str, list] = load_data(file_path)
+        try:
+            num_nodes: Union[int, None] = int(get_num_nodes(json_data))
+        except NodeError:
+            num_nodes = None
+        stage_names: List[str] = get_stage_names(json_data)
+        return {
+            "titles": get_titles(json_data),
+            "file history": get_file_history(json_data),
+            "file version": get_file_version(json_data),
+            "frew version": get_frew_version(json_data),
+            "stage names": stage_names,
+            "materials": [
+                material["Name"] for material in json_data.get("Materials", [])
+            ],
+            "num nodes": num_nodes,
+            "num stages": len(stage_names),
+            "num design cases": len(json_data.get("Frew Results", [])),
+        }
+
+    def _insert(
+        self, file_path: str, file_info: Tuple[float, int, str], metadata: dict
+    ) -> None:
+        titles: Dict[str, str] = metadata["titles"]
+        self.connection.execute(
+            "INSERT INTO models VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                file_path,
+                *file_info,
+                titles.get("JobNumber"),
+                titles.get("JobTitle"),
+                json.dumps(titles),
+                metadata["file version"],
+                metadata["frew version"],
+                metadata["num nodes"],
+                metadata["num stages"],
+                metadata["num design cases"],
+            ),
+        )
+        self.connection.executemany(
+            "INSERT INTO stages VALUES (?, ?, ?)",
+            [
+                (file_path, stage, name)
+                for stage, name in enumerate(metadata["stage names"])
+            ],
+        )
+        self.connection.executemany(
+            "INSERT INTO materials VALUES (?, ?)",
+            [(file_path, name) for name in metadata["materials"]],
+        )
+        self.connection.executemany(
+            "INSERT INTO history VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    file_path,
+                    item.get("Date"),
+                    item.get("Time"),
+                    item.get("Mode"),
+                    item.get("User"),
+                    item.get("Comments"),
+                )
+                for item in metadata["file history"]
+            ],
+        )
+
+    def _delete(self, file_path: str) -> None:
+        for table in ["models", "stages", "materials", "history"]:
+            self.connection.execute(
+                f"DELETE FROM {table} WHERE path = ?", (file_path,)
+            )
+
+    def _remove_missing(self, folder: str, recursive: bool, found: set) -> int:
+        prefix: str = os.path.join(folder, "")
+        removed: int = 0
+        for (file_path,) in self.connection.execute(
+            "SELECT path FROM models WHERE substr(path, 1, ?) = ?",
+            (len(prefix), prefix),
+        ).fetchall():
+            in_folder = recursive or os.path.dirname(file_path) == folder
+            if in_folder and file_path not in found:
+                self._delete(file_path)
+                removed += 1
+        return removed
@@ -0,0 +1,158 @@
+"""
+Interner
+========
+
+This module holds the class `Interner` which shares the keys and repeated
+values of json Frew models as they are parsed, so that many models kept
+loaded at once hold a single copy of each.
+
+"""
+
+import sys
+from typing import Dict, List, Tuple, Union
+
+
+_FLOAT_SIZE: int = sys.getsizeof(0.0)
+
+
+class Interner:
+    """ A class used to share equal strings and floats between the json Frew
+    models parsed with it, passed as the `interner` of `load_data` or
+    `FrewModel`.
+
+    Within one model, Python already shares the keys of the json objects.
+    Models loaded with the same interner also share their keys with each
+    other, along with string values such as material names and colours, and
+    float values such as the many zero results. Floats are shared by their
+    text in the file, so that 1.0, 1 and -0.0 keep their own values and
+    types.
+
+    ...
+
+    Attributes
+    ----------
+    max_size : int
+        The number of distinct strings and floats kept, defaults to 100000.
+        Once it is reached values seen for the first time are no longer
+        kept, so that the many unique results of a batch of models do not
+        cost more memory than sharing the common values saves.
+
+    """
+
+    def __init__(self, max_size: int = 100000) -> None:
+        self.max_size: int = max_size
+        self._strings: Dict[str, str] = {}
+        self._floats: Dict[str, float] = {}
+        self._float_hits: int = 0
+        self._string_hits: int = 0
+        self._string_bytes: int = 0
+
+    def __len__(self) -> int:
+        return len(self._strings) + len(self._floats)
+
+    @property
+    def bytes_saved(self) -> int:
+        """ The estimated memory saved by sharing values, in bytes.
+
+        """
+        return self._float_hits * _FLOAT_SIZE + self._string_bytes
+
+    def object_pairs_hook(
+        self, pairs: List[Tuple[str, Union[str, float, int, bool, list]]]
+    ) -> dict:
+        """ Method to build each json object, sharing its keys and string
+        values, used as the `object_pairs_hook` of `json.loads`.
+
+        Parameters
+        ----------
+        pairs : List[Tuple[str, Union[str, float, int, bool, list]]]
+            The keys and values of the object in order.
+
+        Returns
+        -------
+        json_object : dict
+            The json object.
+
+        """
+        strings: Dict[str, str] = self._strings
+        json_object: dict = {}
+        hits: int = 0
+        saved: int = 0
+        for key, value in pairs:
+            # Each model already shares its own keys, so sharing them between
+            # models is not counted.
+            shared_key = strings.get(key)
+            if shared_key is None:
+                shared_key = self._add_string(key)
+            if type(value) is str:
+                shared_value = strings.get(value)
+                if shared_value is None:
+                    shared_value = self._add_string(value)
+                elif shared_value is not value:
+                    hits += 1
+                    saved += sys.getsizeof(value)
+                value = shared_value
+            json_object[shared_key] = value
+        self._string_hits += hits
+        self._string_bytes += saved
+        return json_object
+
+    def parse_float(self, text: str) -> float:
+        """ Method to parse each json float, sharing equal floats, used as the
+        `parse_float` of `json.loads`.
+
+        Parameters
+        ----------
+        text : str
+            The float as written in the json file.
+
+        Returns
+        -------
+        value : float
+            The shared float.
+
+        """
+        value: Union[float, None] = self._floats.get(text)
+        if value is None:
+            value = float(text)
+            if len(self) < self.max_size:
+                self._floats[text] = value
+        else:
+            self._float_hits += 1
+        return value
+
+    def get_stats(self) -> Dict[str, int]:
+        """ Method to get the usage statistics of the interner.
+
+        Returns
+        -------
+        stats : Dict[str, int]
+            The number of 'strings' and 'floats' kept, the number of 'hits'
+            where a kept value was shared, and the estimated 'bytes saved'
+            by sharing values, not counting keys.
+            The counts are approximate if models are loaded by several
+            threads at once.
+
+        """
+        return {
+            "strings": len(self._strings),
+            "floats": len(self._floats),
+            "hits": self._float_hits + self._string_hits,
+            "bytes saved": self.bytes_saved,
+        }
+
+    def clear(self) -> None:
+        """ Method to forget the kept values and reset the statistics. Models
+        already loaded keep the values they share.
+
+        """
+        self._strings = {}
+        self._floats = {}
+        self._float_hits = 0
+        self._string_hits = 0
+        self._string_bytes = 0
+
+    def _add_string(self, value: str) -> str:
+        if len(self) < self.max_size:
+            self._strings[value] = value
+        return value
@@ -3,3 +3,5 @@ from .soil import Soil
 from .water import Water
 from .strut import Strut
 from .calculation import Calculation
+from .results import Results
+from .changes import ChangeTracker
@@ -0,0 +1,155 @@
+"""
+Changes
+=======
+
+This module holds the class `ChangeTracker` which records the parts of a Frew
+model changed through frewpy, so that saving the model only needs to write
+the sections which have changed, and so that the stages whose results are
+out of date are known.
+
+"""
+
+from typing import Dict, List, Set, Union
+
+
+class ChangeTracker:
+    """ A class used to record the top level sections of a Frew model, and
+    the records within them, which have been modified since the model was
+    loaded or last saved, along with the first stage whose results are out
+    of date since the model was loaded or last analysed.
+
+    """
+
+    def __init__(self) -> None:
+        self._sections: Dict[str, Set[Union[int, None]]] = {}
+        self._everything: bool = False
+        self._first_stage: Union[int, None] = None
+        # Counts every modification, and is not reset by saving, so that
+        # values derived from a section can tell when it has changed.
+        self._revisions: Dict[str, int] = {}
+        self._all_revision: int = 0
+
+    def mark(
+        self, section: str, record: int = None, stage: int = None
+    ) -> None:
+        """ Method to record that a section of the model has been modified.
+
+        Parameters
+        ----------
+        section : str
+            The top level key of the section, e.g. 'Materials'.
+        record : int, optional
+            The index of the record modified within the section, defaults to
+            the whole section.
+        stage : int, optional
+            The first stage whose results are affected by the modification,
+            defaults to none of them.
+
+        """
+        self._sections.setdefault(section, set()).add(record)
+        self._revisions[section] = self._revisions.get(section, 0) + 1
+        if stage is not None and (
+            self._first_stage is None or stage < self._first_stage
+        ):
+            self._first_stage = stage
+
+    def mark_all(self) -> None:
+        """ Method to record that the whole model has been replaced, e.g. by
+        analysing it.
+
+        """
+        self._everything = True
+        self._all_revision += 1
+
+    def clear(self) -> None:
+        """ Method to forget all modifications, once the model is saved. The
+        stages whose results are out of date are still out of date.
+
+        """
+        self._sections = {}
+        self._everything = False
+
+    def mark_analysed(self) -> None:
+        """ Method to record that the model has been analysed, so that the
+        results of every stage are up to date.
+
+        """
+        self._first_stage = None
+
+    def get_revision(self, section: str) -> int:
+        """ Method to get a count which increases whenever a section of the
+        model is modified, including since it was last saved.
+
+        Parameters
+        ----------
+        section : str
+            The top level key of the section, e.g. 'Stages'.
+
+        Returns
+        -------
+        revision : int
+            The revision of the section.
+
+        """
+        return self._all_revision + self._revisions.get(section, 0)
+
+    def get_first_stage(self) -> Union[int, None]:
+        """ Method to get the first stage whose results are out of date.
+
+        Returns
+        -------
+        first_stage : Union[int, None]
+            The index of the first stage affected by the modifications, or
+            None if the results of every stage are up to date.
+
+        """
+        return self._first_stage
+
+    def is_modified(self, section: str = None) -> bool:
+        """ Method to check whether the model, or a section of it, has been
+        modified.
+
+        Parameters
+        ----------
+        section : str, optional
+            The top level key of the section, defaults to any section.
+
+        Returns
+        -------
+        is_modified : bool
+            Whether there are modifications.
+
+        """
+        if self._everything:
+            return True
+        if section is None:
+            return bool(self._sections)
+        return section in self._sections
+
+    def is_all_modified(self) -> bool:
+        """ Method to check whether the whole model has been replaced.
+
+        Returns
+        -------
+        is_all_modified : bool
+            Whether `mark_all` has been called since the model was saved.
+
+        """
+        return self._everything
+
+    def get_modified(self) -> Dict[str, Union[List[int], None]]:
+        """ Method to get the modified sections and records.
+
+        Returns
+        -------
+        modified : Dict[str, Union[List[int], None]]
+            The indices of the modified records of each modified section, or
+            None if the section was modified as a whole.
+
+        """
+        return {
+            section: None
+            if None in records
+            else sorted(record for record in records if record is not None)
+            for section, records in self._sections.items()
+        }
@@ -10,17 +10,20 @@ from datetime import datetime
 from typing import Dict, List, Tuple, Union
 import re
 
-import matplotlib.pyplot as plt  # type: ignore
+import numpy as np  # type: ignore
+from matplotlib.figure import Figure  # type: ignore
 import matplotlib.lines as mlines  # type: ignore
 import colorcet as cc  # type: ignore
-from bokeh.io import output_file, show  # type: ignore
+from bokeh.io import output_file, save, show  # type: ignore
 from bokeh.layouts import layout  # type: ignore
 from bokeh.plotting import figure  # type: ignore
 from bokeh.models import (  # type: ignore
     ColumnDataSource,
     CrosshairTool,
+    CustomJS,
     HoverTool,
     Panel,
+    Select,
     Tabs,
 )
 from bokeh.models.widgets.markups import Div  # type: ignore
@@ -80,6 +83,13 @@ class FrewPlot:
 
 
 class FrewMPL(FrewPlot):
+    """ A Matplotlib figure of the wall results which is built once, with the
+    axes, node geometry, envelopes and legend, drawing the results of `stage`.
+    It can then be updated with the results of each other stage using
+    `plot_stage`.
+
+    """
+
     def __init__(
         self,
         titles: Dict[str, str],
@@ -105,15 +115,17 @@ class FrewMPL(FrewPlot):
         num_cases = len(self.cases)
         colors = cc.glasbey_bw[0:num_cases]
 
-        # Create figure with subplots
-        self.fig, (self.ax1, self.ax2, self.ax3) = plt.subplots(
-            1, 3, sharey=True, figsize=self.fig_size
-        )
+        # Create figure with subplots. The figure is not managed by pyplot,
+        # so it can be drawn from any thread with any backend in use.
+        self.fig = Figure(figsize=self.fig_size)
+        self.ax1, self.ax2, self.ax3 = self.fig.subplots(1, 3, sharey=True)
         axes = [self.ax1, self.ax2, self.ax3]
 
-        # Create and set the plot title
-        fig_title: str = self.get_title(self.stage, self.stage_name)
-        self.fig.suptitle(fig_title, fontsize=self.title_size)
+        # Create and set the plot title, its text is updated for each stage
+        self.fig_title = self.fig.suptitle(
+            self.get_title(self.stage, self.stage_name),
+            fontsize=self.title_size,
+        )
 
         # Set up the plot properties
         for x_label, y_label, axis in zip(self.x_labels, self.y_labels, axes):
@@ -125,20 +137,21 @@ class FrewMPL(FrewPlot):
                 axis.set_xlabel(x_label, fontsize=self.label_size)
 
         # Plot values
+        self.result_lines: List[list] = []
         for axis, plot_list, plot_type in zip(
             axes, plot_lists, self.plot_types
         ):
+            # Plot node geometry
+            (node_handle,) = axis.plot(
+                [0] * len(self.node_levels),
+                self.node_levels,
+                marker=".",
+                color="black",
+                alpha=0.5,
+            )
+
             result_handles = []
             for i, (case_data, color) in enumerate(zip(plot_list, colors)):
-                # Plot node geometry
-                (node_handle,) = axis.plot(
-                    [0] * len(self.node_levels),
-                    self.node_levels,
-                    marker=".",
-                    color="black",
-                    alpha=0.5,
-                )
-
                 # Plot results
                 (res_handle,) = axis.plot(
                     case_data, self.node_levels, color=color
@@ -163,6 +176,7 @@ class FrewMPL(FrewPlot):
                 )
 
                 result_handles.append(res_handle)
+            self.result_lines.append(result_handles)
 
         # Construct handle for legend.
         self.handles = [node_handle]
@@ -180,6 +194,33 @@ class FrewMPL(FrewPlot):
             fontsize=self.label_size,
         )
 
+    def plot_stage(self, stage: int, stage_name: str):
+        """ Method to update the figure with the results of a stage. The axes
+        limits are unchanged as the envelopes bound the results of every
+        stage.
+
+        Parameters
+        ----------
+        stage : int
+            The stage number to plot.
+        stage_name : str
+            The name of the stage to plot.
+
+        Returns
+        -------
+        fig : matplotlib.figure.Figure
+            The updated figure.
+
+        """
+        self.stage = stage
+        self.stage_name = stage_name
+        self.fig_title.set_text(self.get_title(stage, stage_name))
+        plot_lists = self.get_data(self.wall_results, stage)
+        for result_handles, plot_list in zip(self.result_lines, plot_lists):
+            for res_handle, case_data in zip(result_handles, plot_list):
+                res_handle.set_xdata(case_data)
+        return self.fig
+
 
 class FrewBokeh(FrewPlot):
     def __init__(
@@ -191,9 +232,11 @@ class FrewBokeh(FrewPlot):
         wall_results: Dict[int, dict],
         node_levels: List[float],
         envelopes: Dict[str, dict],
+        open_browser: bool = True,
     ):
         super().__init__(titles)
         self.file_name = file_name
+        self.open_browser = open_browser
         self.num_stages = num_stages
         self.stage_names = stage_names
         self.wall_results = wall_results
@@ -205,6 +248,58 @@ class FrewBokeh(FrewPlot):
         self.plot_hgt: int = 750
         self.tabs: list = []
 
+    def _output(self, obj) -> None:
+        if self.open_browser:
+            show(obj)
+        else:
+            save(obj)
+
+    def _create_title_div(self, fig_title: str) -> Div:
+        return Div(
+            text=f"<h1>{fig_title}</h1>",
+            style={
+                "color": "#fff",
+                "width": f"{self.plot_wid*3}px",
+                "font-size": "10px",
+                "background-color": "#222222",
+                "text-align": "center",
+            },
+        )
+
+    def _create_figures(self) -> list:
+        figs = []
+        for _ in range(3):
+            figs.append(
+                figure(plot_width=self.plot_wid, plot_height=self.plot_hgt,)
+            )
+
+        # Set up the plot properties
+        for x_label, y_label, fig in zip(self.x_labels, self.y_labels, figs):
+            if y_label:
+                fig.yaxis.axis_label = y_label
+            if x_label:
+                fig.xaxis.axis_label = x_label
+
+            # Manipulate strings to create hovertool information
+            if not y_label:
+                y_label = "Level (m)"
+
+            x_info = re.sub(r"\(.+\)", "", x_label)
+            y_info = re.sub(r"\(.+\)", "", y_label)
+            x_unit = re.findall(r"\(([^)]+)\)", x_label)[0]
+            y_unit = re.findall(r"\(([^)]+)\)", y_label)[0]
+
+            ht = HoverTool()
+            ht.tooltips = [
+                ("Name", "$name"),
+                ("Node", "@node_num"),
+                (f"{x_info}", "$x{0.2f} " + x_unit),
+                (f"{y_info}", "$y{0.2f} " + y_unit),
+            ]
+            fig.add_tools(ht)
+            fig.add_tools(CrosshairTool())
+        return figs
+
     def plot(self):
         output_file(self.file_name, title=self.titles["JobTitle"])
         for stage in range(self.num_stages):
@@ -212,16 +307,7 @@ class FrewBokeh(FrewPlot):
 
             # Create the plot title
             fig_title: str = self.get_title(stage, stage_name, bokeh=True)
-            title_div = Div(
-                text=f"<h1>{fig_title}</h1>",
-                style={
-                    "color": "#fff",
-                    "width": f"{self.plot_wid*3}px",
-                    "font-size": "10px",
-                    "background-color": "#222222",
-                    "text-align": "center",
-                },
-            )
+            title_div = self._create_title_div(fig_title)
 
             # Get data to plot
             plot_lists = self.get_data(self.wall_results, stage)
@@ -230,41 +316,7 @@ class FrewBokeh(FrewPlot):
             colors = cc.palette["glasbey_bw"][0:num_cases]
 
             # Create a list of 3 Bokeh figures
-            self.figs = []
-            for _ in range(3):
-                self.figs.append(
-                    figure(
-                        plot_width=self.plot_wid, plot_height=self.plot_hgt,
-                    )
-                )
-
-            # Set up the plot properties
-            for x_label, y_label, fig in zip(
-                self.x_labels, self.y_labels, self.figs
-            ):
-                if y_label:
-                    fig.yaxis.axis_label = y_label
-                if x_label:
-                    fig.xaxis.axis_label = x_label
-
-                # Manipulate strings to create hovertool information
-                if not y_label:
-                    y_label = "Level (m)"
-
-                x_info = re.sub(r"\(.+\)", "", x_label)
-                y_info = re.sub(r"\(.+\)", "", y_label)
-                x_unit = re.findall(r"\(([^)]+)\)", x_label)[0]
-                y_unit = re.findall(r"\(([^)]+)\)", y_label)[0]
-
-                ht = HoverTool()
-                ht.tooltips = [
-                    ("Name", "$name"),
-                    ("Node", "@node_num"),
-                    (f"{x_info}", "$x{0.2f} " + x_unit),
-                    (f"{y_info}", "$y{0.2f} " + y_unit),
-                ]
-                fig.add_tools(ht)
-                fig.add_tools(CrosshairTool())
+            self.figs = self._create_figures()
 
             # Plot values
             node_source = ColumnDataSource(
@@ -366,4 +418,132 @@ class FrewBokeh(FrewPlot):
 
             lay = layout([[title_div], [[self.figs]]])
             self.tabs.append(Panel(child=lay, title=f"Stage {stage}"))
-        show(Tabs(tabs=self.tabs))
+        self._output(Tabs(tabs=self.tabs))
+
+    def plot_compact(self):
+        """ Method to plot all stages in a single set of figures, with a
+        selector to change the stage being shown. The results of every stage
+        are held once in the html as numeric arrays, and the selected stage is
+        swapped in by the browser.
+
+        """
+        output_file(self.file_name, title=self.titles["JobTitle"])
+        num_nodes: int = len(self.node_levels)
+        colors = cc.palette["glasbey_bw"][0 : len(self.cases)]
+
+        # One source holds the shown stage and the envelopes, the other holds
+        # the results of every stage with the stages one after another.
+        source_data: Dict[str, Union[list, np.ndarray]] = {
+            "xs": [0] * num_nodes,
+            "ys": self.node_levels,
+            "node_num": list(range(1, num_nodes + 1)),
+        }
+        stage_lists: List[List[List[float]]] = [
+            self.get_data(self.wall_results, stage)
+            for stage in range(self.num_stages)
+        ]
+        stages_data: Dict[str, np.ndarray] = {}
+        for plot_index, plot_type in enumerate(self.plot_types):
+            for i, case in enumerate(self.cases):
+                column: str = f"{plot_type}_{i}"
+                stages_data[column] = np.array(
+                    [plot_lists[plot_index][i] for plot_lists in stage_lists],
+                    dtype=float,
+                ).ravel()
+                source_data[column] = stages_data[column][:num_nodes]
+                for extreme in ["maximum", "minimum"]:
+                    source_data[f"{column}_{extreme}"] = np.array(
+                        self.envelopes[case][extreme][plot_type]
+                    )
+        source = ColumnDataSource(source_data)
+        stages_source = ColumnDataSource(stages_data)
+
+        self.figs = self._create_figures()
+        for fig, plot_type in zip(self.figs, self.plot_types):
+            # Plot node geometry
+            fig.circle(
+                x="xs",
+                y="ys",
+                size=3.5,
+                color="black",
+                alpha=0.5,
+                source=source,
+                legend_label="Wall",
+                name="Wall",
+            )
+            fig.line(
+                x="xs",
+                y="ys",
+                color="black",
+                source=source,
+                legend_label="Wall",
+                name="Wall",
+                line_width=2,
+            )
+            for i, (case, color) in enumerate(zip(self.cases, colors)):
+                # Plot results
+                fig.line(
+                    x=f"{plot_type}_{i}",
+                    y="ys",
+                    color=color,
+                    source=source,
+                    legend_label=case,
+                    name=case,
+                    line_width=2,
+                )
+
+                # Plot max and min envelopes
+                for extreme in ["maximum", "minimum"]:
+                    fig.line(
+                        x=f"{plot_type}_{i}_{extreme}",
+                        y="ys",
+                        color=color,
+                        line_dash="dashed",
+                        source=source,
+                        legend_label=f"{case} envelope",
+                        name=f"{case} envelope",
+                        line_width=2,
+                    )
+
+            fig.legend.click_policy = "hide"
+            fig.legend.location = "bottom_left"
+
+        fig_titles: List[str] = [
+            f"<h1>{self.get_title(stage, stage_name, bokeh=True)}</h1>"
+            for stage, stage_name in enumerate(self.stage_names)
+        ]
+        title_div = self._create_title_div(
+            self.get_title(0, self.stage_names[0], bokeh=True)
+        )
+        stage_select = Select(
+            title="Stage",
+            value="0",
+            options=[
+                (str(stage), f"Stage {stage} - {stage_name}")
+                for stage, stage_name in enumerate(self.stage_names)
+            ],
+        )
+        stage_select.js_on_change(
+            "value",
+            CustomJS(
+                args={
+                    "source": source,
+                    "stages_source": stages_source,
+                    "title_div": title_div,
+                    "fig_titles": fig_titles,
+                    "num_nodes": num_nodes,
+                },
+                code="""
+                const stage = Number(cb_obj.value);
+                const start = stage * num_nodes;
+                for (const column in stages_source.data) {
+                    source.data[column] = stages_source.data[column].slice(
+                        start, start + num_nodes
+                    );
+                }
+                title_div.text = fig_titles[stage];
+                source.change.emit();
+                """,
+            ),
+        )
+        self._output(layout([[stage_select], [title_div], [self.figs]]))
@@ -0,0 +1,124 @@
+"""
+Results
+=======
+
+This module holds the class for the Results object, which allows selective
+queries of the Frew results without extracting the whole model.
+
+"""
+
+from typing import Dict, List, Sequence, Union
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+from frewpy.utils import (
+    NODE_RESULT_FIELDS,
+    get_node_results,
+    get_num_stages,
+    get_num_nodes,
+    get_design_case_names,
+)
+from .exceptions import FrewError
+
+
+class Results:
+    """ A class used to query the node results of a Frew model, reading only
+    the requested stages, design cases and nodes.
+
+    """
+
+    def __init__(
+        self, json_data: Dict[str, list], result_dtype: str = "float64"
+    ) -> None:
+        self.json_data: Dict[str, list] = json_data
+        self.result_dtype: str = result_dtype
+
+    def select(
+        self,
+        stages: Sequence[int] = None,
+        cases: Sequence[str] = None,
+        nodes: Union[slice, Sequence[int]] = None,
+        fields: Sequence[str] = ("shear", "bending", "displacement"),
+        as_dataframe: bool = False,
+    ) -> Union[Dict[str, np.ndarray], pd.DataFrame]:
+        """ Method to get a selection of the node results.
+
+        Parameters
+        ----------
+        stages : Sequence[int], optional
+            The stage numbers to return, all stages if not provided.
+        cases : Sequence[str], optional
+            The names of the design cases to return, all design cases if not
+            provided.
+        nodes : Union[slice, Sequence[int]], optional
+            The node indices (from 0) to return, all nodes if not provided.
+        fields : Sequence[str], optional
+            The results to return, any of: 'shear', 'bending',
+            'displacement', 'water_left', 'water_right', 'soil_left',
+            'soil_right'. Defaults to the shear, bending and displacement.
+        as_dataframe : bool, optional
+            Return a DataFrame with a row per stage, design case and node
+            rather than a dictionary of arrays.
+
+        Returns
+        -------
+        selection : Union[Dict[str, np.ndarray], pd.DataFrame]
+            An array for each field with shape (num stages, num design cases,
+            num nodes) of the selection, or the equivalent DataFrame.
+
+        Raises
+        ------
+        FrewError
+            If the model has no results or the selection is not valid.
+
+        """
+        if isinstance(stages, int) or isinstance(cases, str):
+            raise FrewError("Stages and cases must be given as sequences.")
+        selection = get_node_results(
+            self.json_data, fields, stages, cases, nodes, self.result_dtype
+        )
+        if not as_dataframe:
+            return selection
+
+        stage_numbers = np.arange(get_num_stages(self.json_data))
+        if stages is not None:
+            stage_numbers = np.asarray(stages, dtype=int)
+        design_cases: List[str] = get_design_case_names(self.json_data)
+        if cases is not None:
+            design_cases = list(cases)
+        node_numbers = np.arange(get_num_nodes(self.json_data))
+        if nodes is not None:
+            node_numbers = node_numbers[nodes]
+        node_levels = np.array(
+            [
+                node["Level"]
+                for node in self.json_data["Stages"][0]["GeoFrewNodes"]
+            ]
+        )[node_numbers]
+
+        num_cases, num_nodes = len(design_cases), len(node_numbers)
+        num_rows = len(stage_numbers) * num_cases * num_nodes
+        selection_data: Dict[str, np.ndarray] = {
+            "Stage": np.repeat(stage_numbers, num_cases * num_nodes),
+            "Design case": np.tile(
+                np.repeat(design_cases, num_nodes), len(stage_numbers)
+            ),
+            "Node #": np.resize(node_numbers + 1, num_rows),
+            "Node levels (m)": np.resize(node_levels, num_rows),
+        }
+        for field in fields:
+            selection_data[field] = selection[field].ravel()
+        return pd.DataFrame(selection_data)
+
+    @staticmethod
+    def get_fields() -> List[str]:
+        """ Method to get the names of the result fields that can be selected.
+
+        Returns
+        -------
+        fields : List[str]
+            The names of the result fields.
+
+        """
+        return list(NODE_RESULT_FIELDS.keys())
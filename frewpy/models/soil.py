@@ -8,19 +8,34 @@ functionality of frewpy.
 """
 
 
-from typing import List, Dict, Union
+from typing import List, Dict, Sequence, Tuple, Union
 
+import numpy as np  # type: ignore
+
+from .changes import ChangeTracker
 from .exceptions import FrewError
 
 
+# The soil layers of each side of the wall in a stage.
+_LAYER_KEYS: Dict[str, str] = {"left": "LeftLayers", "right": "RightLayers"}
+
+
 class Soil:
     """ A class used to contain any soil related functionality of frewpy.
     Methods of this class will directly interact with the model data.
 
     """
 
-    def __init__(self, json_data: Dict[str, list]) -> None:
+    def __init__(
+        self, json_data: Dict[str, list], changes: ChangeTracker = None
+    ) -> None:
         self.json_data: Dict[str, list] = json_data
+        self.changes: ChangeTracker = (
+            ChangeTracker() if changes is None else changes
+        )
+        self._layer_index: Dict[str, List[Tuple[np.ndarray, np.ndarray]]] = {}
+        self._layers_source: Union[list, None] = None
+        self._layers_revision: int = -1
 
     def get_materials(self) -> List[str]:
         """ Method to get names of all the materials used within the Frew
@@ -70,6 +85,197 @@ class Soil:
                 return material_dict
         raise FrewError(f"No material called {material} in the model.")
 
+    def set_material_property(
+        self,
+        material: str,
+        property_name: str,
+        value: Union[float, int, dict, bool],
+    ) -> None:
+        """ Method to set a property of a specific material, recording the
+        change so it is saved with the model.
+
+        Parameters
+        ----------
+        material : str
+            The name of the material to set the property of.
+        property_name : str
+            The name of the property, which must already be defined for the
+            material.
+        value : Union[float, int, dict, bool]
+            The new value of the property.
+
+        Raises
+        ------
+        FrewError
+            If the material or property is not in the model.
+
+        """
+        material_properties = self.get_material_properties(material)
+        if property_name not in material_properties:
+            raise FrewError(
+                f"No property called {property_name} for {material}."
+            )
+        material_properties[property_name] = value
+        for index, material_dict in enumerate(self.json_data["Materials"]):
+            if material_dict is material_properties:
+                # Soil layers are given their materials from the first stage.
+                self.changes.mark("Materials", index, stage=0)
+
+    def get_materials_at(
+        self,
+        levels: Union[float, Sequence[float]],
+        stage: int,
+        side: str = "left",
+    ) -> np.ndarray:
+        """ Method to find the materials of the soil at levels on one side of
+        the wall in a stage. Each level is in the layer with the lowest top
+        level at or above it, and the lowest layer continues below the wall.
+
+        The sorted top levels of the layers of every stage are found once,
+        so changes made to the layers through `json_data` are only seen once
+        the 'Stages' are marked with `FrewModel.mark_modified`, or once the
+        model is analysed.
+
+        Parameters
+        ----------
+        levels : Union[float, Sequence[float]]
+            The levels (m) to find the materials at.
+        stage : int
+            The stage number (from 0).
+        side : str, optional
+            The side of the wall, 'left' or 'right'. Defaults to 'left'.
+
+        Returns
+        -------
+        material_numbers : np.ndarray
+            The number of the material at each level, counting from 1 in the
+            order of `get_materials`, or 0 where there is no soil, as used by
+            the 'Leftzone' and 'Rightzone' of the nodes.
+
+        Raises
+        ------
+        FrewError
+            If the stage is not in the model or the side is not valid.
+
+        """
+        top_levels, materials = self._get_layer_index(stage, side)
+        level_array = np.atleast_1d(np.asarray(levels, dtype="float64"))
+        # The number of layers whose top is at or above each level.
+        num_above: np.ndarray = len(top_levels) - np.searchsorted(
+            top_levels, level_array, side="left"
+        )
+        return materials[num_above]
+
+    def get_properties_at(
+        self,
+        levels: Union[float, Sequence[float]],
+        stage: int,
+        side: str = "left",
+        properties: Sequence[str] = None,
+    ) -> Dict[str, np.ndarray]:
+        """ Method to get the properties of the soil at levels on one side of
+        the wall in a stage, found as in `get_materials_at`.
+
+        Parameters
+        ----------
+        levels : Union[float, Sequence[float]]
+            The levels (m) to get the properties at.
+        stage : int
+            The stage number (from 0).
+        side : str, optional
+            The side of the wall, 'left' or 'right'. Defaults to 'left'.
+        properties : Sequence[str], optional
+            The names of the properties, as returned by
+            `get_material_properties`. Defaults to all of them.
+
+        Returns
+        -------
+        property_values : Dict[str, np.ndarray]
+            The value of each property at each level. Numeric properties are
+            floats with NaN where there is no soil, and other properties such
+            as 'Name' are objects with None where there is no soil.
+
+        Raises
+        ------
+        FrewError
+            If there are no materials, a property is not defined for every
+            material, or the stage or side is not valid.
+
+        """
+        material_dicts: List[dict] = self.json_data.get("Materials", [])
+        if not material_dicts:
+            raise FrewError("No materials defined in the model")
+        if properties is None:
+            properties = list(material_dicts[0].keys())
+        material_numbers: np.ndarray = self.get_materials_at(
+            levels, stage, side
+        )
+        property_values: Dict[str, np.ndarray] = {}
+        for property_name in properties:
+            values: list = []
+            for material_dict in material_dicts:
+                if property_name not in material_dict:
+                    raise FrewError(
+                        f"No property called {property_name} for "
+                        f"{material_dict['Name']}."
+                    )
+                values.append(material_dict[property_name])
+            property_values[property_name] = _get_property_table(values)[
+                material_numbers
+            ]
+        return property_values
+
+    def _get_layer_index(
+        self, stage: int, side: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        if side not in _LAYER_KEYS:
+            raise FrewError("The side must be 'left' or 'right'.")
+        stages: list = self.json_data["Stages"]
+        if not 0 <= stage < len(stages):
+            raise FrewError(f"Stage {stage} is not in the model.")
+        # Analysing the model replaces the stages, and edits to them are
+        # marked, either of which rebuilds the index.
+        revision: int = self.changes.get_revision("Stages")
+        if (
+            self._layers_source is not stages
+            or self._layers_revision != revision
+        ):
+            self._layer_index = {
+                layer_side: [
+                    _index_layers(stage_dict[layer_key])
+                    for stage_dict in stages
+                ]
+                for layer_side, layer_key in _LAYER_KEYS.items()
+            }
+            self._layers_source = stages
+            self._layers_revision = revision
+        return self._layer_index[side][stage]
+
+
+def _index_layers(layers: List[dict]) -> Tuple[np.ndarray, np.ndarray]:
+    # The top levels are sorted upwards for searching, with the materials
+    # from the top down after 0 for no soil, so the number of layers at or
+    # above a level is the index of its material.
+    layers = sorted(layers, key=lambda layer: -layer["TopLevel"])
+    top_levels = np.array(
+        [layer["TopLevel"] for layer in reversed(layers)], dtype="float64"
+    )
+    materials = np.array(
+        [0] + [layer["Material"] for layer in layers], dtype="int64"
+    )
+    return top_levels, materials
+
+
+def _get_property_table(values: list) -> np.ndarray:
+    # The value of each material after the value for no soil, so that it is
+    # indexed by the material numbers.
+    if all(type(value) in (int, float) for value in values):
+        return np.array([np.nan] + values, dtype="float64")
+    table = np.empty(len(values) + 1, dtype=object)
+    for index, value in enumerate(values, 1):
+        table[index] = value
+    return table
+
 
 # def get_soil_pressures(self) -> dict:
 #     """ Function to get the vertical effective and horizontal effective for
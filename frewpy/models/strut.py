@@ -1,3 +1,82 @@
+"""
+Strut
+=====
+
+This module holds the class for the Strut object.
+
+"""
+
+from typing import Dict, List
+
+import numpy as np  # type: ignore
+
+from frewpy.utils import get_strut_forces, get_extremes
+from .exceptions import FrewError
+
+
 class Strut:
-    def __init__(self, json_data):
+    """ A class used to contain any strut related functionality of frewpy.
+
+    """
+
+    def __init__(self, json_data, result_dtype: str = "float64"):
         self.json_data = json_data
+        self.result_dtype: str = result_dtype
+
+    def get_strut_levels(self) -> List[float]:
+        """ Method to get the levels of the struts in a Frew model.
+
+        Returns
+        -------
+        strut_levels : List[float]
+            The level of each strut in a Frew model.
+
+        Raises
+        ------
+        FrewError
+            If there are no struts in the model.
+
+        """
+        if not self.json_data.get("Struts", False):
+            raise FrewError("No struts defined in the model.")
+        return [strut["LevelStrut"] for strut in self.json_data["Struts"]]
+
+    def get_strut_forces(self) -> np.ndarray:
+        """ Method to get the force in each strut for each stage and design
+        case.
+
+        Returns
+        -------
+        strut_forces : np.ndarray
+            The strut forces (kN/m) with shape (num stages, num design cases,
+            num struts).
+
+        """
+        return get_strut_forces(self.json_data, self.result_dtype)
+
+    def find_extremes(
+        self, num_values: int = 1
+    ) -> Dict[str, Dict[str, List[dict]]]:
+        """ Method to find the governing maximum and minimum strut forces
+        across all stages, design cases and struts.
+
+        Parameters
+        ----------
+        num_values : int, optional
+            The number of governing values to return, defaults to 1.
+
+        Returns
+        -------
+        extremes : Dict[str, Dict[str, List[dict]]]
+            The 'maximum' and 'minimum' records for 'force', ordered from the
+            most onerous. Each record holds the value, strut number (from 1),
+            level, stage, stage name and design case.
+
+        """
+        return get_extremes(
+            self.json_data,
+            {"force": self.get_strut_forces()},
+            self.get_strut_levels(),
+            num_values,
+            location="strut",
+        )
@@ -6,23 +6,38 @@ This module holds the class for the Wall object.
 
 """
 
+import io
 import os
-from typing import Dict, List, Union
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Deque, Dict, List, Sequence, Union
 from uuid import uuid4
 from datetime import datetime
 import re
 
 from matplotlib.backends.backend_pdf import PdfPages  # type: ignore
+import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 
+try:
+    from pypdf import PdfReader, PdfWriter  # type: ignore
+
+    HAS_PYPDF: bool = True
+except ImportError:
+    HAS_PYPDF = False
+
 from frewpy.utils import (
     get_num_nodes,
     get_num_stages,
     get_stage_names,
     get_titles,
     get_design_case_names,
+    get_node_results,
+    get_extremes,
     check_results_present,
 )
+from frewpy.shared import SharedHandle, SharedResults
+from frewpy.workers import init_worker
 from .plot import FrewMPL, FrewBokeh
 from .exceptions import FrewError
 
@@ -32,8 +47,19 @@ class Wall:
 
     """
 
-    def __init__(self, json_data):
+    def __init__(self, json_data, result_dtype: str = "float64"):
         self.json_data = json_data
+        self.result_dtype: str = result_dtype
+        self._result_arrays: Dict[str, np.ndarray] = {}
+        self._results_source: Union[list, None] = None
+
+    def __reduce__(self) -> tuple:
+        # The result arrays are sent with the wall, so that the process
+        # receiving it does not calculate them again.
+        return (
+            _restore_wall,
+            (self.json_data, self.result_dtype, self._get_cached_arrays()),
+        )
 
     def get_node_levels(self) -> List[float]:
         """ Method to get the levels of the nodes in a Frew model.
@@ -100,10 +126,17 @@ class Wall:
                     ].append(stage_results[node]["Displacement"] * 1000)
         return wall_results
 
-    def get_envelopes(self) -> Dict[str, dict]:
+    def get_envelopes(
+        self, wall_results: Dict[int, dict] = None
+    ) -> Dict[str, dict]:
         """ Method to return the envelopes of max and min shear, bending and
         displacements for each design case.
 
+        Parameters
+        ----------
+        wall_results : Dict[int, dict], optional
+            The results from `get_results`, which are fetched if not given.
+
         Returns
         -------
         envelopes : Dict[str, dict]
@@ -115,7 +148,8 @@ class Wall:
         num_stages = get_num_stages(self.json_data)
         num_nodes = get_num_nodes(self.json_data)
         design_cases = get_design_case_names(self.json_data)
-        wall_results = self.get_results()
+        if wall_results is None:
+            wall_results = self.get_results()
 
         envelopes: Dict[str, dict] = {
             design_case: {
@@ -154,6 +188,130 @@ class Wall:
                 envelopes[design_case]["minimum"]["disp"].append(min(disp))
         return envelopes
 
+    def at_levels(
+        self,
+        levels: Union[float, Sequence[float]],
+        fields: Sequence[str] = ("shear", "bending", "displacement"),
+    ) -> Dict[str, np.ndarray]:
+        """ Method to linearly interpolate wall results at any levels along
+        the wall, for every stage and design case at once.
+
+        Parameters
+        ----------
+        levels : Union[float, Sequence[float]]
+            The level or levels (m) to get the results at. These must be
+            within the top and toe of the wall.
+        fields : Sequence[str], optional
+            The results to interpolate, any of: 'shear', 'bending',
+            'displacement', 'water_left', 'water_right', 'soil_left',
+            'soil_right'. Defaults to the shear, bending and displacement.
+
+        Returns
+        -------
+        level_results : Dict[str, np.ndarray]
+            An array for each field with shape (num stages, num design cases,
+            num levels).
+
+        Raises
+        ------
+        FrewError
+            If any of the levels are outside of the wall.
+
+        """
+        node_levels = np.array(self.get_node_levels())
+        level_array = np.atleast_1d(np.asarray(levels, dtype=float))
+        if np.any(level_array > node_levels[0]) or np.any(
+            level_array < node_levels[-1]
+        ):
+            raise FrewError(
+                f"""
+                Levels must be between the top of the wall at
+                {node_levels[0]:.2f}m and the toe at {node_levels[-1]:.2f}m.
+            """
+            )
+        result_arrays = self._get_result_arrays(fields)
+
+        # Node levels descend down the wall, so search their negated values to
+        # find the node at or above each level.
+        upper = np.searchsorted(-node_levels, -level_array, side="right") - 1
+        upper = np.clip(upper, 0, len(node_levels) - 2)
+        lower = upper + 1
+        weights = (node_levels[upper] - level_array) / (
+            node_levels[upper] - node_levels[lower]
+        )
+        return {
+            field: values[..., upper]
+            + (values[..., lower] - values[..., upper]) * weights
+            for field, values in result_arrays.items()
+        }
+
+    def find_extremes(
+        self,
+        fields: Sequence[str] = ("shear", "bending", "displacement"),
+        num_values: int = 1,
+    ) -> Dict[str, Dict[str, List[dict]]]:
+        """ Method to find the governing maximum and minimum wall results
+        across all stages, design cases and nodes.
+
+        Parameters
+        ----------
+        fields : Sequence[str], optional
+            The results to search, any of: 'shear', 'bending',
+            'displacement', 'water_left', 'water_right', 'soil_left',
+            'soil_right'. Defaults to the shear, bending and displacement.
+        num_values : int, optional
+            The number of governing values to return per field, defaults to 1.
+
+        Returns
+        -------
+        extremes : Dict[str, Dict[str, List[dict]]]
+            The 'maximum' and 'minimum' records for each field, ordered from
+            the most onerous. Each record holds the value, node number (from
+            1), level, stage, stage name and design case.
+
+        """
+        return get_extremes(
+            self.json_data,
+            self._get_result_arrays(fields),
+            self.get_node_levels(),
+            num_values,
+        )
+
+    def _get_result_arrays(
+        self, fields: Sequence[str]
+    ) -> Dict[str, np.ndarray]:
+        check_results_present(self.json_data)
+        # Analysing the model replaces the results, which clears the cache.
+        if self._results_source is not self.json_data["Frew Results"]:
+            self._result_arrays = {}
+            self._results_source = self.json_data["Frew Results"]
+        missing = [
+            field for field in fields if field not in self._result_arrays
+        ]
+        if missing:
+            self._result_arrays.update(
+                get_node_results(
+                    self.json_data, missing, dtype=self.result_dtype
+                )
+            )
+        return {field: self._result_arrays[field] for field in fields}
+
+    def _get_cached_arrays(self) -> Dict[str, np.ndarray]:
+        if self._results_source is not self.json_data.get("Frew Results"):
+            return {}
+        return dict(self._result_arrays)
+
+    def _add_result_arrays(self, arrays: Dict[str, np.ndarray]) -> None:
+        # Arrays calculated by another process from the same results, which
+        # are kept alongside any already calculated here.
+        if not arrays:
+            return
+        if self._results_source is not self.json_data.get("Frew Results"):
+            self._result_arrays = {}
+            self._results_source = self.json_data.get("Frew Results")
+        for field, values in arrays.items():
+            self._result_arrays.setdefault(field, values)
+
     def results_to_excel(self, out_folder: str) -> None:
         """ Method to exports the wall results to an excel file where each
         sheet in the spreadsheet is a design case. The spreadsheet also
@@ -172,23 +330,43 @@ class Wall:
         if not os.path.exists(out_folder):
             raise FrewError(f"Path {out_folder} does not exist.")
 
-        num_nodes: int = get_num_nodes(self.json_data)
-        num_stages: int = get_num_stages(self.json_data)
-        node_levels: List[float] = self.get_node_levels()
-        wall_results: Dict[int, dict] = self.get_results()
-        design_cases: List[str] = get_design_case_names(self.json_data)
-        envelopes: Dict[str, dict] = self.get_envelopes()
+        report_data: dict = self.get_report_data()
+        job_title: str = report_data["titles"]["JobTitle"]
+        uuid_str: str = str(uuid4()).split("-")[0]
+        file_name: str = f"{job_title}_{uuid_str}_results.xlsx"
+        self.write_excel(os.path.join(out_folder, file_name), report_data)
+
+    @staticmethod
+    def write_excel(out_path: str, report_data: dict) -> None:
+        """ Method to write report data to an excel file, with a sheet for
+        the titles, one for the envelopes and one for each design case.
+
+        Parameters
+        ----------
+        out_path : str
+            The file path of the spreadsheet.
+        report_data : dict
+            The data of the model, as returned by `get_report_data`.
+
+        Returns
+        -------
+        None
+
+        """
+        num_nodes: int = len(report_data["node_levels"])
+        num_stages: int = report_data["num_stages"]
+        node_levels: List[float] = report_data["node_levels"]
+        wall_results: Dict[int, dict] = report_data["wall_results"]
+        design_cases: List[str] = report_data["design_cases"]
+        envelopes: Dict[str, dict] = report_data["envelopes"]
         export_envelopes = pd.DataFrame(
-            self._format_envelope_data(
+            Wall.format_envelope_data(
                 num_nodes, node_levels, envelopes, design_cases
             )
         )
-        titles: Dict[str, str] = get_titles(self.json_data)
-        export_titles = pd.DataFrame(self._format_titles_data(titles))
-
-        job_title: str = titles["JobTitle"]
-        uuid_str: str = str(uuid4()).split("-")[0]
-        file_name: str = f"{job_title}_{uuid_str}_results.xlsx"
+        export_titles = pd.DataFrame(
+            Wall._format_titles_data(report_data["titles"])
+        )
 
         export_data: Dict[str, dict] = {}
         for design_case in design_cases:
@@ -220,7 +398,7 @@ class Wall:
                     displacement_results
                 )
         try:
-            with pd.ExcelWriter(os.path.join(out_folder, file_name)) as writer:
+            with pd.ExcelWriter(out_path) as writer:
                 export_titles.to_excel(
                     writer, sheet_name="Titles", index=False, header=False
                 )
@@ -239,9 +417,8 @@ class Wall:
             """
             )
 
-    def _format_titles_data(
-        self, titles: Dict[str, str]
-    ) -> Dict[str, List[str]]:
+    @staticmethod
+    def _format_titles_data(titles: Dict[str, str]) -> Dict[str, List[str]]:
         format_titles: Dict[str, List[str]] = {
             "title": [],
             "value": [],
@@ -261,13 +438,34 @@ class Wall:
                 format_titles["title"][index] = title
         return format_titles
 
-    def _format_envelope_data(
-        self,
+    @staticmethod
+    def format_envelope_data(
         num_nodes: int,
         node_levels: List[float],
         envelopes: Dict[str, dict],
         design_cases: List[str],
     ) -> Dict[str, list]:
+        """ Method to arrange envelopes as the columns of a table, with a row
+        for each design case and node.
+
+        Parameters
+        ----------
+        num_nodes : int
+            The number of nodes in the wall.
+        node_levels : List[float]
+            The level of each node.
+        envelopes : Dict[str, dict]
+            The envelopes of each design case, as returned by
+            `get_envelopes`.
+        design_cases : List[str]
+            The design cases to include.
+
+        Returns
+        -------
+        envelope_data : Dict[str, list]
+            The values of each column, e.g. 'Max Bending (kNm/m)'.
+
+        """
         format_envelopes: Dict[str, list] = {
             "Design case": [],
             "Node #": [],
@@ -306,17 +504,32 @@ class Wall:
             )
         return format_envelopes
 
-    def _get_plot_data(self) -> Dict[str, Union[dict, int, list]]:
+    def get_report_data(self) -> Dict[str, Union[dict, int, list]]:
+        """ Method to gather the data written by the export methods, so that
+        several outputs can be written from a single pass over the results.
+
+        Returns
+        -------
+        report_data : Dict[str, Union[dict, int, list]]
+            The 'titles', 'num_stages', 'stage_names', 'design_cases',
+            'node_levels', 'wall_results' as returned by `get_results`, and
+            'envelopes' as returned by `get_envelopes`.
+
+        """
+        wall_results: Dict[int, dict] = self.get_results()
         return {
             "titles": get_titles(self.json_data),
             "num_stages": get_num_stages(self.json_data),
             "stage_names": get_stage_names(self.json_data),
+            "design_cases": get_design_case_names(self.json_data),
             "node_levels": self.get_node_levels(),
-            "wall_results": self.get_results(),
-            "envelopes": self.get_envelopes(),
+            "wall_results": wall_results,
+            "envelopes": self.get_envelopes(wall_results),
         }
 
-    def plot_results_pdf(self, out_folder: str) -> None:
+    def plot_results_pdf(
+        self, out_folder: str, workers: int = 1, max_pending: int = None
+    ) -> None:
         """ Method to plot the shear, bending moment and displacement of the
         wall for each stage. Output is a static pdf plot created using the
         Matplotlib plotting library.
@@ -325,37 +538,124 @@ class Wall:
         ----------
         out_folder : str
             The folder path to save the results at.
+        workers : int, optional
+            The number of processes used to draw the stages, defaults to 1
+            which draws them in this process. Each process draws a page with
+            the Agg backend, and the pages are combined with the optional
+            pypdf library.
+        max_pending : int, optional
+            The maximum number of stages being drawn or waiting to be added
+            to the pdf at once when using more than 1 worker, defaults to
+            twice the number of workers. Use a small value to bound memory
+            for models with many stages.
 
         Returns
         -------
         None
 
         """
-        plot_data_dict = self._get_plot_data()
+        plot_data_dict = self.get_report_data()
         job_title: str = plot_data_dict["titles"]["JobTitle"]
         uuid_str: str = str(uuid4()).split("-")[0]
         out_pdf_name: str = f"{job_title}_{uuid_str}_results.pdf"
 
+        out_path: str = os.path.join(out_folder, out_pdf_name)
         try:
-            out_file = PdfPages(os.path.join(out_folder, out_pdf_name))
+            if workers <= 1:
+                self.write_pdf(out_path, plot_data_dict)
+            else:
+                self._write_pdf_parallel(
+                    out_path, plot_data_dict, workers, max_pending
+                )
         except PermissionError:
             raise FrewError(
                 f"Please make sure {out_pdf_name} is closed first."
             )
 
+    @staticmethod
+    def write_pdf(out_path: str, plot_data_dict: dict) -> None:
+        """ Method to plot report data to a pdf file, with a page for each
+        stage, in this process.
+
+        Parameters
+        ----------
+        out_path : str
+            The file path of the pdf.
+        plot_data_dict : dict
+            The data of the model, as returned by `get_report_data`.
+
+        Returns
+        -------
+        None
+
+        """
+        frew_mpl = _create_plot_template(plot_data_dict)
+        out_file = PdfPages(out_path)
         for stage in range(plot_data_dict["num_stages"]):
-            frew_mpl = FrewMPL(
-                plot_data_dict["titles"],
-                stage,
-                plot_data_dict["stage_names"][stage],
-                plot_data_dict["wall_results"],
-                plot_data_dict["node_levels"],
-                plot_data_dict["envelopes"],
+            out_file.savefig(
+                frew_mpl.plot_stage(
+                    stage, plot_data_dict["stage_names"][stage]
+                )
             )
-            out_file.savefig(frew_mpl.fig)
         out_file.close()
 
-    def plot_results_html(self, out_folder: str):
+    @staticmethod
+    def _write_pdf_parallel(
+        out_path: str,
+        plot_data_dict: dict,
+        workers: int,
+        max_pending: Union[int, None],
+    ) -> None:
+        if not HAS_PYPDF:
+            raise FrewError(
+                """
+                Plotting with more than 1 worker requires the optional pypdf
+                library, please install it with `pip install pypdf`.
+            """
+            )
+        max_pending = max(max_pending or 2 * workers, 1)
+        writer = PdfWriter()
+        # The results are shared with the workers rather than pickled to each
+        # of them, along with the rest of the plot data which is small.
+        stages = range(plot_data_dict["num_stages"])
+        shared_results = SharedResults(
+            {
+                field: np.asarray(
+                    [
+                        [
+                            plot_data_dict["wall_results"][stage][case][field]
+                            for case in plot_data_dict["design_cases"]
+                        ]
+                        for stage in stages
+                    ]
+                )
+                for field in ["shear", "bending", "displacement"]
+            }
+        )
+        worker_data: dict = {
+            key: value
+            for key, value in plot_data_dict.items()
+            if key != "wall_results"
+        }
+        with shared_results, ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_plot_worker,
+            initargs=(worker_data, shared_results.handle),
+        ) as executor:
+            pending: Deque = deque()
+            for stage in range(plot_data_dict["num_stages"]):
+                pending.append(executor.submit(_plot_worker_stage, stage))
+                # Pages are added in stage order as soon as they are ready, so
+                # that at most `max_pending` pages are waiting at once.
+                if len(pending) >= max_pending:
+                    page = pending.popleft().result()
+                    writer.append(PdfReader(io.BytesIO(page)))
+            while pending:
+                page = pending.popleft().result()
+                writer.append(PdfReader(io.BytesIO(page)))
+        writer.write(out_path)
+
+    def plot_results_html(self, out_folder: str, compact: bool = False):
         """ Method to plot the shear, bending moment and displacement of the
         wall for each stage. Output is a interactive html plot created using
         the Bokeh plotting library.
@@ -364,6 +664,11 @@ class Wall:
         ----------
         out_folder : str
             The folder path to save the results at.
+        compact : bool, optional
+            Whether to draw a single set of figures with a stage selector,
+            rather than a tab of figures for each stage. The results of each
+            stage are then stored once, which keeps the html small and quick
+            to open for models with many stages. Defaults to False.
 
         Returns
         -------
@@ -371,25 +676,57 @@ class Wall:
 
         """
         plot_data_dict: Dict[str, Union[dict, int, list]] = (
-            self._get_plot_data()
+            self.get_report_data()
         )
 
         job_title: str = plot_data_dict["titles"]["JobTitle"]
         uuid_str: str = str(uuid4()).split("-")[0]
         out_html_name: str = f"{job_title}_{uuid_str}_results.html"
 
-        output_file: str = os.path.join(out_folder, out_html_name)
+        self.write_html(
+            os.path.join(out_folder, out_html_name), plot_data_dict, compact
+        )
+
+    @staticmethod
+    def write_html(
+        out_path: str,
+        plot_data_dict: dict,
+        compact: bool = False,
+        open_browser: bool = True,
+    ) -> None:
+        """ Method to plot report data to an interactive html file.
+
+        Parameters
+        ----------
+        out_path : str
+            The file path of the html.
+        plot_data_dict : dict
+            The data of the model, as returned by `get_report_data`.
+        compact : bool, optional
+            Whether to draw a single set of figures with a stage selector,
+            see `plot_results_html`. Defaults to False.
+        open_browser : bool, optional
+            Whether to open the html once written, defaults to True.
 
+        Returns
+        -------
+        None
+
+        """
         frew_bp = FrewBokeh(
-            output_file,
+            out_path,
             plot_data_dict["titles"],
             plot_data_dict["num_stages"],
             plot_data_dict["stage_names"],
             plot_data_dict["wall_results"],
             plot_data_dict["node_levels"],
             plot_data_dict["envelopes"],
+            open_browser,
         )
-        frew_bp.plot()
+        if compact:
+            frew_bp.plot_compact()
+        else:
+            frew_bp.plot()
 
     def get_wall_stiffness(self) -> Dict[int, List[float]]:
         """ Function to get the stiffness of the wall for each stage and node.
@@ -409,3 +746,54 @@ class Wall:
                 for item in self.json_data["Stages"][stage]["GeoFrewNodes"]
             ]
         return wall_stiffness
+
+
+def _restore_wall(
+    json_data: Dict[str, list],
+    result_dtype: str,
+    result_arrays: Dict[str, np.ndarray],
+) -> Wall:
+    wall = Wall(json_data, result_dtype)
+    wall._add_result_arrays(result_arrays)
+    return wall
+
+
+def _create_plot_template(plot_data_dict: dict) -> FrewMPL:
+    return FrewMPL(
+        plot_data_dict["titles"],
+        0,
+        plot_data_dict["stage_names"][0],
+        plot_data_dict["wall_results"],
+        plot_data_dict["node_levels"],
+        plot_data_dict["envelopes"],
+    )
+
+
+_worker_plot_data: dict = {}
+
+
+def _init_plot_worker(plot_data_dict: dict, handle: SharedHandle) -> None:
+    # The plot data is sent once to each worker, which builds one figure and
+    # updates it for every stage it draws.
+    init_worker()
+    arrays: Dict[str, np.ndarray] = handle.attach()
+    _worker_plot_data.update(plot_data_dict)
+    _worker_plot_data["wall_results"] = {
+        stage: {
+            case: {
+                field: values[stage, index] for field, values in arrays.items()
+            }
+            for index, case in enumerate(plot_data_dict["design_cases"])
+        }
+        for stage in range(plot_data_dict["num_stages"])
+    }
+    _worker_plot_data["template"] = _create_plot_template(_worker_plot_data)
+
+
+def _plot_worker_stage(stage: int) -> bytes:
+    fig = _worker_plot_data["template"].plot_stage(
+        stage, _worker_plot_data["stage_names"][stage]
+    )
+    page = io.BytesIO()
+    fig.savefig(page, format="pdf")
+    return page.getvalue()
@@ -6,23 +6,33 @@ This module holds the class for the Water object.
 
 """
 
-from typing import Dict, List
+from typing import Dict, List, Sequence
+
+import numpy as np  # type: ignore
 
 from frewpy.utils import (
     check_results_present,
     get_num_stages,
     get_num_nodes,
     get_design_case_names,
+    get_node_results,
+    get_extremes,
 )
 
 
+# The groundwater of the left and right sides of the wall, in the order of
+# the GeoGroundWater of each stage.
+_WATER_FIELDS: List[str] = ["water_left", "water_right"]
+
+
 class Water:
     """ A class used to contain any water related functionality of frewpy.
 
     """
 
-    def __init__(self, json_data):
+    def __init__(self, json_data, result_dtype: str = "float64"):
         self.json_data = json_data
+        self.result_dtype: str = result_dtype
 
     def get_water_pressures(self) -> Dict[int, Dict[str, dict]]:
         """ Function to get the pore water pressure for each stage and node.
@@ -59,3 +69,171 @@ class Water:
                         node_results[node]["URight"] / 1000
                     )
         return water_pressures
+
+    def get_groundwater_profiles(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """ Method to get the groundwater defined for each stage on each side
+        of the wall, as the points of its pore water pressure profile.
+
+        Returns
+        -------
+        profiles : Dict[str, Dict[str, np.ndarray]]
+            The profiles of 'water_left' and 'water_right', each holding the
+            'levels' (m) and 'pressures' (kPa) of the points with shape (num
+            stages, num points), padded with NaN after the last point of a
+            stage, and the 'unit_weight' (kN/m3) with shape (num stages).
+
+        """
+        num_stages: int = get_num_stages(self.json_data)
+        profiles: Dict[str, Dict[str, np.ndarray]] = {}
+        for side, field in enumerate(_WATER_FIELDS):
+            groundwater: List[dict] = [
+                self.json_data["Stages"][stage]["GeoGroundWater"][side]
+                for stage in range(num_stages)
+            ]
+            num_points: int = max(
+                [len(water["Points"]) for water in groundwater], default=0
+            )
+            levels = np.full((num_stages, num_points), np.nan)
+            pressures = np.full((num_stages, num_points), np.nan)
+            for stage, water in enumerate(groundwater):
+                points: List[dict] = water["Points"]
+                levels[stage, : len(points)] = [point["Y"] for point in points]
+                pressures[stage, : len(points)] = [
+                    point["Z"] / 1000 for point in points
+                ]
+            profiles[field] = {
+                "levels": levels,
+                "pressures": pressures,
+                "unit_weight": np.array(
+                    [water["UnitWeight"] / 1000 for water in groundwater]
+                ),
+            }
+        return profiles
+
+    def get_input_pressures(
+        self, levels: Sequence[float] = None
+    ) -> Dict[str, np.ndarray]:
+        """ Method to evaluate the groundwater defined for every stage at
+        levels along the wall, all at once.
+
+        The pressure is interpolated between the points of a stage, and
+        changes with the unit weight of water above the first point, down to
+        zero, and below the last point. Where two points share a level, the
+        pressure at that level is the pressure of the lower point.
+
+        Parameters
+        ----------
+        levels : Sequence[float], optional
+            The levels (m) to evaluate the pressures at, defaults to the node
+            levels.
+
+        Returns
+        -------
+        input_pressures : Dict[str, np.ndarray]
+            The pore water pressures (kPa) of 'water_left' and 'water_right'
+            with shape (num stages, num levels).
+
+        """
+        if levels is None:
+            levels = self._get_node_levels()
+        level_array = np.atleast_1d(np.asarray(levels, dtype="float64"))
+        return {
+            field: _evaluate_profiles(profile, level_array)
+            for field, profile in self.get_groundwater_profiles().items()
+        }
+
+    def compare_pressures(self) -> Dict[str, np.ndarray]:
+        """ Method to compare the pore water pressures of the results with
+        the groundwater defined for each stage, at every node.
+
+        Returns
+        -------
+        differences : Dict[str, np.ndarray]
+            The result minus the input pressure (kPa) of 'water_left' and
+            'water_right' with shape (num stages, num design cases, num
+            nodes). Differences are expected where the results are not
+            drained, e.g. within undrained clay.
+
+        """
+        node_results: Dict[str, np.ndarray] = get_node_results(
+            self.json_data, _WATER_FIELDS
+        )
+        input_pressures: Dict[str, np.ndarray] = self.get_input_pressures()
+        return {
+            field: node_results[field] - input_pressures[field][:, None, :]
+            for field in _WATER_FIELDS
+        }
+
+    def find_extremes(
+        self,
+        fields: Sequence[str] = ("water_left", "water_right"),
+        num_values: int = 1,
+    ) -> Dict[str, Dict[str, List[dict]]]:
+        """ Method to find the governing maximum and minimum pore water
+        pressures across all stages, design cases and nodes.
+
+        Parameters
+        ----------
+        fields : Sequence[str], optional
+            The pressures to search, 'water_left' and/or 'water_right'.
+        num_values : int, optional
+            The number of governing values to return per field, defaults to 1.
+
+        Returns
+        -------
+        extremes : Dict[str, Dict[str, List[dict]]]
+            The 'maximum' and 'minimum' records for each field, ordered from
+            the most onerous. Each record holds the value, node number (from
+            1), level, stage, stage name and design case.
+
+        """
+        return get_extremes(
+            self.json_data,
+            get_node_results(self.json_data, fields, dtype=self.result_dtype),
+            self._get_node_levels(),
+            num_values,
+        )
+
+    def _get_node_levels(self) -> List[float]:
+        return [
+            node["Level"]
+            for node in self.json_data["Stages"][0]["GeoFrewNodes"]
+        ]
+
+
+def _evaluate_profiles(
+    profile: Dict[str, np.ndarray], levels: np.ndarray
+) -> np.ndarray:
+    point_levels: np.ndarray = profile["levels"]
+    point_pressures: np.ndarray = profile["pressures"]
+    num_stages, num_points = point_levels.shape
+    if num_points == 0:
+        return np.zeros((num_stages, len(levels)))
+    counts: np.ndarray = np.sum(~np.isnan(point_levels), axis=1)[:, None]
+    unit_weight: np.ndarray = profile["unit_weight"][:, None]
+    # The number of points at or above each level, where NaN padding is not.
+    above: np.ndarray = np.sum(
+        point_levels[:, None, :] >= levels[None, :, None], axis=2
+    )
+    stages: np.ndarray = np.arange(num_stages)[:, None]
+    upper: np.ndarray = np.maximum(above - 1, 0)
+    lower: np.ndarray = np.maximum(np.minimum(above, counts - 1), 0)
+    upper_level = point_levels[stages, upper]
+    lower_level = point_levels[stages, lower]
+    upper_pressure = point_pressures[stages, upper]
+    lower_pressure = point_pressures[stages, lower]
+    # Each branch is found for every level, but only used where it is valid.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        between = upper_pressure + (lower_pressure - upper_pressure) * (
+            upper_level - levels
+        ) / (upper_level - lower_level)
+    above_first = np.maximum(
+        upper_pressure - unit_weight * (levels - upper_level), 0.0
+    )
+    below_last = lower_pressure + unit_weight * (lower_level - levels)
+    pressures = np.where(
+        above == 0,
+        above_first,
+        np.where(above >= counts, below_last, between),
+    )
+    return np.where(counts == 0, 0.0, pressures)
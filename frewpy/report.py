@@ -0,0 +1,250 @@
+"""
+Report
+======
+
+This module holds the class `Report` which writes the results of a Frew model
+to any combination of output formats. The titles, node levels, results and
+envelopes shared by the outputs are gathered from the model once, however many
+formats are written.
+
+"""
+
+import os
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Dict, List, Sequence, Union
+from uuid import uuid4
+
+import pandas as pd  # type: ignore
+
+try:
+    import pyarrow  # type: ignore
+except ImportError:
+    pyarrow = None
+
+from frewpy.frew_model import FrewModel
+from frewpy.models import Wall
+from frewpy.utils import check_result_dtype
+from frewpy.workers import init_worker
+from frewpy.models.exceptions import FrewError
+
+
+# The file extension written for each report format.
+REPORT_FORMATS: Dict[str, str] = {
+    "excel": "xlsx",
+    "pdf": "pdf",
+    "html": "html",
+    "csv": "csv",
+    "parquet": "parquet",
+}
+
+
+class Report:
+    """ A class used to write the wall results of a Frew model to several
+    output formats in a single pass.
+
+    ...
+
+    Attributes
+    ----------
+    model : FrewModel
+        The analysed model to report on.
+    out_folder : str
+        The folder to write the outputs to.
+    file_stem : str
+        The file name, without extension, shared by the outputs. Defaults to
+        the job title followed by a random string, as used by the `Wall`
+        export methods.
+    dtype : str
+        The data type of the results written to csv and parquet, either
+        'float64' or 'float32' to reduce their size, see
+        `utils.get_float32_error`. Defaults to 'float64'.
+
+    """
+
+    def __init__(
+        self,
+        model: FrewModel,
+        out_folder: str,
+        file_stem: str = None,
+        dtype: str = "float64",
+    ) -> None:
+        if not os.path.isdir(out_folder):
+            raise FrewError(f"Path {out_folder} does not exist.")
+        check_result_dtype(dtype)
+        self.model: FrewModel = model
+        self.out_folder: str = out_folder
+        self.dtype: str = dtype
+        self._report_data: Union[dict, None] = None
+        if file_stem is None:
+            job_title: str = self.report_data["titles"]["JobTitle"]
+            uuid_str: str = str(uuid4()).split("-")[0]
+            file_stem = f"{job_title}_{uuid_str}_results"
+        self.file_stem: str = file_stem
+
+    @property
+    def report_data(self) -> dict:
+        """ The titles, stage names, node levels, wall results and envelopes
+        of the model, gathered on first use and shared by every output.
+
+        """
+        if self._report_data is None:
+            self._report_data = self.model.wall.get_report_data()
+        return self._report_data
+
+    def write(
+        self,
+        formats: Sequence[str] = ("excel", "pdf", "html"),
+        parallel: str = None,
+        workers: int = None,
+        compact: bool = False,
+    ) -> Dict[str, str]:
+        """ Method to write the report in each of the given formats.
+
+        Parameters
+        ----------
+        formats : Sequence[str], optional
+            The formats to write, any of: 'excel', 'pdf', 'html', 'csv',
+            'parquet'. Defaults to excel, pdf and html. Parquet requires the
+            optional pyarrow library.
+        parallel : str, optional
+            Whether to write the formats at the same time in 'thread' or
+            'process' workers, defaults to None which writes them one after
+            another. Processes avoid sharing the Matplotlib and Bokeh state
+            between outputs, at the cost of sending the results to each.
+        workers : int, optional
+            The maximum number of workers, defaults to one per format.
+        compact : bool, optional
+            Whether to write the html as a single set of figures with a stage
+            selector, see `Wall.plot_results_html`.
+
+        Returns
+        -------
+        out_paths : Dict[str, str]
+            The file path written for each format.
+
+        Raises
+        ------
+        FrewError
+            If a format or the type of parallelism is not recognised, or if
+            parquet is requested without pyarrow installed.
+
+        """
+        unknown: List[str] = [
+            out_format
+            for out_format in formats
+            if out_format not in REPORT_FORMATS
+        ]
+        if unknown:
+            raise FrewError(
+                f"""
+                Unknown report formats {unknown}, please use any of
+                {list(REPORT_FORMATS.keys())}.
+            """
+            )
+        if parallel not in (None, "thread", "process"):
+            raise FrewError(
+                f"Parallel must be 'thread' or 'process', not {parallel}."
+            )
+        if "parquet" in formats and pyarrow is None:
+            raise FrewError(
+                """
+                Writing parquet requires the optional pyarrow library, please
+                install it with `pip install pyarrow`.
+            """
+            )
+
+        out_paths: Dict[str, str] = {
+            out_format: os.path.join(
+                self.out_folder,
+                f"{self.file_stem}.{REPORT_FORMATS[out_format]}",
+            )
+            for out_format in dict.fromkeys(formats)
+        }
+        report_data: dict = self.report_data
+        if parallel is None:
+            for out_format, out_path in out_paths.items():
+                _write_format(
+                    out_format, out_path, report_data, compact, self.dtype
+                )
+            return out_paths
+
+        max_workers: int = workers or len(out_paths)
+        executor: Executor
+        if parallel == "thread":
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        else:
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers, initializer=init_worker
+            )
+        with executor:
+            futures = [
+                executor.submit(
+                    _write_format,
+                    out_format,
+                    out_path,
+                    report_data,
+                    compact,
+                    self.dtype,
+                )
+                for out_format, out_path in out_paths.items()
+            ]
+            for future in futures:
+                future.result()
+        return out_paths
+
+
+def _write_format(
+    out_format: str,
+    out_path: str,
+    report_data: dict,
+    compact: bool,
+    dtype: str,
+) -> None:
+    try:
+        if out_format == "excel":
+            Wall.write_excel(out_path, report_data)
+        elif out_format == "pdf":
+            Wall.write_pdf(out_path, report_data)
+        elif out_format == "html":
+            Wall.write_html(out_path, report_data, compact, False)
+        elif out_format == "csv":
+            _get_table(report_data, dtype).to_csv(out_path, index=False)
+        else:
+            _get_table(report_data, dtype).to_parquet(out_path, index=False)
+    except PermissionError:
+        raise FrewError(
+            f"Please make sure {os.path.basename(out_path)} is closed first."
+        )
+
+
+def _get_table(report_data: dict, dtype: str) -> pd.DataFrame:
+    num_nodes: int = len(report_data["node_levels"])
+    tables: List[pd.DataFrame] = []
+    for stage in range(report_data["num_stages"]):
+        for design_case in report_data["design_cases"]:
+            stage_results = report_data["wall_results"][stage][design_case]
+            tables.append(
+                pd.DataFrame(
+                    {
+                        "Stage": stage,
+                        "Design case": design_case,
+                        "Node #": range(1, num_nodes + 1),
+                        "Node levels (m)": report_data["node_levels"],
+                        "Bending (kNm/m)": stage_results["bending"],
+                        "Shear (kN/m)": stage_results["shear"],
+                        "Displacement (mm)": stage_results["displacement"],
+                    }
+                )
+            )
+    table: pd.DataFrame = pd.concat(tables, ignore_index=True)
+    result_columns: List[str] = [
+        "Bending (kNm/m)",
+        "Shear (kN/m)",
+        "Displacement (mm)",
+    ]
+    table[result_columns] = table[result_columns].astype(dtype)
+    return table
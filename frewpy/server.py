@@ -0,0 +1,282 @@
+"""
+Server
+======
+
+This module holds the class `ModelServer`, a local HTTP service with a JSON
+API serving the titles, stages, results, envelopes and plot data of the Frew
+models in a folder. Recently used models are kept loaded in a `ModelCache`,
+along with their result arrays, so repeated requests do not read and parse the
+model again.
+
+"""
+
+import os
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple, Union, cast
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np  # type: ignore
+
+from frewpy.cache import ModelCache
+from frewpy.frew_model import FrewModel
+from frewpy.utils import (
+    NODE_RESULT_FIELDS,
+    get_design_case_names,
+    get_stage_names,
+    get_titles,
+)
+from frewpy.models.exceptions import FrewError, NodeError
+
+
+class ModelServer:
+    """ A class used to serve the Frew models in a folder over a local HTTP
+    JSON API.
+
+    Requests are GET requests with the model given by its path within the
+    folder, e.g. `/results?model=site/section_1.json&fields=bending`. The
+    endpoints are:
+
+    - `/titles`: the titles of the model.
+    - `/stages`: the names of the stages.
+    - `/results`: the node results, optionally selecting `fields`, `stages`,
+      `cases` and `nodes` as comma separated lists. Nodes can also be a
+      range such as `0:10`.
+    - `/envelopes`: the maximum and minimum wall results of each design case.
+    - `/plot`: the titles, stage names, node levels, wall results and
+      envelopes used to plot the model.
+    - `/status`: the statistics of the model cache, see
+      `ModelCache.get_stats`.
+
+    ...
+
+    Attributes
+    ----------
+    folder_path : str
+        The folder of json Frew models to serve.
+    host : str
+        The address to listen on, defaults to the local machine only.
+    port : int
+        The port to listen on, defaults to 8765. Use 0 for any free port.
+    cache : ModelCache
+        The cache of loaded models. A new cache with a budget of 512MB is
+        used if not given.
+
+    """
+
+    def __init__(
+        self,
+        folder_path: str,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        cache: ModelCache = None,
+    ) -> None:
+        if not os.path.isdir(folder_path):
+            raise FrewError(f"Folder {folder_path} does not exist.")
+        self.folder_path: str = os.path.realpath(folder_path)
+        self.cache: ModelCache = ModelCache() if cache is None else cache
+        self._httpd = _ModelHTTPServer((host, port), _RequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.model_server = self
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """ The host and port the server is listening on.
+
+        """
+        host, port = self._httpd.server_address[:2]
+        return cast(str, host), cast(int, port)
+
+    def serve_forever(self) -> None:
+        """ Method to handle requests until `shutdown` is called.
+
+        """
+        self._httpd.serve_forever()
+
+    def shutdown(self) -> None:
+        """ Method to stop the server and close its socket.
+
+        """
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def handle(
+        self, endpoint: str, query: Dict[str, List[str]]
+    ) -> Tuple[int, dict]:
+        """ Method to answer a request without going through HTTP.
+
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint requested, e.g. '/results'.
+        query : Dict[str, List[str]]
+            The query parameters, as parsed by `urllib.parse.parse_qs`.
+
+        Returns
+        -------
+        status : int
+            The HTTP status code.
+        payload : dict
+            The response, holding an 'error' message if the request failed.
+
+        """
+        if endpoint == "/status":
+            return 200, self.cache.get_stats()
+        handlers = {
+            "/titles": self._get_titles,
+            "/stages": self._get_stages,
+            "/results": self._get_results,
+            "/envelopes": self._get_envelopes,
+            "/plot": self._get_plot,
+        }
+        if endpoint not in handlers:
+            return 404, {"error": f"Unknown endpoint {endpoint}."}
+        try:
+            model = self.cache.get(self._get_model_path(query))
+            return 200, handlers[endpoint](model, query)
+        except FileNotFoundError:
+            return 404, {"error": "Model not found."}
+        except (FrewError, NodeError, ValueError, IndexError) as error:
+            return 400, {"error": " ".join(str(error).split())}
+        except Exception as error:
+            # Anything else is a fault in the model or the server, the
+            # client still gets a JSON body rather than a dropped connection.
+            return 500, {"error": f"{type(error).__name__}: {error}"}
+
+    def _get_model_path(self, query: Dict[str, List[str]]) -> str:
+        if "model" not in query:
+            raise FrewError("Please give the model to query.")
+        file_path: str = os.path.realpath(
+            os.path.join(self.folder_path, query["model"][0])
+        )
+        # Only models within the served folder can be read.
+        if os.path.commonpath([file_path, self.folder_path]) != (
+            self.folder_path
+        ):
+            raise FrewError("The model must be within the served folder.")
+        return file_path
+
+    def _get_titles(
+        self, model: FrewModel, query: Dict[str, List[str]]
+    ) -> dict:
+        return get_titles(model.json_data)
+
+    def _get_stages(
+        self, model: FrewModel, query: Dict[str, List[str]]
+    ) -> dict:
+        return {"stages": get_stage_names(model.json_data)}
+
+    def _get_results(
+        self, model: FrewModel, query: Dict[str, List[str]]
+    ) -> dict:
+        fields: List[str] = _get_list(query, "fields") or [
+            "shear",
+            "bending",
+            "displacement",
+        ]
+        unknown = [
+            field for field in fields if field not in NODE_RESULT_FIELDS
+        ]
+        if unknown:
+            raise FrewError(f"Unknown result fields {unknown}.")
+        design_cases: List[str] = get_design_case_names(model.json_data)
+        cases: List[str] = _get_list(query, "cases") or design_cases
+        missing = [case for case in cases if case not in design_cases]
+        if missing:
+            raise FrewError(f"Unknown design cases {missing}.")
+        stages = [int(stage) for stage in _get_list(query, "stages")] or None
+        nodes = _get_nodes(query)
+
+        arrays = model.wall._get_result_arrays(fields)
+        case_index: List[int] = [design_cases.index(case) for case in cases]
+        results: Dict[str, list] = {}
+        for field, values in arrays.items():
+            values = values[:, case_index]
+            if stages is not None:
+                values = values[stages]
+            if nodes is not None:
+                values = values[..., nodes]
+            results[field] = values.tolist()
+        return {"cases": cases, "results": results}
+
+    def _get_envelopes(
+        self, model: FrewModel, query: Dict[str, List[str]]
+    ) -> dict:
+        arrays = model.wall._get_result_arrays(
+            ["shear", "bending", "displacement"]
+        )
+        return {
+            case: {
+                extreme: {
+                    field: function(values[:, index], axis=0).tolist()
+                    for field, values in arrays.items()
+                }
+                for extreme, function in [
+                    ("maximum", np.max),
+                    ("minimum", np.min),
+                ]
+            }
+            for index, case in enumerate(
+                get_design_case_names(model.json_data)
+            )
+        }
+
+    def _get_plot(self, model: FrewModel, query: Dict[str, List[str]]) -> dict:
+        arrays = model.wall._get_result_arrays(
+            ["shear", "bending", "displacement"]
+        )
+        return {
+            "titles": get_titles(model.json_data),
+            "stage names": get_stage_names(model.json_data),
+            "design cases": get_design_case_names(model.json_data),
+            "node levels": model.wall.get_node_levels(),
+            "results": {
+                field: values.tolist() for field, values in arrays.items()
+            },
+            "envelopes": self._get_envelopes(model, query),
+        }
+
+
+def _get_list(query: Dict[str, List[str]], key: str) -> List[str]:
+    return [
+        item.strip()
+        for value in query.get(key, [])
+        for item in value.split(",")
+        if item.strip()
+    ]
+
+
+def _get_nodes(query: Dict[str, List[str]]) -> Union[slice, List[int], None]:
+    nodes: List[str] = _get_list(query, "nodes")
+    if not nodes:
+        return None
+    if len(nodes) == 1 and ":" in nodes[0]:
+        start, stop = nodes[0].split(":", 1)
+        return slice(
+            int(start) if start else None, int(stop) if stop else None
+        )
+    return [int(node) for node in nodes]
+
+
+class _ModelHTTPServer(ThreadingHTTPServer):
+    model_server: ModelServer
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: _ModelHTTPServer
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        status, payload = self.server.model_server.handle(
+            url.path, parse_qs(url.query)
+        )
+        body: bytes = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        # Requests are not logged to keep the console quiet.
+        pass
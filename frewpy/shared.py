@@ -0,0 +1,217 @@
+"""
+Shared
+======
+
+This module holds the classes `SharedResults` and `SharedHandle` which share
+result arrays with worker processes through shared memory, so that the
+workers read the arrays in place rather than each receiving a pickled copy.
+
+"""
+
+import ctypes
+import weakref
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, Dict, Sequence, Tuple, Union, cast
+
+import numpy as np  # type: ignore
+
+from frewpy.utils import NODE_RESULT_FIELDS
+from frewpy.models.exceptions import FrewError
+
+# The models use shared results when plotting, so are only imported here for
+# type checking.
+if TYPE_CHECKING:
+    from frewpy.frew_model import FrewModel  # noqa: F401
+
+
+# Arrays are placed at multiples of this many bytes within the shared block.
+_ALIGNMENT: int = 64
+
+# The blocks attached to by this process, which stay open while any of their
+# arrays are in use.
+_attached: "weakref.WeakValueDictionary[str, _Block]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+class SharedHandle:
+    """ A class used to find a block of shared result arrays from another
+    process. Handles are small, so sending one to a worker process costs the
+    same however large the arrays are.
+
+    ...
+
+    Attributes
+    ----------
+    name : str
+        The name of the shared memory block.
+    layout : Dict[str, Tuple[int, Tuple[int, ...], str]]
+        The byte offset, shape and data type of each array in the block.
+
+    """
+
+    def __init__(
+        self, name: str, layout: Dict[str, Tuple[int, Tuple[int, ...], str]]
+    ) -> None:
+        self.name: str = name
+        self.layout: Dict[str, Tuple[int, Tuple[int, ...], str]] = layout
+
+    def attach(self) -> Dict[str, np.ndarray]:
+        """ Method to get the shared arrays without copying them. The arrays
+        are read only, and stay valid for as long as they, or arrays taken
+        from them, are referenced, even once the `SharedResults` which
+        published them is closed.
+
+        Returns
+        -------
+        arrays : Dict[str, np.ndarray]
+            The shared array of each field.
+
+        Raises
+        ------
+        FrewError
+            If the block has been closed before it was attached to.
+
+        """
+        block: Union[_Block, None] = _attached.get(self.name)
+        if block is None:
+            try:
+                block = _Block(SharedMemory(self.name))
+            except FileNotFoundError:
+                raise FrewError(
+                    f"The shared results {self.name} have been closed."
+                )
+            _attached[self.name] = block
+        return block.get_arrays(self.layout, readonly=True)
+
+
+class SharedResults:
+    """ A class used to publish result arrays into a block of shared memory,
+    for worker processes to read through its `handle`.
+
+    The block is removed when the `SharedResults` is closed, used as a
+    context manager or garbage collected, whichever comes first. Processes
+    which have already attached keep their arrays for as long as they use
+    them.
+
+    ...
+
+    Attributes
+    ----------
+    handle : SharedHandle
+        The picklable handle to send to worker processes.
+
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]) -> None:
+        layout: Dict[str, Tuple[int, Tuple[int, ...], str]] = {}
+        size: int = 0
+        for field, values in arrays.items():
+            values = np.asarray(values)
+            layout[field] = (size, values.shape, values.dtype.str)
+            size += -(-values.nbytes // _ALIGNMENT) * _ALIGNMENT
+        memory = SharedMemory(create=True, size=max(size, 1))
+        self._finalizer = weakref.finalize(self, memory.unlink)
+        self._block: _Block = _Block(memory)
+        for field, view in self._block.get_arrays(layout).items():
+            view[...] = arrays[field]
+        self.handle = SharedHandle(memory.name, layout)
+
+    @classmethod
+    def from_model(
+        cls, model: "FrewModel", fields: Sequence[str] = None
+    ) -> "SharedResults":
+        """ Method to publish the node results, node levels and strut forces
+        of a model, in the data type of its result arrays.
+
+        Parameters
+        ----------
+        model : FrewModel
+            The model with results to publish.
+        fields : Sequence[str], optional
+            The node results to publish, any of the keys of
+            `utils.NODE_RESULT_FIELDS`. Defaults to all of them.
+
+        Returns
+        -------
+        shared_results : SharedResults
+            The published arrays, with shape (num stages, num design cases,
+            num nodes) for the node results, (num nodes) for 'node_levels'
+            and (num stages, num design cases, num struts) for
+            'strut_force'.
+
+        """
+        if fields is None:
+            fields = list(NODE_RESULT_FIELDS)
+        arrays: Dict[str, np.ndarray] = dict(
+            model.wall._get_result_arrays(fields)
+        )
+        arrays["node_levels"] = np.array(model.wall.get_node_levels())
+        arrays["strut_force"] = model.strut.get_strut_forces()
+        return cls(arrays)
+
+    @property
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """ The shared arrays, read only, as seen by the workers.
+
+        """
+        return self._block.get_arrays(self.handle.layout, readonly=True)
+
+    def close(self) -> None:
+        """ Method to remove the shared memory block. Workers can no longer
+        attach to it, but keep the arrays they have already attached to.
+
+        """
+        self._finalizer()
+
+    def __enter__(self) -> "SharedResults":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class _Block:
+    # Numpy does not keep a buffer it is given locked, so the memory could be
+    # closed under its arrays. Each array is instead made from an object
+    # referencing the block, keeping it open until the last array, or any
+    # array taken from it, is garbage collected.
+    def __init__(self, memory: SharedMemory) -> None:
+        self.memory: SharedMemory = memory
+        # The buffer is only None once the memory is closed.
+        self._pointer = ctypes.c_char.from_buffer(cast(memoryview, memory.buf))
+        self.address: int = ctypes.addressof(self._pointer)
+
+    def get_arrays(
+        self,
+        layout: Dict[str, Tuple[int, Tuple[int, ...], str]],
+        readonly: bool = False,
+    ) -> Dict[str, np.ndarray]:
+        return {
+            field: np.asarray(
+                _ArraySource(self, offset, shape, dtype, readonly)
+            )
+            for field, (offset, shape, dtype) in layout.items()
+        }
+
+    def __del__(self) -> None:
+        del self._pointer
+        self.memory.close()
+
+
+class _ArraySource:
+    def __init__(
+        self,
+        block: _Block,
+        offset: int,
+        shape: Tuple[int, ...],
+        dtype: str,
+        readonly: bool,
+    ) -> None:
+        self.block: _Block = block
+        self.__array_interface__: Dict[str, Any] = {
+            "version": 3,
+            "shape": tuple(shape),
+            "typestr": dtype,
+            "data": (block.address + offset, readonly),
+        }
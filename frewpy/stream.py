@@ -0,0 +1,268 @@
+"""
+Stream
+======
+
+This module holds functions which read Frew json models as a stream of bytes,
+finding the top level sections of a model without parsing all of it. Frew
+saves the small header sections before the large stages and results, so the
+header can be read from the first few kilobytes of a model.
+
+"""
+
+import re
+import json
+import shutil
+from typing import IO, Dict, Iterable, Iterator, List, Tuple, Union
+
+from frewpy.models.exceptions import FrewError
+from frewpy.utils import (
+    check_json_path,
+    open_model,
+    get_titles,
+    get_file_history,
+    get_file_version,
+    get_frew_version,
+    get_stage_names,
+)
+
+
+_QUOTE, _BACKSLASH, _COLON, _COMMA = b'"', b"\\", b":", b","
+_STRING_END = re.compile(rb'["\\]')
+_NESTED_TOKEN = re.compile(rb'["{}\[\]]')
+_TOP_LEVEL_TOKEN = re.compile(rb'["{}\[\],:]')
+_SPACE = b" \t\n\r"
+
+
+def scan_members(
+    file: IO[bytes], capture: Iterable[str] = (), chunk_size: int = 16384
+) -> Iterator[Tuple[str, int, int, Union[bytes, None]]]:
+    """ Scans the top level members of a json object in a binary file,
+    reading it in chunks for only as long as the caller asks for members.
+
+    Parameters
+    ----------
+    file : IO[bytes]
+        The json file opened in binary mode, at the start of the object.
+    capture : Iterable[str], optional
+        The keys of the members to return the value bytes of.
+    chunk_size : int, optional
+        The number of bytes read from the file at once.
+
+    Yields
+    ------
+    member : Tuple[str, int, int, Union[bytes, None]]
+        The key of each member, the byte offsets the value starts after and
+        ends before, which may include whitespace, and the value bytes if
+        the key was captured.
+
+    """
+    capture = set(capture)
+    depth: int = 0
+    in_string: bool = False
+    carry: int = 0
+    string_parts: List[bytes] = []
+    last_string: bytes = b""
+    key: Union[str, None] = None
+    value_start: int = 0
+    captured: Union[List[bytes], None] = None
+    capture_from: int = 0
+    offset: int = 0
+    while True:
+        chunk: bytes = file.read(chunk_size)
+        if not chunk:
+            return
+        num_bytes: int = len(chunk)
+        # An escaped character split from its backslash by the chunk.
+        if carry and in_string and depth == 1:
+            string_parts.append(chunk[:carry])
+        pos: int = carry
+        carry = 0
+        while pos < num_bytes:
+            if in_string:
+                match = _STRING_END.search(chunk, pos)
+                if match is None:
+                    if depth == 1:
+                        string_parts.append(chunk[pos:])
+                    pos = num_bytes
+                    break
+                index: int = match.start()
+                if chunk[index : index + 1] == _BACKSLASH:
+                    if depth == 1:
+                        string_parts.append(chunk[pos : index + 2])
+                    pos = index + 2
+                    continue
+                if depth == 1:
+                    string_parts.append(chunk[pos:index])
+                    last_string = b"".join(string_parts)
+                    string_parts = []
+                in_string = False
+                pos = index + 1
+                continue
+
+            # Commas and colons only matter between the top level members.
+            token = _TOP_LEVEL_TOKEN if depth == 1 else _NESTED_TOKEN
+            match = token.search(chunk, pos)
+            if match is None:
+                pos = num_bytes
+                break
+            index = match.start()
+            char: bytes = chunk[index : index + 1]
+            pos = index + 1
+            if char == _QUOTE:
+                in_string = True
+            elif char in b"{[":
+                depth += 1
+            elif char == _COLON:
+                key = json.loads(b'"' + last_string + b'"')
+                value_start = offset + pos
+                if key in capture:
+                    captured, capture_from = [], pos
+            elif char == _COMMA or (char in b"}]" and depth == 1):
+                if key is not None:
+                    value: Union[bytes, None] = None
+                    if captured is not None:
+                        captured.append(chunk[capture_from:index])
+                        value = b"".join(captured)
+                        captured = None
+                    yield key, value_start, offset + index, value
+                    key = None
+                if char != _COMMA:
+                    return
+            else:
+                depth -= 1
+        if pos > num_bytes:
+            carry = pos - num_bytes
+        if captured is not None:
+            captured.append(chunk[capture_from:])
+            capture_from = 0
+        offset += num_bytes
+
+
+def splice_members(
+    source_path: str,
+    out_file: IO[bytes],
+    values: Dict[str, bytes],
+    chunk_size: int = 1048576,
+) -> None:
+    """ Writes a json file with the values of some of its top level members
+    replaced, copying the bytes of every other member unchanged. The source
+    is only scanned up to the last member replaced, and is read forwards
+    only, so compressed sources are decompressed once.
+
+    Parameters
+    ----------
+    source_path : str
+        Absolute file path to the json file to copy, which may be
+        compressed.
+    out_file : IO[bytes]
+        The file to write the spliced json to, opened in binary mode.
+    values : Dict[str, bytes]
+        The serialised value of each top level member to replace. The
+        whitespace around the original values is kept.
+    chunk_size : int, optional
+        The number of bytes copied from the source at once.
+
+    Raises
+    ------
+    FrewError
+        If a member to replace is not in the source.
+
+    """
+    remaining = set(values)
+    with open_model(source_path) as scan_file, open_model(
+        source_path
+    ) as copy_file:
+        position: int = 0
+        if remaining:
+            for key, start, end, _ in scan_members(scan_file):
+                if key not in remaining:
+                    continue
+                _copy_bytes(copy_file, out_file, start - position, chunk_size)
+                head: bytes = copy_file.read(min(end - start, 64))
+                tail_start: int = max(start + len(head), end - 64)
+                _skip_bytes(copy_file, tail_start - start - len(head))
+                tail: bytes = (head + copy_file.read(end - tail_start))[-64:]
+                out_file.write(head[: len(head) - len(head.lstrip(_SPACE))])
+                out_file.write(values[key])
+                out_file.write(tail[len(tail.rstrip(_SPACE)) :])
+                position = end
+                remaining.discard(key)
+                if not remaining:
+                    break
+        if remaining:
+            raise FrewError(
+                f"No section called {sorted(remaining)[0]} in the model."
+            )
+        shutil.copyfileobj(copy_file, out_file, chunk_size)
+
+
+def _copy_bytes(
+    in_file: IO[bytes], out_file: IO[bytes], num_bytes: int, chunk_size: int
+) -> None:
+    while num_bytes > 0:
+        chunk: bytes = in_file.read(min(num_bytes, chunk_size))
+        if not chunk:
+            return
+        out_file.write(chunk)
+        num_bytes -= len(chunk)
+
+
+def _skip_bytes(in_file: IO[bytes], num_bytes: int) -> None:
+    while num_bytes > 0:
+        chunk: bytes = in_file.read(min(num_bytes, 1048576))
+        if not chunk:
+            return
+        num_bytes -= len(chunk)
+
+
+def peek(
+    file_path: str, stages: bool = False
+) -> Dict[str, Union[str, int, list, dict]]:
+    """ Reads the header of a json Frew model without reading the rest of
+    the file.
+
+    Parameters
+    ----------
+    file_path : str
+        Absolute file path to the json Frew model, which may be compressed.
+    stages : bool, optional
+        Whether to also read the stages, to return the stage names and the
+        number of stages. The results are still not read. Defaults to False.
+
+    Returns
+    -------
+    header : Dict[str, Union[str, int, list, dict]]
+        The 'titles', 'file history', 'file version' and 'frew version' of
+        the model, as returned by `FrewModel.get`, and the 'stage names' and
+        'num stages' if requested.
+
+    Raises
+    ------
+    FrewError
+        If the file is not a json file or the header is incomplete.
+
+    """
+    check_json_path(file_path)
+    keys = {"OasysHeader", "File history"}
+    if stages:
+        keys.add("Stages")
+    json_data: Dict[str, list] = {}
+    with open_model(file_path) as file:
+        for key, _, _, value in scan_members(file, keys):
+            # Only the captured keys are read with their value.
+            if value is not None:
+                json_data[key] = json.loads(value)
+                if len(json_data) == len(keys):
+                    break
+
+    header: Dict[str, Union[str, int, list, dict]] = {
+        "titles": get_titles(json_data),
+        "file history": get_file_history(json_data),
+        "file version": get_file_version(json_data),
+        "frew version": get_frew_version(json_data),
+    }
+    if stages:
+        stage_names: List[str] = get_stage_names(json_data)
+        header["stage names"] = stage_names
+        header["num stages"] = len(stage_names)
+    return header
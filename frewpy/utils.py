@@ -10,7 +10,10 @@ output and functionality consistent where needed.
 
 import json
 import os
-from typing import Dict, List
+import gzip
+import shutil
+import hashlib
+from typing import IO, Dict, List, Sequence, Tuple, Type, Union, cast
 
 import numpy as np  # type: ignore
 from comtypes.client import CreateObject  # type: ignore
@@ -18,6 +21,47 @@ from _ctypes import COMError  # type: ignore
 
 from frewpy.models.exceptions import FrewError, NodeError
 
+try:
+    import zstandard  # type: ignore
+except ImportError:
+    zstandard = None
+
+
+# The data types result arrays can be stored as. Results are converted to
+# frewpy units in float64 before being rounded to float32, so each float32
+# value is within a relative error of `FLOAT32_RELATIVE_ERROR` of the float64
+# value.
+RESULT_DTYPES: Tuple[str, ...] = ("float64", "float32")
+FLOAT32_RELATIVE_ERROR: float = 2.0 ** -24
+
+# The extensions of json Frew models, plain or compressed with gzip or
+# zstandard. Frew itself only opens plain json models.
+JSON_EXTENSIONS: Tuple[str, ...] = (".json", ".json.gz", ".json.zst")
+
+# The errors raised when loading a model which is not valid json, does not
+# hold a json object, or whose compressed data is corrupt or cut short.
+MODEL_READ_ERRORS: Tuple[Type[Exception], ...] = (
+    FrewError,
+    ValueError,
+    OSError,
+    EOFError,
+)
+if zstandard is not None:
+    MODEL_READ_ERRORS += (zstandard.ZstdError,)
+
+
+# Maps the frewpy name of a node result to its key within the Frew
+# `Noderesults` records and the factor converting it to frewpy units.
+NODE_RESULT_FIELDS: Dict[str, Tuple[str, float]] = {
+    "shear": ("Shear", 1e-3),
+    "bending": ("Bending", 1e-3),
+    "displacement": ("Displacement", 1e3),
+    "water_left": ("ULeft", 1e-3),
+    "water_right": ("URight", 1e-3),
+    "soil_left": ("PeLeft", 1e-3),
+    "soil_right": ("PeRight", 1e-3),
+}
+
 
 def _check_frew_path(file_path) -> None:
     if not isinstance(file_path, str):
@@ -28,13 +72,17 @@ def _check_frew_path(file_path) -> None:
         raise FrewError("Path must be to a valid Frew model.")
 
 
-def model_to_json(file_path) -> str:
-    """ Converts a `.fwd` Frew model to a `.json` Frew model.
+def model_to_json(file_path, json_path: str = None) -> str:
+    """ Converts a `.fwd` Frew model to a `.json` Frew model. The `.fwd`
+    model is never changed, even if the conversion fails.
 
     Parameters
     ----------
     file_path : str
         Absolute file path to the '.fwd' Frew model.
+    json_path : str, optional
+        Absolute file path to save the json file at, defaults to the file
+        path of the '.fwd' model with a '.json' extension.
 
     Returns
     -------
@@ -43,18 +91,22 @@ def model_to_json(file_path) -> str:
 
     """
     _check_frew_path(file_path)
-    json_path: str = f'{file_path.rsplit(".", 1)[0]}.json'
+    if json_path is None:
+        json_path = f'{file_path.rsplit(".", 1)[0]}.json'
     try:
         model = CreateObject("frewLib.FrewComAuto")
     except OSError:
-        os.remove(file_path)
         raise FrewError("Failed to create a COM object.")
     try:
         model.Open(file_path)
     except COMError:
         raise FrewError("Failed to open the Frew model.")
-    model.SaveAs(json_path)
-    model.Close()
+    try:
+        model.SaveAs(json_path)
+    except COMError:
+        raise FrewError("Failed to save the Frew model as json.")
+    finally:
+        model.Close()
     return json_path
 
 
@@ -81,31 +133,183 @@ def check_json_path(file_path: str) -> None:
         )
     if not os.path.exists(file_path):
         raise FrewError("Frew model file path does not exists.")
-    if not file_path.lower().endswith(".json"):
+    if get_json_extension(file_path) is None:
         raise FrewError(
             """
-            File extension must be a .json. Please use model_to_json to
-            convert it. Import this function from frewpy.utils.
+            File extension must be a .json, .json.gz or .json.zst. Please use
+            model_to_json to convert it. Import this function from
+            frewpy.utils.
         """
         )
 
 
-def load_data(file_path: str) -> Dict[str, list]:
-    """ Loads the json file in as a Python dictionary.
+def get_json_extension(file_path: str) -> Union[str, None]:
+    """ Gets the extension of a json Frew model, including the compression
+    extension if it is compressed.
+
+    Parameters
+    ----------
+    file_path : str
+        File path to the Frew model.
+
+    Returns
+    -------
+    extension : Union[str, None]
+        One of `JSON_EXTENSIONS`, in lower case, or None if the path is not
+        to a json Frew model.
+
+    """
+    for extension in sorted(JSON_EXTENSIONS, key=len, reverse=True):
+        if file_path.lower().endswith(extension):
+            return extension
+    return None
+
+
+def strip_json_extension(file_path: str) -> str:
+    """ Removes the extension of a json Frew model from its path, including
+    the compression extension if it is compressed.
+
+    Parameters
+    ----------
+    file_path : str
+        File path to the Frew model.
+
+    Returns
+    -------
+    stem : str
+        The file path without its extension.
+
+    """
+    extension: Union[str, None] = get_json_extension(file_path)
+    if extension is None:
+        return file_path
+    return file_path[: -len(extension)]
+
+
+def open_model(file_path: str, mode: str = "rb") -> IO[bytes]:
+    """ Opens a json Frew model as a binary stream, decompressing or
+    compressing it as it is read or written according to its extension.
 
     Parameters
     ----------
     file_path : str
         Absolute file path to the Frew model.
+    mode : str, optional
+        Either 'rb' or 'wb', defaults to 'rb'.
+
+    Returns
+    -------
+    file : IO[bytes]
+        The opened file, to be closed by the caller.
+
+    Raises
+    ------
+    FrewError
+        If the model is compressed with zstandard but the optional
+        `zstandard` library is not installed.
+
+    """
+    extension: Union[str, None] = get_json_extension(file_path)
+    if extension == ".json.gz":
+        # The mode is only known to be binary at runtime.
+        return cast(IO[bytes], gzip.open(file_path, mode, compresslevel=6))
+    if extension == ".json.zst":
+        if zstandard is None:
+            raise FrewError(
+                "Models compressed with zstandard require the zstandard "
+                "library, please install it with `pip install zstandard`."
+            )
+        return zstandard.open(file_path, mode)
+    return open(file_path, mode)
+
+
+def load_data(file_path: str, interner=None) -> Dict[str, list]:
+    """ Loads the json file in as a Python dictionary. Compressed models are
+    decompressed as they are read.
+
+    Parameters
+    ----------
+    file_path : str
+        Absolute file path to the Frew model.
+    interner : Interner, optional
+        Shares the keys and repeated values of the model with the other
+        models loaded with the same `frewpy.interner.Interner`, using less
+        memory when many models are kept loaded. Parsing is slightly slower.
 
     Returns
     -------
     json_data : Dict[str, list]
         A Python dictionary of the data held within the json model file.
 
+    Raises
+    ------
+    FrewError
+        If the json file does not hold an object.
+
+    """
+    with open_model(file_path) as file:
+        if interner is None:
+            json_data = json.loads(file.read())
+        else:
+            json_data = json.loads(
+                file.read(),
+                object_pairs_hook=interner.object_pairs_hook,
+                parse_float=interner.parse_float,
+            )
+    if not isinstance(json_data, dict):
+        raise FrewError(f"The file {file_path} does not hold a Frew model.")
+    return json_data
+
+
+def copy_model(file_path: str, out_path: str) -> str:
+    """ Copies a json Frew model, decompressing or compressing it in chunks
+    according to the extensions of the two paths. For example, a compressed
+    model can be copied to a plain `.json` model for Frew to open.
+
+    Parameters
+    ----------
+    file_path : str
+        Absolute file path to the Frew model.
+    out_path : str
+        Absolute file path to save the copy at.
+
+    Returns
+    -------
+    out_path : str
+        The file path of the copy.
+
+    """
+    check_json_path(file_path)
+    if get_json_extension(out_path) is None:
+        raise FrewError(
+            "The copy must be saved as a .json, .json.gz or .json.zst file."
+        )
+    with open_model(file_path) as in_file, open_model(
+        out_path, "wb"
+    ) as out_file:
+        shutil.copyfileobj(in_file, out_file, 1048576)
+    return out_path
+
+
+def get_file_hash(file_path: str) -> str:
+    """ Gets the SHA-1 hash of the contents of a file, reading it in chunks.
+
+    Parameters
+    ----------
+    file_path : str
+        Absolute file path to the file.
+
+    Returns
+    -------
+    file_hash : str
+        The hexadecimal SHA-1 hash of the file.
+
     """
-    with open(file_path) as file:
-        return json.loads(file.read())
+    file_hash = hashlib.sha1()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
 
 
 def clear_results(json_data: dict) -> dict:
@@ -328,3 +532,296 @@ def check_results_present(json_data: dict):
             No results in the model, please analyse the model first.
         """
         )
+
+
+def check_result_dtype(dtype: str) -> None:
+    """ Checks whether results can be stored as a data type.
+
+    Parameters
+    ----------
+    dtype : str
+        The data type, one of `RESULT_DTYPES`.
+
+    Raises
+    ------
+    FrewError
+        If the data type is not one of `RESULT_DTYPES`.
+
+    """
+    if dtype not in RESULT_DTYPES:
+        raise FrewError(
+            f"Results can be stored as {' or '.join(RESULT_DTYPES)}, "
+            f"not {dtype}."
+        )
+
+
+def get_float32_error(results: Dict[str, np.ndarray]) -> Dict[str, float]:
+    """ Returns the largest error from storing each result array as float32,
+    in the units of the results.
+
+    The error of each value is at most `FLOAT32_RELATIVE_ERROR`, about 6e-8,
+    of its magnitude. In frewpy units this is below 0.0001 kN/m, kNm/m, kN/m
+    and kPa for shear, bending, strut forces and pressures under 1,600, and
+    below 0.0001 mm for displacements under 1,600 mm. Maximums and minimums
+    are found exactly from the stored values, so envelopes and extremes have
+    the same error as the values themselves.
+
+    Parameters
+    ----------
+    results : Dict[str, np.ndarray]
+        The result arrays for each field.
+
+    Returns
+    -------
+    errors : Dict[str, float]
+        The bound on the error of each field.
+
+    """
+    return {
+        field: float(np.abs(np.nan_to_num(values)).max(initial=0.0))
+        * FLOAT32_RELATIVE_ERROR
+        for field, values in results.items()
+    }
+
+
+def get_node_results(
+    json_data: dict,
+    fields: Sequence[str],
+    stages: Sequence[int] = None,
+    design_cases: Sequence[str] = None,
+    nodes: Union[slice, Sequence[int]] = None,
+    dtype: str = "float64",
+) -> Dict[str, np.ndarray]:
+    """ Returns node results from the Frew model as arrays, converted to
+    frewpy units (kN/m, kNm/m, mm and kPa). Only the records of the requested
+    stages, design cases and nodes are read.
+
+    Parameters
+    ----------
+    json_data : dict
+        A Python dictionary of the data held within the json model file.
+    fields : Sequence[str]
+        The results to extract. Options are the keys of
+        `NODE_RESULT_FIELDS`: 'shear', 'bending', 'displacement',
+        'water_left', 'water_right', 'soil_left', 'soil_right'.
+    stages : Sequence[int], optional
+        The stage numbers to extract, all stages if not provided.
+    design_cases : Sequence[str], optional
+        The names of the design cases to extract, all design cases if not
+        provided.
+    nodes : Union[slice, Sequence[int]], optional
+        The node indices (from 0) to extract, all nodes if not provided.
+    dtype : str, optional
+        The data type of the arrays, 'float64' or 'float32' to halve their
+        memory within the error given by `get_float32_error`. Defaults to
+        'float64'.
+
+    Returns
+    -------
+    node_results : Dict[str, np.ndarray]
+        An array for each field with shape (num stages, num design cases,
+        num nodes) of the selection.
+
+    Raises
+    ------
+    FrewError
+        If there are no results in the model, or a field, stage, design case
+        or data type is not valid.
+
+    """
+    check_result_dtype(dtype)
+    check_results_present(json_data)
+    for field in fields:
+        if field not in NODE_RESULT_FIELDS:
+            raise FrewError(f"{field} is not a valid result field.")
+    num_stages: int = get_num_stages(json_data)
+    if stages is None:
+        stages = range(num_stages)
+    for stage in stages:
+        if not 0 <= stage < num_stages:
+            raise FrewError(f"Stage {stage} is not in the model.")
+    all_design_cases: List[str] = get_design_case_names(json_data)
+    if design_cases is None:
+        design_cases = all_design_cases
+    for design_case in design_cases:
+        if design_case not in all_design_cases:
+            raise FrewError(f"No design case called {design_case}.")
+    case_indices: List[int] = [
+        all_design_cases.index(design_case) for design_case in design_cases
+    ]
+    node_indices: Sequence[int] = range(get_num_nodes(json_data))
+    if isinstance(nodes, slice):
+        node_indices = node_indices[nodes]
+    elif nodes is not None:
+        try:
+            node_indices = [node_indices[node] for node in nodes]
+        except IndexError:
+            raise FrewError("Node selection is outside the model's nodes.")
+
+    node_results: Dict[str, np.ndarray] = {
+        field: np.empty((len(stages), len(case_indices), len(node_indices)))
+        for field in fields
+    }
+    for case, case_index in enumerate(case_indices):
+        stage_results = json_data["Frew Results"][case_index]["Stageresults"]
+        for stage, stage_index in enumerate(stages):
+            node_records = stage_results[stage_index]["Noderesults"]
+            records = [node_records[node] for node in node_indices]
+            for field in fields:
+                key = NODE_RESULT_FIELDS[field][0]
+                node_results[field][stage, case] = [
+                    record[key] for record in records
+                ]
+    for field in fields:
+        node_results[field] *= NODE_RESULT_FIELDS[field][1]
+        node_results[field] = node_results[field].astype(dtype, copy=False)
+    return node_results
+
+
+def get_strut_forces(json_data: dict, dtype: str = "float64") -> np.ndarray:
+    """ Returns the strut forces for each stage and design case.
+
+    Parameters
+    ----------
+    json_data : dict
+        A Python dictionary of the data held within the json model file.
+    dtype : str, optional
+        The data type of the array, 'float64' or 'float32'. Defaults to
+        'float64'.
+
+    Returns
+    -------
+    strut_forces : np.ndarray
+        The strut forces (kN/m) with shape (num stages, num design cases,
+        num struts), which are NaN in the stages a strut is not installed
+        in.
+
+    """
+    check_result_dtype(dtype)
+    check_results_present(json_data)
+    num_stages: int = get_num_stages(json_data)
+    num_design_cases: int = get_num_design_cases(json_data)
+    struts: List[dict] = json_data.get("Struts", [])
+    num_struts: int = len(struts)
+
+    strut_forces = np.zeros((num_stages, num_design_cases, num_struts))
+    for case, result_set in enumerate(json_data["Frew Results"]):
+        for stage in range(num_stages):
+            strut_forces[stage, case] = [
+                strut["StrutForce"]
+                for strut in result_set["Stageresults"][stage]["Strutresults"]
+            ]
+    # Frew reports a force of 0 in the stages a strut is not installed in,
+    # which would otherwise be taken as its minimum force. A strut removed
+    # at a stage is not installed in it, and -1 is never removed.
+    stages = np.arange(num_stages)[:, np.newaxis]
+    stage_in = np.array([strut["StageIn"] for strut in struts])
+    stage_out = np.array([strut["StageOut"] for strut in struts])
+    installed = (stages >= stage_in) & ((stage_out < 0) | (stages < stage_out))
+    strut_forces = np.where(installed[:, np.newaxis], strut_forces, np.nan)
+    return (strut_forces / 1000).astype(dtype, copy=False)
+
+
+def get_all_results(
+    json_data: dict, dtype: str = "float64"
+) -> Dict[str, np.ndarray]:
+    """ Returns every node result field and the strut forces as arrays.
+
+    Parameters
+    ----------
+    json_data : dict
+        A Python dictionary of the data held within the json model file.
+    dtype : str, optional
+        The data type of the arrays, 'float64' or 'float32'. Defaults to
+        'float64'.
+
+    Returns
+    -------
+    all_results : Dict[str, np.ndarray]
+        An array for each field of `NODE_RESULT_FIELDS` with shape
+        (num stages, num design cases, num nodes), and 'strut_force' with
+        shape (num stages, num design cases, num struts).
+
+    """
+    all_results = get_node_results(
+        json_data, list(NODE_RESULT_FIELDS), dtype=dtype
+    )
+    all_results["strut_force"] = get_strut_forces(json_data, dtype)
+    return all_results
+
+
+def get_extremes(
+    json_data: dict,
+    results: Dict[str, np.ndarray],
+    levels: Sequence[float],
+    num_values: int = 1,
+    location: str = "node",
+) -> Dict[str, Dict[str, List[dict]]]:
+    """ Returns the governing maximum and minimum values of results arrays,
+    along with where and when they occur.
+
+    Parameters
+    ----------
+    json_data : dict
+        A Python dictionary of the data held within the json model file.
+    results : Dict[str, np.ndarray]
+        An array for each field with shape (num stages, num design cases,
+        num locations).
+    levels : Sequence[float]
+        The level of each location.
+    num_values : int, optional
+        The number of governing values to return per field, defaults to 1.
+    location : str, optional
+        The name of the location for the records, e.g. 'node' or 'strut'.
+
+    Returns
+    -------
+    extremes : Dict[str, Dict[str, List[dict]]]
+        The 'maximum' and 'minimum' records for each field, ordered from the
+        most onerous. Each record holds the value, location number (from 1),
+        level, stage, stage name and design case.
+
+    Raises
+    ------
+    FrewError
+        If `num_values` is less than 1.
+
+    """
+    if num_values < 1:
+        raise FrewError("The number of values must be at least 1.")
+    stage_names: List[str] = get_stage_names(json_data)
+    design_cases: List[str] = get_design_case_names(json_data)
+
+    extremes: Dict[str, Dict[str, List[dict]]] = {}
+    for field, values in results.items():
+        flat_values = values.ravel()
+        # NaN values, e.g. of struts which are not installed, are skipped.
+        valid = np.flatnonzero(~np.isnan(flat_values))
+        num = min(num_values, valid.size)
+        if num == 0:
+            extremes[field] = {"maximum": [], "minimum": []}
+            continue
+        largest = valid[np.argpartition(flat_values[valid], -num)[-num:]]
+        largest = largest[np.argsort(-flat_values[largest], kind="stable")]
+        smallest = valid[np.argpartition(flat_values[valid], num - 1)[:num]]
+        smallest = smallest[np.argsort(flat_values[smallest], kind="stable")]
+
+        extremes[field] = {}
+        for extreme, indices in zip(
+            ["maximum", "minimum"], [largest, smallest]
+        ):
+            stages, cases, locations = np.unravel_index(indices, values.shape)
+            extremes[field][extreme] = [
+                {
+                    "value": float(flat_values[index]),
+                    location: int(loc) + 1,
+                    "level": levels[loc],
+                    "stage": int(stage),
+                    "stage name": stage_names[stage],
+                    "design case": design_cases[case],
+                }
+                for index, stage, case, loc in zip(
+                    indices, stages, cases, locations
+                )
+            ]
+    return extremes
@@ -0,0 +1,253 @@
+"""
+Watch
+=====
+
+This module holds the class `FolderWatcher` which watches a folder of json
+Frew models and writes the reports of only the models whose contents have
+changed, so outputs stay up to date as models are saved.
+
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+from frewpy.frew_model import FrewModel
+from frewpy.report import Report, REPORT_FORMATS
+from frewpy.utils import (
+    get_file_hash,
+    get_json_extension,
+    strip_json_extension,
+)
+from frewpy.workers import init_worker, run_task
+from frewpy.models.exceptions import FrewError
+
+
+class FolderWatcher:
+    """ A class used to watch a folder of json Frew models and regenerate the
+    reports of the models which change.
+
+    A model is regenerated once its file has not been modified for the
+    debounce period, so that a model still being saved is not read, and only
+    if the hash of its contents differs from when it was last regenerated.
+    Models are regenerated in a pool of worker processes, which is kept
+    between changes; call `close` or use the watcher as a context manager to
+    stop it.
+
+    ...
+
+    Attributes
+    ----------
+    folder_path : str
+        The folder of json Frew models to watch.
+    out_folder : str
+        The folder to write the reports to, defaults to `folder_path`. Each
+        report is named after its model, e.g. `model_results.pdf`.
+    formats : Sequence[str]
+        The report formats to write, see `Report.write`. Defaults to excel,
+        pdf and html.
+    debounce : float
+        The number of seconds a model must be unmodified before it is
+        regenerated, defaults to 2.
+    workers : int
+        The number of worker processes, defaults to the number of CPUs.
+
+    """
+
+    def __init__(
+        self,
+        folder_path: str,
+        out_folder: str = None,
+        formats: Sequence[str] = ("excel", "pdf", "html"),
+        debounce: float = 2.0,
+        workers: int = None,
+    ) -> None:
+        if not os.path.isdir(folder_path):
+            raise FrewError(f"Folder {folder_path} does not exist.")
+        unknown = [item for item in formats if item not in REPORT_FORMATS]
+        if unknown:
+            raise FrewError(f"Unknown report formats {unknown}.")
+        self.folder_path: str = os.path.abspath(folder_path)
+        self.out_folder: str = os.path.abspath(out_folder or folder_path)
+        if not os.path.isdir(self.out_folder):
+            raise FrewError(f"Folder {self.out_folder} does not exist.")
+        self.formats: List[str] = list(formats)
+        self.debounce: float = debounce
+        self.workers: Union[int, None] = workers
+        self._executor: Union[ProcessPoolExecutor, None] = None
+        self._files: Dict[str, dict] = {}
+
+        # Models with reports newer than themselves are taken as up to date.
+        for file_path in self._scan():
+            stat = os.stat(file_path)
+            if all(
+                os.path.exists(out_path)
+                and os.path.getmtime(out_path) >= stat.st_mtime
+                for out_path in self.get_out_paths(file_path).values()
+            ):
+                file_hash: str = get_file_hash(file_path)
+                self._files[file_path] = {
+                    "checked": (stat.st_mtime, stat.st_size),
+                    "hash": file_hash,
+                    "new hash": file_hash,
+                }
+
+    def __enter__(self) -> "FolderWatcher":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """ Method to stop the worker processes.
+
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def get_out_paths(self, file_path: str) -> Dict[str, str]:
+        """ Method to get the report file paths of a model.
+
+        Parameters
+        ----------
+        file_path : str
+            The file path to the json Frew model.
+
+        Returns
+        -------
+        out_paths : Dict[str, str]
+            The report file path for each format.
+
+        """
+        file_stem: str = _get_file_stem(file_path)
+        return {
+            out_format: os.path.join(
+                self.out_folder, f"{file_stem}.{REPORT_FORMATS[out_format]}"
+            )
+            for out_format in self.formats
+        }
+
+    def poll(self) -> List[str]:
+        """ Method to check the folder for models which have changed.
+
+        Returns
+        -------
+        file_paths : List[str]
+            The models whose contents have changed since their reports were
+            last written and which are past the debounce period.
+
+        """
+        now: float = time.time()
+        changed: List[str] = []
+        found: List[str] = list(self._scan())
+        for file_path in found:
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                continue
+            state = self._files.setdefault(
+                file_path, {"checked": None, "hash": None, "new hash": None}
+            )
+            file_stat: Tuple[float, int] = (stat.st_mtime, stat.st_size)
+            if file_stat == state["checked"] or (
+                now - stat.st_mtime < self.debounce
+            ):
+                continue
+            # Saving a model without changing it only updates the time.
+            state["checked"] = file_stat
+            state["new hash"] = get_file_hash(file_path)
+            if state["new hash"] != state["hash"]:
+                changed.append(file_path)
+        for file_path in set(self._files) - set(found):
+            del self._files[file_path]
+        return changed
+
+    def regenerate(
+        self, file_paths: Sequence[str]
+    ) -> Dict[str, Union[str, None]]:
+        """ Method to write the reports of models in the worker processes.
+
+        Parameters
+        ----------
+        file_paths : Sequence[str]
+            The file paths to the json Frew models.
+
+        Returns
+        -------
+        errors : Dict[str, Union[str, None]]
+            The error message for each model, or None if its reports were
+            written.
+
+        """
+        if not file_paths:
+            return {}
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=init_worker
+            )
+        futures = {
+            file_path: self._executor.submit(
+                run_task,
+                _write_report,
+                file_path,
+                self.out_folder,
+                self.formats,
+            )
+            for file_path in file_paths
+        }
+        errors: Dict[str, Union[str, None]] = {}
+        for file_path, future in futures.items():
+            errors[file_path] = future.result()
+            state = self._files.get(file_path)
+            if errors[file_path] is None and state is not None:
+                state["hash"] = state["new hash"]
+        return errors
+
+    def run(
+        self,
+        interval: float = 1.0,
+        callback: Callable[[Dict[str, Union[str, None]]], None] = None,
+        max_polls: int = None,
+    ) -> None:
+        """ Method to poll the folder and regenerate changed models until
+        interrupted.
+
+        Parameters
+        ----------
+        interval : float, optional
+            The number of seconds between polls, defaults to 1.
+        callback : Callable[[Dict[str, Union[str, None]]], None], optional
+            Called with the result of `regenerate` after models have been
+            regenerated.
+        max_polls : int, optional
+            The number of polls after which to stop, defaults to polling
+            until interrupted.
+
+        """
+        polls: int = 0
+        while max_polls is None or polls < max_polls:
+            errors = self.regenerate(self.poll())
+            if errors and callback is not None:
+                callback(errors)
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(interval)
+
+    def _scan(self) -> List[str]:
+        return sorted(
+            os.path.join(self.folder_path, file)
+            for file in os.listdir(self.folder_path)
+            if get_json_extension(file) is not None
+            and os.path.isfile(os.path.join(self.folder_path, file))
+        )
+
+
+def _get_file_stem(file_path: str) -> str:
+    return f"{strip_json_extension(os.path.basename(file_path))}_results"
+
+
+def _write_report(file_path: str, out_folder: str, formats: List[str]) -> None:
+    model = FrewModel(file_path)
+    Report(model, out_folder, _get_file_stem(file_path)).write(formats)
@@ -0,0 +1,45 @@
+"""
+Workers
+=======
+
+This module holds the functions shared by the pools of worker processes which
+write the outputs of Frew models.
+
+"""
+
+from typing import Callable, Union
+
+import matplotlib  # type: ignore
+
+
+def init_worker() -> None:
+    """ Sets up a worker process to draw figures with the Agg backend, as
+    figures are only ever saved to file so no window toolkit is needed.
+
+    """
+    matplotlib.use("Agg")
+
+
+def run_task(task: Callable, *args) -> Union[str, None]:
+    """ Runs a task for one model, reporting any error it raises rather than
+    stopping the rest of the batch.
+
+    Parameters
+    ----------
+    task : Callable
+        The function to call.
+    *args
+        The arguments to call the task with.
+
+    Returns
+    -------
+    error : Union[str, None]
+        The type and message of the error raised by the task, or None if it
+        succeeded.
+
+    """
+    try:
+        task(*args)
+    except Exception as error:
+        return f"{type(error).__name__}: {' '.join(str(error).split())}"
+    return None
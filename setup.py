@@ -17,6 +17,12 @@ setup(
     url="https://github.com/frdwhite24/frewpy",
     packages=find_packages(),
     install_requires=dependencies,
+    extras_require={
+        "pdf": ["pypdf>=3.0"],
+        "parquet": ["pyarrow>=1.0"],
+        "zstd": ["zstandard>=0.15"],
+    },
+    entry_points={"console_scripts": ["frewpy=frewpy.cli:main"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
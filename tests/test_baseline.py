@@ -0,0 +1,86 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from test_config import TEST_DATA
+from frewpy import FrewModel
+from frewpy.baseline import BaselineStore
+from frewpy.models.exceptions import FrewError
+
+
+@pytest.fixture
+def model():
+    return FrewModel(os.path.join(TEST_DATA, "test_model_with_results.json"))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BaselineStore(str(tmp_path))
+
+
+def test_store_missing_folder():
+    with pytest.raises(FrewError):
+        BaselineStore("folder_does_not_exist")
+
+
+def test_snapshot(store, model):
+    baseline_path = store.snapshot(model)
+    assert os.path.basename(baseline_path) == "test_model_with_results.npz"
+    assert os.path.exists(baseline_path)
+
+
+def test_snapshot_dotted_names(store, model, tmp_path):
+    baseline_names = []
+    for file_name in ["wall.rev2.json", "wall.rev3.json.gz"]:
+        file_path = os.path.join(tmp_path, file_name)
+        shutil.copy(model.file_path, file_path)
+        model.file_path = file_path
+        baseline_names.append(os.path.basename(store.snapshot(model)))
+    assert baseline_names == ["wall.rev2.npz", "wall.rev3.npz"]
+
+
+def test_check_passes(store, model):
+    store.snapshot(model)
+    assert store.check(model) == []
+
+
+def test_check_violation(store, model):
+    store.snapshot(model, "reference")
+    stage_results = model.json_data["Frew Results"][0]["Stageresults"]
+    stage_results[6]["Noderesults"][20]["Shear"] += 5000.0
+    violations = store.check(model, "reference")
+    assert violations[0]["field"] == "shear"
+    assert violations[0]["stage"] == 6
+    assert violations[0]["location"] == 21
+    assert violations[0]["value"] - violations[0]["baseline"] == (
+        pytest.approx(5.0)
+    )
+    assert store.check(model, "reference", {"shear": (6.0, 0.0)}) == []
+
+
+def test_check_nan(store, model):
+    store.snapshot(model, "reference")
+    stage_results = model.json_data["Frew Results"][0]["Stageresults"]
+    stage_results[6]["Noderesults"][20]["Shear"] = float("nan")
+    violations = store.check(model, "reference")
+    assert violations[0]["field"] == "shear"
+    assert violations[0]["reason"] == "nan"
+    assert violations[0]["stage"] == 6
+    assert violations[0]["location"] == 21
+    assert np.isnan(violations[0]["value"])
+
+
+def test_check_no_baseline(store, model):
+    with pytest.raises(FrewError):
+        store.check(model)
+
+
+def test_check_float32(tmp_path, model):
+    store = BaselineStore(str(tmp_path), dtype="float32")
+    baseline_path = store.snapshot(model)
+    assert BaselineStore(str(tmp_path)).check(model) == []
+    assert store.check(model, tolerances={"bending": (0.0, 0.0)}) == []
+    with np.load(baseline_path) as baseline:
+        assert baseline["bending"].dtype == np.float32
@@ -0,0 +1,34 @@
+import os
+
+import pytest
+
+from test_config import TEST_DATA
+from frewpy import FrewModel, find_extremes
+from frewpy.models.exceptions import FrewError
+
+
+@pytest.fixture
+def models():
+    return [
+        FrewModel(os.path.join(TEST_DATA, "test_model_with_results.json")),
+        FrewModel(os.path.join(TEST_DATA, "test_model_with_results.json")),
+    ]
+
+
+def test_find_extremes_batch(models):
+    extremes = find_extremes(models, "strut", num_values=2)
+    maximum = extremes["force"]["maximum"]
+    assert len(maximum) == 2
+    assert maximum[0]["value"] == pytest.approx(648.1314500)
+    assert maximum[1]["value"] == pytest.approx(648.1314500)
+    assert maximum[0]["model"] == models[0].file_path
+
+
+def test_find_extremes_batch_fields(models):
+    extremes = find_extremes(models, fields=["shear"])
+    assert list(extremes.keys()) == ["shear"]
+
+
+def test_find_extremes_batch_invalid_component(models):
+    with pytest.raises(FrewError):
+        find_extremes(models, "soil")
@@ -0,0 +1,84 @@
+import os
+import json
+import shutil
+
+import pytest
+
+from test_config import TEST_DATA
+from frewpy.cache import ModelCache
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    file_path = os.path.join(tmp_path, "model.json")
+    shutil.copy(
+        os.path.join(TEST_DATA, "test_model_with_results.json"), file_path
+    )
+    return file_path
+
+
+def test_get_shared(model_path):
+    cache = ModelCache()
+    model = cache.get(model_path)
+    assert cache.get(model_path) is model
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["models"]) == (1, 1, 1)
+    assert stats["bytes"] > os.path.getsize(model_path)
+
+
+def test_touched_file_kept(model_path):
+    cache = ModelCache()
+    model = cache.get(model_path)
+    stat = os.stat(model_path)
+    os.utime(model_path, (stat.st_atime, stat.st_mtime + 10))
+    assert cache.get(model_path) is model
+
+
+def test_changed_file_reloaded(model_path):
+    cache = ModelCache()
+    model = cache.get(model_path)
+    json_data = dict(model.json_data)
+    json_data["Stages"][0]["Name"] = "Changed"
+    with open(model_path, "w") as file:
+        json.dump(json_data, file)
+    assert cache.get(model_path) is not model
+    assert cache.get_stats()["misses"] == 2
+
+
+def test_result_arrays_counted(model_path):
+    cache = ModelCache()
+    model = cache.get(model_path)
+    size = cache.get_stats()["bytes"]
+    model.wall.find_extremes()
+    assert cache.get_stats()["bytes"] > size
+
+
+def test_eviction(model_path):
+    other_path = model_path.replace("model.json", "other.json")
+    shutil.copy(model_path, other_path)
+    cache = ModelCache()
+    cache.get(model_path)
+    cache.max_bytes = cache.get_stats()["bytes"] + 1
+    cache.get(other_path)
+    assert model_path not in cache
+    assert other_path in cache
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_clear(model_path):
+    cache = ModelCache()
+    cache.get(model_path)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_result_dtype(model_path):
+    sizes = []
+    for result_dtype in ["float64", "float32"]:
+        cache = ModelCache(result_dtype=result_dtype)
+        model = cache.get(model_path)
+        model.wall.find_extremes()
+        sizes.append(
+            sum(array.nbytes for array in model.wall._result_arrays.values())
+        )
+    assert sizes[1] * 2 == sizes[0]
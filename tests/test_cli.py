@@ -0,0 +1,103 @@
+import os
+import gzip
+import json
+import shutil
+
+import pandas as pd
+import pytest
+
+from test_config import TEST_DATA
+from frewpy.cli import main
+
+
+@pytest.fixture
+def model_folder(tmp_path):
+    shutil.copy(
+        os.path.join(TEST_DATA, "test_model_with_results.json"),
+        os.path.join(tmp_path, "model.json"),
+    )
+    return str(tmp_path)
+
+
+def test_export(model_folder, tmp_path):
+    out_folder = os.path.join(tmp_path, "out")
+    os.mkdir(out_folder)
+    assert main(["export", model_folder, "-o", out_folder, "-f", "csv"]) == 0
+    table = pd.read_csv(os.path.join(out_folder, "model_results.csv"))
+    assert len(table) == 11 * 68
+
+
+def test_export_incremental(model_folder, capsys):
+    args = ["export", os.path.join(model_folder, "*.json"), "-f", "csv"]
+    main(args)
+    assert main(args + ["--incremental"]) == 0
+    assert "0 done, 1 skipped, 0 failed" in capsys.readouterr().out
+
+
+def test_export_jobs(model_folder):
+    shutil.copy(
+        os.path.join(model_folder, "model.json"),
+        os.path.join(model_folder, "model_2.json"),
+    )
+    assert main(["export", model_folder, "-f", "csv", "-j", "2"]) == 0
+    assert os.path.exists(os.path.join(model_folder, "model_2_results.csv"))
+
+
+def test_export_compressed(model_folder):
+    with open(os.path.join(model_folder, "model.json"), "rb") as in_file:
+        with gzip.open(
+            os.path.join(model_folder, "model_2.json.gz"), "wb"
+        ) as file:
+            file.write(in_file.read())
+    assert main(["export", model_folder, "-f", "csv"]) == 0
+    assert os.path.exists(os.path.join(model_folder, "model_2_results.csv"))
+
+
+def test_envelope(model_folder):
+    assert main(["envelope", model_folder]) == 0
+    table = pd.read_csv(os.path.join(model_folder, "model_envelopes.csv"))
+    assert len(table) == 68
+
+
+def test_export_failure(tmp_path, capsys):
+    shutil.copy(
+        os.path.join(TEST_DATA, "test_model_1.json"),
+        os.path.join(tmp_path, "no_results.json"),
+    )
+    assert main(["export", str(tmp_path), "-f", "csv"]) == 1
+    assert "failed" in capsys.readouterr().err
+
+
+def test_export_unexpected_failure(model_folder, capsys):
+    with open(os.path.join(model_folder, "model.json")) as file:
+        json_data = json.loads(file.read())
+    del json_data["Frew Results"][0]["Stageresults"][0]["Noderesults"][0][
+        "Shear"
+    ]
+    with open(os.path.join(model_folder, "no_shear.json"), "w") as file:
+        file.write(json.dumps(json_data))
+    assert main(["export", model_folder, "-f", "csv", "-j", "2"]) == 1
+    output = capsys.readouterr()
+    assert "KeyError" in output.err
+    assert "1 done, 0 skipped, 1 failed" in output.out
+    assert os.path.exists(os.path.join(model_folder, "model_results.csv"))
+
+
+def test_no_inputs(tmp_path, capsys):
+    assert main(["export", str(tmp_path)]) == 1
+    assert "No .json, .json.gz, .json.zst files" in capsys.readouterr().err
+
+
+def test_index(model_folder, tmp_path, capsys):
+    db_path = os.path.join(tmp_path, "index.db")
+    assert main(["index", model_folder, "--db", db_path]) == 0
+    assert main(["index", "--db", db_path, "--frew-version", "19.4"]) == 0
+    assert os.path.join(model_folder, "model.json") in capsys.readouterr().out
+
+
+def test_diff(model_folder, capsys):
+    model_path = os.path.join(model_folder, "model.json")
+    assert main(["diff", model_path, model_path]) == 0
+    other_path = os.path.join(TEST_DATA, "test_model_1.json")
+    assert main(["diff", model_path, other_path]) == 1
+    assert "changed" in capsys.readouterr().out
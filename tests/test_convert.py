@@ -0,0 +1,94 @@
+import os
+import gzip
+import json
+
+import pytest
+
+from frewpy.convert import BatchConverter
+
+
+def _copy_backend(file_path, json_path):
+    with open(file_path) as file:
+        contents = file.read()
+    if contents == "corrupt":
+        raise ValueError("Unable to read model.")
+    with open(json_path, "w") as file:
+        file.write(json.dumps({"Source": contents}))
+
+
+@pytest.fixture
+def fwd_paths(tmp_path):
+    file_paths = []
+    for index in range(4):
+        file_path = os.path.join(tmp_path, f"model_{index}.fwd")
+        with open(file_path, "w") as file:
+            file.write(f"model {index}")
+        file_paths.append(file_path)
+    return file_paths
+
+
+def test_convert(fwd_paths):
+    summary = BatchConverter(_copy_backend, workers=2).convert(fwd_paths)
+    assert summary["converted"] == 4
+    assert summary["failed"] == {}
+    assert summary["files per second"] > 0
+    with open(fwd_paths[1].replace(".fwd", ".json")) as file:
+        assert json.loads(file.read()) == {"Source": "model 1"}
+
+
+def test_convert_compressed(fwd_paths):
+    converter = BatchConverter(_copy_backend, extension=".json.gz")
+    assert converter.convert(fwd_paths)["converted"] == 4
+    with gzip.open(fwd_paths[1].replace(".fwd", ".json.gz")) as file:
+        assert json.loads(file.read()) == {"Source": "model 1"}
+    assert len(os.listdir(os.path.dirname(fwd_paths[0]))) == 8
+    assert converter.convert(fwd_paths)["skipped"] == 4
+
+
+def test_convert_incremental(fwd_paths):
+    converter = BatchConverter(_copy_backend)
+    converter.convert(fwd_paths[:2])
+    summary = converter.convert(fwd_paths)
+    assert (summary["converted"], summary["skipped"]) == (2, 2)
+    assert converter.convert(fwd_paths, incremental=False)["converted"] == 4
+
+
+def test_convert_manifest(fwd_paths, tmp_path):
+    manifest_path = os.path.join(tmp_path, "manifest.json")
+    BatchConverter(_copy_backend, manifest_path=manifest_path).convert(
+        fwd_paths
+    )
+    for file_path in fwd_paths:
+        stat = os.stat(file_path)
+        os.utime(file_path, (stat.st_atime, stat.st_mtime + 10))
+    with open(fwd_paths[0], "w") as file:
+        file.write("changed")
+    summary = BatchConverter(
+        _copy_backend, manifest_path=manifest_path
+    ).convert(fwd_paths)
+    assert (summary["converted"], summary["skipped"]) == (1, 3)
+
+
+def test_convert_failure_keeps_source(fwd_paths):
+    with open(fwd_paths[0], "w") as file:
+        file.write("corrupt")
+    errors = {}
+    summary = BatchConverter(_copy_backend).convert(
+        fwd_paths, callback=errors.__setitem__
+    )
+    assert summary["failed"] == {fwd_paths[0]: "Unable to read model."}
+    assert errors[fwd_paths[0]] == "Unable to read model."
+    assert errors[fwd_paths[1]] is None
+    assert os.path.exists(fwd_paths[0])
+    assert sorted(os.listdir(os.path.dirname(fwd_paths[0]))) == sorted(
+        [os.path.basename(path) for path in fwd_paths]
+        + [os.path.basename(path)[:-4] + ".json" for path in fwd_paths[1:]]
+    )
+
+
+def test_convert_wrong_extension(tmp_path):
+    file_path = os.path.join(tmp_path, "model.txt")
+    with open(file_path, "w") as file:
+        file.write("model")
+    summary = BatchConverter(_copy_backend).convert([file_path])
+    assert file_path in summary["failed"]
@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from test_config import TEST_DATA
+from frewpy import FrewModel, diff
+
+
+@pytest.fixture
+def model_a():
+    return FrewModel(os.path.join(TEST_DATA, "test_model_with_results.json"))
+
+
+@pytest.fixture
+def model_b():
+    return FrewModel(os.path.join(TEST_DATA, "test_model_with_results.json"))
+
+
+def test_diff_identical(model_a, model_b):
+    model_diff = diff(model_a, model_b)
+    assert model_diff["changed"] == []
+    assert model_diff["exceeded"] == []
+    assert model_diff["max deltas"]["bending"]["SLS"].max() == 0.0
+
+
+def test_diff_inputs(model_a, model_b):
+    model_b.json_data["Materials"][0]["Phi"] = 32.0
+    model_b.json_data["Struts"][1]["Stiffness"] = 1.0
+    model_b.json_data["Stages"][3]["Name"] = "Excavate"
+    assert diff(model_a, model_b)["changed"] == [
+        "Materials/Made Ground/Phi",
+        "Struts/1/Stiffness",
+        "Stages/3/Name",
+    ]
+
+
+def test_diff_results(model_a, model_b):
+    stage_results = model_b.json_data["Frew Results"][0]["Stageresults"]
+    stage_results[4]["Noderesults"][10]["Bending"] += 2000.0
+    model_diff = diff(model_a, model_b)
+    assert model_diff["exceeded"] == ["bending/4/SLS"]
+    assert model_diff["max deltas"]["bending"]["SLS"][4] == pytest.approx(2.0)
+
+
+def test_diff_results_tolerance(model_a, model_b):
+    stage_results = model_b.json_data["Frew Results"][0]["Stageresults"]
+    stage_results[4]["Noderesults"][10]["Bending"] += 2000.0
+    assert diff(model_a, model_b, atol=2.5)["exceeded"] == []
+
+
+def test_diff_results_nan(model_a, model_b):
+    stage_results = model_b.json_data["Frew Results"][0]["Stageresults"]
+    stage_results[4]["Noderesults"][10]["Bending"] = float("nan")
+    assert diff(model_a, model_b)["exceeded"] == ["bending/4/SLS"]
+    assert diff(model_b, model_a)["exceeded"] == ["bending/4/SLS"]
+
+
+def test_diff_no_results(model_a, model_b):
+    del model_b.json_data["Frew Results"]
+    assert diff(model_a, model_b)["changed"] == ["Frew Results"]
@@ -1,5 +1,10 @@
 import os
+import copy
+import gzip
+import json
 import time
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 
 import pytest
 
@@ -95,3 +100,184 @@ def test_save_as(frew_model, tmp_path):
     model_path = os.path.join(tmp_path, "test_model.json")
     frew_model.save(model_path)
     assert os.path.exists(model_path)
+
+
+@pytest.fixture
+def copied_model(tmp_path):
+    # Indented, so the sections copied unchanged can be told apart.
+    with open(os.path.join(TEST_DATA, "test_model_with_results.json")) as file:
+        json_data = json.loads(file.read())
+    file_path = os.path.join(tmp_path, "model.json")
+    with open(file_path, "w") as file:
+        file.write(json.dumps(json_data, indent=2))
+    return FrewModel(file_path)
+
+
+def test_save_incremental(copied_model):
+    copied_model.soil.set_material_property("Made Ground", "Phi", 32.0)
+    assert copied_model.changes.get_modified() == {"Materials": [0]}
+    copied_model.save(incremental=True)
+    with open(copied_model.file_path) as file:
+        contents = file.read()
+    assert json.loads(contents) == copied_model.json_data
+    assert json.dumps(copied_model.json_data["Materials"]) in contents
+    assert '\n  "Stages": [\n    {\n      "Name"' in contents
+    assert not copied_model.changes.is_modified()
+    assert os.listdir(os.path.dirname(copied_model.file_path)) == [
+        "model.json"
+    ]
+
+
+def test_save_source_changed(copied_model):
+    copied_model.mark_modified("Materials")
+    copied_model.json_data["Materials"][0]["Phi"] = 32.0
+    with open(copied_model.file_path, "w") as file:
+        file.write("{}")
+    copied_model.save(incremental=True)
+    with open(copied_model.file_path) as file:
+        assert json.loads(file.read()) == copied_model.json_data
+
+
+def test_save_as_incremental(copied_model, tmp_path):
+    copied_model.mark_modified("Stages", 1)
+    copied_model.json_data["Stages"][1]["Name"] = "Renamed"
+    model_path = os.path.join(tmp_path, "saved_model.json")
+    copied_model.save(model_path, incremental=True)
+    assert FrewModel(model_path).get("stage names")[1] == "Renamed"
+    assert copied_model.changes.is_modified("Stages")
+
+
+def test_save_unrecorded_change(copied_model):
+    copied_model.json_data["Stages"][1]["Name"] = "Renamed"
+    copied_model.save()
+    assert FrewModel(copied_model.file_path).get("stage names")[1] == (
+        "Renamed"
+    )
+
+
+def test_mark_modified_missing_section(frew_model):
+    with pytest.raises(FrewError):
+        frew_model.mark_modified("Not a section")
+
+
+def test_save_compressed(copied_model, tmp_path):
+    gz_path = os.path.join(tmp_path, "model.json.gz")
+    copied_model.save(gz_path)
+    compressed_model = FrewModel(gz_path)
+    assert compressed_model.json_data == copied_model.json_data
+    compressed_model.soil.set_material_property("Made Ground", "Phi", 32.0)
+    compressed_model.save(incremental=True)
+    with gzip.open(gz_path) as file:
+        assert json.loads(file.read()) == compressed_model.json_data
+    assert sorted(os.listdir(tmp_path)) == ["model.json", "model.json.gz"]
+
+
+def _get_bending_extreme(model):
+    return model.wall.find_extremes(["bending"])["bending"]["maximum"][0]
+
+
+def test_pickle_unmodified(copied_model):
+    copied_model.wall.find_extremes(["bending"])
+    pickled = pickle.dumps(copied_model)
+    assert len(pickled) < 10000
+    model = pickle.loads(pickled)
+    assert model.json_data == copied_model.json_data
+    assert "bending" in model.wall._result_arrays
+    model.json_data["Stages"][0]["Name"] = "Renamed"
+    model.wall._result_arrays["bending"][...] = 0.0
+    other_model = pickle.loads(pickled)
+    assert other_model is not model
+    assert other_model.json_data == copied_model.json_data
+    assert other_model.wall._result_arrays["bending"].any()
+
+
+def test_pickle_modified(copied_model):
+    copied_model.soil.set_material_property("Made Ground", "Phi", 32.0)
+    model = pickle.loads(pickle.dumps(copied_model))
+    assert model.json_data["Materials"][0]["Phi"] == 32.0
+    assert model.changes.get_modified() == {"Materials": [0]}
+    assert model.soil.changes is model.changes
+    model.save()
+    assert FrewModel(copied_model.file_path).json_data == model.json_data
+
+
+def test_pickle_source_changed(copied_model):
+    pickled = pickle.dumps(copied_model)
+    with open(copied_model.file_path, "w") as file:
+        file.write("{}")
+    with pytest.raises(FrewError):
+        pickle.loads(pickled)
+
+
+def test_pickle_hashed_once(copied_model, monkeypatch):
+    pickled = pickle.dumps(copied_model)
+    pickle.loads(pickled)
+    hashed = []
+    monkeypatch.setattr(
+        "frewpy.frew_model.get_file_hash",
+        lambda file_path: hashed.append(file_path),
+    )
+    pickle.loads(pickled)
+    assert hashed == []
+    with open(copied_model.file_path, "a") as file:
+        file.write(" ")
+    with pytest.raises(FrewError):
+        pickle.loads(pickled)
+    assert hashed == [copied_model.file_path]
+
+
+def test_pickle_worker_processes(copied_model):
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        extremes = list(executor.map(_get_bending_extreme, [copied_model] * 2))
+    assert extremes == [_get_bending_extreme(copied_model)] * 2
+
+
+def test_deepcopy(copied_model):
+    model = copy.deepcopy(copied_model)
+    model.json_data["Materials"][0]["Phi"] = 32.0
+    assert copied_model.json_data["Materials"][0]["Phi"] != 32.0
+
+
+def test_first_modified_stage_unmodified(frew_model):
+    assert frew_model.get_first_modified_stage() is None
+    frew_model.mark_modified("File history")
+    assert frew_model.get_first_modified_stage() is None
+
+
+def test_first_modified_stage_stages(frew_model):
+    frew_model.mark_modified("Stages", 7)
+    frew_model.mark_modified("Stages", 9)
+    assert frew_model.get_first_modified_stage() == 7
+    frew_model.soil.set_material_property("Made Ground", "Phi", 32.0)
+    assert frew_model.get_first_modified_stage() == 0
+
+
+@pytest.mark.parametrize(
+    "key, value, first_stage",
+    [("Stiffness", 1.0, 2), ("StageIn", 6, 2), ("StageOut", 8, 8)],
+)
+def test_first_modified_stage_struts(frew_model, key, value, first_stage):
+    frew_model.json_data["Struts"][0][key] = value
+    assert frew_model.get_first_modified_stage() == first_stage
+
+
+def test_first_modified_stage_loads(frew_model):
+    frew_model.json_data["Loads"][0]["Stage"]["Out"] = 9
+    assert frew_model.get_first_modified_stage() == 9
+    load = dict(frew_model.json_data["Loads"][0], Stage={"In": 5, "Out": -1})
+    frew_model.json_data["Loads"].append(load)
+    assert frew_model.get_first_modified_stage() == 5
+
+
+def test_first_modified_stage_load_stage_keys(frew_model):
+    frew_model.json_data["Loads"][0]["Stage"]["Flags"] = 1
+    assert frew_model.get_first_modified_stage() == 1
+
+
+def test_first_modified_stage_saved(copied_model):
+    copied_model.mark_modified("Stages", 4)
+    copied_model.save()
+    assert not copied_model.changes.is_modified()
+    assert copied_model.get_first_modified_stage() == 4
+    model = pickle.loads(pickle.dumps(copied_model))
+    assert model.get_first_modified_stage() == 4
@@ -0,0 +1,102 @@
+import os
+import gzip
+import shutil
+
+import pytest
+
+from test_config import TEST_DATA
+from frewpy.index import ModelIndex
+from frewpy.models.exceptions import FrewError
+
+
+@pytest.fixture
+def models_folder(tmp_path):
+    for file in ["test_model_1.json", "test_model_with_results.json"]:
+        shutil.copy(os.path.join(TEST_DATA, file), tmp_path)
+    with open(os.path.join(tmp_path, "broken.json"), "w") as file:
+        file.write("{")
+    return str(tmp_path)
+
+
+@pytest.fixture
+def model_index(models_folder):
+    with ModelIndex(os.path.join(models_folder, "index.db")) as index:
+        yield index
+
+
+def test_update(model_index, models_folder):
+    summary = model_index.update(models_folder)
+    assert summary["added"] == 2
+    assert summary["failed"] == 1
+
+
+def test_update_corrupt_compressed(model_index, models_folder):
+    with open(os.path.join(models_folder, "corrupt.json.gz"), "wb") as file:
+        file.write(b"not gzip data")
+    with open(os.path.join(models_folder, "truncated.json.gz"), "wb") as file:
+        file.write(gzip.compress(b'{"OasysHeader": [')[:-8])
+    summary = model_index.update(models_folder)
+    assert summary["added"] == 2
+    assert summary["failed"] == 3
+
+
+def test_update_not_object(model_index, models_folder):
+    for name, contents in [("list.json", "[]"), ("number.json", "1")]:
+        with open(os.path.join(models_folder, name), "w") as file:
+            file.write(contents)
+    summary = model_index.update(models_folder)
+    assert summary["added"] == 2
+    assert summary["failed"] == 3
+
+
+def test_update_no_longer_reads(model_index, models_folder):
+    model_index.update(models_folder)
+    file_path = os.path.join(models_folder, "test_model_1.json")
+    with open(file_path, "w") as file:
+        file.write("{")
+    assert model_index.update(models_folder)["failed"] == 2
+    with pytest.raises(FrewError):
+        model_index.get(file_path)
+    assert len(model_index.find(job_number="261026")) == 1
+
+
+def test_update_incremental(model_index, models_folder):
+    model_index.update(models_folder)
+    summary = model_index.update(models_folder)
+    assert summary["unchanged"] == 2
+    assert summary["added"] == 0
+
+
+def test_update_removed(model_index, models_folder):
+    model_index.update(models_folder)
+    os.remove(os.path.join(models_folder, "test_model_1.json"))
+    assert model_index.update(models_folder)["removed"] == 1
+
+
+def test_update_missing_folder(model_index):
+    with pytest.raises(FrewError):
+        model_index.update("folder_does_not_exist")
+
+
+def test_find(model_index, models_folder):
+    model_index.update(models_folder)
+    assert len(model_index.find(job_number="261026", frew_version="19.4")) == 2
+    assert len(model_index.find(stage_name="Long-term (drained)")) == 2
+    assert model_index.find(material="Dirt") == []
+
+
+def test_get(model_index, models_folder):
+    model_index.update(models_folder)
+    metadata = model_index.get(
+        os.path.join(models_folder, "test_model_with_results.json")
+    )
+    assert metadata["num stages"] == 11
+    assert metadata["num nodes"] == 68
+    assert metadata["num design cases"] == 1
+    assert metadata["materials"][0] == "Made Ground"
+    assert metadata["titles"]["JobNumber"] == "261026"
+
+
+def test_get_not_indexed(model_index):
+    with pytest.raises(FrewError):
+        model_index.get("not_indexed.json")
@@ -0,0 +1,66 @@
+import os
+import json
+
+from test_config import TEST_DATA
+from frewpy import FrewModel
+from frewpy.cache import ModelCache
+from frewpy.interner import Interner
+from frewpy.utils import load_data
+
+
+MODEL_PATH = os.path.join(TEST_DATA, "test_model_with_results.json")
+
+
+def test_load_data_interned():
+    interner = Interner()
+    json_data = load_data(MODEL_PATH, interner)
+    assert json_data == load_data(MODEL_PATH)
+    assert interner.bytes_saved > 0
+    assert interner.get_stats()["hits"] > 0
+
+
+def test_models_share_values():
+    interner = Interner()
+    model_a = FrewModel(MODEL_PATH, interner)
+    model_b = FrewModel(MODEL_PATH, interner)
+    material_a = model_a.json_data["Materials"][0]
+    material_b = model_b.json_data["Materials"][0]
+    assert material_a["Name"] is material_b["Name"]
+    assert material_a["UnitWeight"] is material_b["UnitWeight"]
+    assert list(material_a)[0] is list(material_b)[0]
+
+
+def test_interner_keeps_types():
+    interner = Interner()
+    contents = '{"a": 1, "b": 1.0, "c": -0.0, "d": 0.0, "e": "1.0"}'
+    json_data = json.loads(
+        contents,
+        object_pairs_hook=interner.object_pairs_hook,
+        parse_float=interner.parse_float,
+    )
+    assert [repr(value) for value in json_data.values()] == [
+        "1",
+        "1.0",
+        "-0.0",
+        "0.0",
+        "'1.0'",
+    ]
+
+
+def test_interner_max_size():
+    interner = Interner(max_size=10)
+    load_data(MODEL_PATH, interner)
+    assert len(interner) == 10
+    interner.clear()
+    assert interner.get_stats() == {
+        "strings": 0,
+        "floats": 0,
+        "hits": 0,
+        "bytes saved": 0,
+    }
+
+
+def test_cache_interner():
+    cache = ModelCache(interner=Interner())
+    cache.get(MODEL_PATH)
+    assert cache.interner.bytes_saved > 0
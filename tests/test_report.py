@@ -0,0 +1,83 @@
+import os
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from test_config import TEST_DATA
+from frewpy import FrewModel
+from frewpy.models import Wall
+from frewpy.report import Report
+from frewpy.models.exceptions import FrewError
+
+
+@pytest.fixture
+def model():
+    return FrewModel(os.path.join(TEST_DATA, "test_model_with_results.json"))
+
+
+def test_write_default_formats(model, tmp_path):
+    out_paths = Report(model, str(tmp_path), file_stem="report").write()
+    assert sorted(os.listdir(tmp_path)) == [
+        "report.html",
+        "report.pdf",
+        "report.xlsx",
+    ]
+    assert out_paths["pdf"] == os.path.join(tmp_path, "report.pdf")
+
+
+def test_write_gets_results_once(model, tmp_path, monkeypatch):
+    calls = []
+    get_results = Wall.get_results
+
+    def counted_get_results(self):
+        calls.append(1)
+        return get_results(self)
+
+    monkeypatch.setattr(Wall, "get_results", counted_get_results)
+    Report(model, str(tmp_path), file_stem="report").write()
+    assert len(calls) == 1
+
+
+def test_write_pdf_thread(model, tmp_path):
+    out_paths = Report(model, str(tmp_path), file_stem="report").write(
+        ["pdf", "csv"], parallel="thread"
+    )
+    assert os.path.getsize(out_paths["pdf"]) > 0
+    assert plt.get_fignums() == []
+
+
+def test_write_csv(model, tmp_path):
+    out_paths = Report(model, str(tmp_path), file_stem="report").write(
+        ["csv"], parallel="thread"
+    )
+    table = pd.read_csv(out_paths["csv"])
+    assert len(table) == 11 * 68
+    assert table["Bending (kNm/m)"].iloc[-1] == pytest.approx(
+        model.wall.get_results()[10]["SLS"]["bending"][-1]
+    )
+
+
+def test_write_unknown_format(model, tmp_path):
+    with pytest.raises(FrewError):
+        Report(model, str(tmp_path)).write(["docx"])
+
+
+def test_write_unknown_parallel(model, tmp_path):
+    with pytest.raises(FrewError):
+        Report(model, str(tmp_path)).write(["csv"], parallel="gpu")
+
+
+def test_report_folder_missing(model, tmp_path):
+    with pytest.raises(FrewError):
+        Report(model, os.path.join(tmp_path, "missing"))
+
+
+def test_write_csv_float32(model, tmp_path):
+    out_paths = Report(
+        model, str(tmp_path), file_stem="report", dtype="float32"
+    ).write(["csv"])
+    table = pd.read_csv(out_paths["csv"])
+    assert table["Bending (kNm/m)"].iloc[-1] == pytest.approx(
+        model.wall.get_results()[10]["SLS"]["bending"][-1], rel=1e-7
+    )
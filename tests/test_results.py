@@ -0,0 +1,56 @@
+import os
+import json
+
+import pytest
+
+from test_config import TEST_DATA
+from frewpy.models import Results, Wall
+from frewpy.models.exceptions import FrewError
+
+
+@pytest.fixture
+def json_data_with_results():
+    with open(os.path.join(TEST_DATA, "test_model_with_results.json")) as file:
+        return json.loads(file.read())
+
+
+def test_select_all(json_data_with_results):
+    selection = Results(json_data_with_results).select()
+    assert selection["shear"].shape == (11, 1, 68)
+
+
+def test_select_subset(json_data_with_results):
+    wall_results = Wall(json_data_with_results).get_results()
+    selection = Results(json_data_with_results).select(
+        stages=[3, 7], cases=["SLS"], nodes=slice(10, 20), fields=["bending"]
+    )
+    assert list(selection.keys()) == ["bending"]
+    assert selection["bending"].shape == (2, 1, 10)
+    assert selection["bending"][1, 0, 4] == pytest.approx(
+        wall_results[7]["SLS"]["bending"][14]
+    )
+
+
+def test_select_dataframe(json_data_with_results):
+    selection = Results(json_data_with_results).select(
+        stages=[9], nodes=[0, 67], fields=["water_right"], as_dataframe=True
+    )
+    assert list(selection.columns) == [
+        "Stage",
+        "Design case",
+        "Node #",
+        "Node levels (m)",
+        "water_right",
+    ]
+    assert list(selection["Node #"]) == [1, 68]
+    assert selection["water_right"].iloc[-1] == pytest.approx(282.131010)
+
+
+def test_select_invalid_stage(json_data_with_results):
+    with pytest.raises(FrewError):
+        Results(json_data_with_results).select(stages=[11])
+
+
+def test_select_invalid_case(json_data_with_results):
+    with pytest.raises(FrewError):
+        Results(json_data_with_results).select(cases=["ULS"])
@@ -0,0 +1,138 @@
+import os
+import json
+import shutil
+import threading
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from test_config import TEST_DATA
+from frewpy.cache import ModelCache
+from frewpy.server import ModelServer
+from frewpy.models.exceptions import FrewError
+
+
+@pytest.fixture
+def model_folder(tmp_path):
+    shutil.copy(
+        os.path.join(TEST_DATA, "test_model_with_results.json"),
+        os.path.join(tmp_path, "model.json"),
+    )
+    return str(tmp_path)
+
+
+@pytest.fixture
+def server(model_folder):
+    server = ModelServer(model_folder, port=0)
+    yield server
+    server._httpd.server_close()
+
+
+def test_stages(server):
+    status, payload = server.handle("/stages", {"model": ["model.json"]})
+    assert status == 200
+    assert len(payload["stages"]) == 11
+
+
+def test_results_selection(server):
+    status, payload = server.handle(
+        "/results",
+        {
+            "model": ["model.json"],
+            "fields": ["bending"],
+            "stages": ["0,10"],
+            "nodes": ["0:5"],
+        },
+    )
+    assert status == 200
+    assert payload["cases"] == ["SLS"]
+    assert len(payload["results"]["bending"]) == 2
+    assert len(payload["results"]["bending"][0][0]) == 5
+
+
+def test_envelopes(server):
+    status, payload = server.handle("/envelopes", {"model": ["model.json"]})
+    assert status == 200
+    assert len(payload["SLS"]["maximum"]["shear"]) == 68
+
+
+def test_model_reused(server):
+    server.handle("/titles", {"model": ["model.json"]})
+    model = server.cache.get(os.path.join(server.folder_path, "model.json"))
+    server.handle("/plot", {"model": ["model.json"]})
+    assert (
+        server.cache.get(os.path.join(server.folder_path, "model.json"))
+        is model
+    )
+    assert server.handle("/status", {})[1]["models"] == 1
+
+
+def test_model_reloaded_when_changed(server):
+    file_path = os.path.join(server.folder_path, "model.json")
+    server.handle("/stages", {"model": ["model.json"]})
+    with open(file_path) as file:
+        json_data = json.load(file)
+    json_data["Stages"][0]["Name"] = "Changed"
+    with open(file_path, "w") as file:
+        json.dump(json_data, file)
+    status, payload = server.handle("/stages", {"model": ["model.json"]})
+    assert payload["stages"][0] == "Changed"
+
+
+def test_memory_budget(model_folder):
+    shutil.copy(
+        os.path.join(model_folder, "model.json"),
+        os.path.join(model_folder, "model_2.json"),
+    )
+    server = ModelServer(model_folder, port=0, cache=ModelCache(1))
+    server.handle("/titles", {"model": ["model.json"]})
+    server.handle("/titles", {"model": ["model_2.json"]})
+    assert server.handle("/status", {})[1]["models"] == 1
+    server._httpd.server_close()
+
+
+def test_errors(server):
+    assert server.handle("/unknown", {})[0] == 404
+    assert server.handle("/titles", {"model": ["missing.json"]})[0] == 404
+    assert server.handle("/titles", {"model": ["../model.json"]})[0] == 400
+    assert (
+        server.handle(
+            "/results", {"model": ["model.json"], "fields": ["stress"]}
+        )[0]
+        == 400
+    )
+
+
+def test_unexpected_error(server):
+    file_path = os.path.join(server.folder_path, "model.json")
+    with open(file_path) as file:
+        json_data = json.load(file)
+    del json_data["Frew Results"][0]["Stageresults"][0]["Noderesults"][0][
+        "Shear"
+    ]
+    with open(file_path, "w") as file:
+        json.dump(json_data, file)
+    status, payload = server.handle("/results", {"model": ["model.json"]})
+    assert status == 500
+    assert payload["error"].startswith("KeyError")
+
+
+def test_folder_missing(tmp_path):
+    with pytest.raises(FrewError):
+        ModelServer(os.path.join(tmp_path, "missing"), port=0)
+
+
+def test_http(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.address
+    try:
+        with urlopen(
+            f"http://{host}:{port}/stages?model=model.json"
+        ) as response:
+            assert len(json.loads(response.read())["stages"]) == 11
+        with pytest.raises(HTTPError):
+            urlopen(f"http://{host}:{port}/titles")
+    finally:
+        server.shutdown()
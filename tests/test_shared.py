@@ -0,0 +1,87 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np  # type: ignore
+import pytest
+
+from test_config import TEST_DATA
+from frewpy import FrewModel
+from frewpy.shared import SharedHandle, SharedResults
+from frewpy.models.exceptions import FrewError
+
+
+MODEL_PATH = os.path.join(TEST_DATA, "test_model_with_results.json")
+
+
+def _sum_shared(handle: SharedHandle, field: str) -> float:
+    return float(handle.attach()[field].sum())
+
+
+@pytest.fixture
+def arrays():
+    return {
+        "bending": np.arange(24, dtype="float64").reshape(2, 3, 4),
+        "levels": np.linspace(0.0, -10.0, 5, dtype="float32"),
+    }
+
+
+def test_round_trip(arrays):
+    with SharedResults(arrays) as shared:
+        handle = pickle.loads(pickle.dumps(shared.handle))
+        attached = handle.attach()
+        for field, values in arrays.items():
+            assert attached[field].dtype == values.dtype
+            np.testing.assert_array_equal(attached[field], values)
+
+
+def test_read_only(arrays):
+    with SharedResults(arrays) as shared:
+        attached = shared.handle.attach()
+        with pytest.raises(ValueError):
+            attached["bending"][0, 0, 0] = 1.0
+
+
+def test_arrays_outlive_close(arrays):
+    shared = SharedResults(arrays)
+    stage_results = shared.handle.attach()["bending"][1]
+    shared.close()
+    np.testing.assert_array_equal(stage_results, arrays["bending"][1])
+
+
+def test_attach_after_close(arrays):
+    shared = SharedResults(arrays)
+    handle = shared.handle
+    shared.close()
+    del shared
+    with pytest.raises(FrewError):
+        handle.attach()
+
+
+def test_worker_processes(arrays):
+    with SharedResults(arrays) as shared:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            sums = list(
+                executor.map(
+                    _sum_shared, [shared.handle] * 2, ["bending", "levels"]
+                )
+            )
+    assert sums == pytest.approx(
+        [arrays["bending"].sum(), arrays["levels"].sum()]
+    )
+
+
+def test_from_model():
+    model = FrewModel(MODEL_PATH, result_dtype="float32")
+    with SharedResults.from_model(model, ["bending", "shear"]) as shared:
+        attached = shared.arrays
+        assert set(attached) == {
+            "bending",
+            "shear",
+            "node_levels",
+            "strut_force",
+        }
+        assert attached["bending"].shape == (11, 1, 68)
+        assert attached["bending"].dtype == np.float32
+        assert attached["node_levels"].shape == (68,)
+        assert attached["strut_force"].shape[:2] == (11, 1)
@@ -1,3 +1,4 @@
+import numpy as np  # type: ignore
 import pytest
 
 from test_fixtures import model, empty_model
@@ -40,3 +41,60 @@ def test_get_material_properties(model):
     assert properties["Phi"] == 30.0
     assert properties["Wallsoilfric_ratio"] == 0.6700000166893005
     assert properties["Phimax"] == 35.0
+
+
+def test_set_material_property(model):
+    model.soil.set_material_property("Made Ground", "Phi", 32.0)
+    assert model.soil.get_material_properties("Made Ground")["Phi"] == 32.0
+    assert model.changes.get_modified() == {"Materials": [0]}
+
+
+def test_set_material_property_missing_property(model):
+    with pytest.raises(FrewError):
+        model.soil.set_material_property("Made Ground", "Strength", 1.0)
+
+
+def test_get_materials_at_nodes(model):
+    for stage, stage_dict in enumerate(model.json_data["Stages"]):
+        nodes = stage_dict["GeoFrewNodes"]
+        levels = [node["Level"] for node in nodes]
+        for side, zone in [("left", "Leftzone"), ("right", "Rightzone")]:
+            assert list(model.soil.get_materials_at(levels, stage, side)) == [
+                node[zone] for node in nodes
+            ]
+
+
+def test_get_materials_at_boundaries(model):
+    materials = model.soil.get_materials_at([5.0, 1.5, -6.0, -100.0], 3)
+    assert list(materials) == [0, 2, 6, 10]
+
+
+def test_get_materials_at_marked_stage(model):
+    assert list(model.soil.get_materials_at(1.5, 3)) == [2]
+    model.json_data["Stages"][3]["LeftLayers"][1]["Material"] = 3
+    assert list(model.soil.get_materials_at(1.5, 3)) == [2]
+    model.mark_modified("Stages", 3)
+    assert list(model.soil.get_materials_at(1.5, 3)) == [3]
+
+
+def test_get_materials_at_invalid(model):
+    with pytest.raises(FrewError):
+        model.soil.get_materials_at(0.0, 11)
+    with pytest.raises(FrewError):
+        model.soil.get_materials_at(0.0, 0, side="middle")
+
+
+def test_get_properties_at(model):
+    properties = model.soil.get_properties_at(
+        [0.0, -7.0], 3, side="right", properties=["Name", "UnitWeight"]
+    )
+    assert list(properties["Name"]) == [None, "LC A - undrained"]
+    assert np.isnan(properties["UnitWeight"][0])
+    assert properties["UnitWeight"][1] == (
+        model.soil.get_material_properties("LC A - undrained")["UnitWeight"]
+    )
+
+
+def test_get_properties_at_no_materials(empty_model):
+    with pytest.raises(FrewError):
+        empty_model.soil.get_properties_at(0.0, 0)
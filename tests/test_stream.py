@@ -0,0 +1,74 @@
+import io
+import os
+import gzip
+import json
+
+import pytest
+
+from test_config import TEST_DATA
+from frewpy import FrewModel, peek
+from frewpy.stream import scan_members
+from frewpy.models.exceptions import FrewError
+
+
+MODEL_PATH = os.path.join(TEST_DATA, "test_model_with_results.json")
+
+
+def test_peek():
+    model = FrewModel(MODEL_PATH)
+    header = peek(MODEL_PATH, stages=True)
+    for request in ["titles", "file history", "file version", "frew version"]:
+        assert header[request] == model.get(request)
+    assert header["stage names"] == model.get("stage names")
+    assert header["num stages"] == 11
+
+
+def test_peek_compressed(tmp_path):
+    file_path = os.path.join(tmp_path, "model.json.gz")
+    with open(MODEL_PATH, "rb") as in_file, gzip.open(file_path, "wb") as file:
+        file.write(in_file.read())
+    assert peek(file_path, stages=True) == peek(MODEL_PATH, stages=True)
+
+
+def test_peek_stops_reading(tmp_path):
+    # Only the header is valid, so the rest of the file must not be read.
+    with open(MODEL_PATH, "rb") as file:
+        contents = file.read()
+    header_end = contents.index(b'"Units"')
+    file_path = os.path.join(tmp_path, "header.json")
+    with open(file_path, "wb") as file:
+        file.write(contents[:header_end] + b"[not json" * 1000)
+    assert peek(file_path)["frew version"] == "19.4"
+
+
+def test_peek_incomplete_header(tmp_path):
+    file_path = os.path.join(tmp_path, "model.json")
+    with open(file_path, "w") as file:
+        file.write('{"Version": [1]}')
+    with pytest.raises(FrewError):
+        peek(file_path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 16384])
+def test_scan_members_ranges(chunk_size):
+    with open(MODEL_PATH, "rb") as file:
+        contents = file.read()
+    members = list(
+        scan_members(io.BytesIO(contents), ["Units"], chunk_size=chunk_size)
+    )
+    json_data = json.loads(contents)
+    assert [member[0] for member in members] == list(json_data.keys())
+    for key, start, end, value in members:
+        assert json.loads(contents[start:end]) == json_data[key]
+        if key == "Units":
+            assert json.loads(value) == json_data["Units"]
+        else:
+            assert value is None
+
+
+def test_scan_members_escapes():
+    contents = b'{"a\\"b": "x\\\\", "c": {"d": "}"}, "e": 1}'
+    members = list(scan_members(io.BytesIO(contents), ["c"], chunk_size=3))
+    assert [member[0] for member in members] == ['a"b', "c", "e"]
+    assert json.loads(members[1][3]) == {"d": "}"}
+    assert contents[members[2][1] : members[2][2]] == b" 1"
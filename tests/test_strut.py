@@ -0,0 +1,66 @@
+import os
+import json
+
+import numpy as np  # type: ignore
+import pytest
+
+from test_config import TEST_DATA
+from test_fixtures import json_data
+from frewpy.models import Strut
+from frewpy.utils import get_extremes
+from frewpy.models.exceptions import FrewError
+
+
+json_data = json_data
+
+
+@pytest.fixture
+def strut_model():
+    with open(os.path.join(TEST_DATA, "test_model_with_results.json")) as file:
+        loaded_data = json.loads(file.read())
+    return Strut(loaded_data)
+
+
+def test_get_strut_levels(strut_model):
+    assert strut_model.get_strut_levels()[1] == -6.375
+
+
+def test_get_strut_levels_none():
+    with pytest.raises(FrewError):
+        Strut({"Stages": []}).get_strut_levels()
+
+
+def test_get_strut_forces(strut_model):
+    strut_forces = strut_model.get_strut_forces()
+    assert strut_forces.shape == (11, 1, 8)
+    assert strut_forces[9, 0, 1] == pytest.approx(413.3746398)
+
+
+def test_get_strut_forces_not_installed(strut_model):
+    # The second strut is installed at stage 4, and the first two are
+    # removed at stage 10.
+    strut_forces = strut_model.get_strut_forces()
+    assert np.isnan(strut_forces[:4, :, 1]).all()
+    assert not np.isnan(strut_forces[4:10, :, 1]).any()
+    assert np.isnan(strut_forces[10, :, 0]).all()
+    minimum = get_extremes(
+        strut_model.json_data,
+        {"force": strut_forces[..., 1:2]},
+        [-6.375],
+        location="strut",
+    )["force"]["minimum"][0]
+    assert minimum["stage"] == 4
+    assert minimum["value"] > 0
+
+
+def test_get_strut_forces_no_results(json_data):
+    with pytest.raises(FrewError):
+        Strut(json_data).get_strut_forces()
+
+
+def test_find_extremes(strut_model):
+    maximum = strut_model.find_extremes()["force"]["maximum"][0]
+    assert maximum["value"] == pytest.approx(648.1314500)
+    assert maximum["strut"] == 6
+    assert maximum["stage"] == 10
+    assert maximum["level"] == -6.375
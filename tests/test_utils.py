@@ -1,5 +1,7 @@
 import os
+import gzip
 
+import numpy as np
 import pytest
 
 from test_config import TEST_DATA
@@ -8,6 +10,8 @@ from frewpy.utils import (
     _check_frew_path,
     check_json_path,
     load_data,
+    copy_model,
+    strip_json_extension,
     model_to_json,
     get_titles,
     get_file_history,
@@ -20,6 +24,8 @@ from frewpy.utils import (
     get_num_design_cases,
     get_design_case_names,
     check_results_present,
+    get_node_results,
+    get_float32_error,
 )
 from frewpy.models.exceptions import FrewError, NodeError
 
@@ -75,6 +81,14 @@ def test_load_data():
     ]
 
 
+def test_load_data_not_object(tmp_path):
+    file_path = os.path.join(tmp_path, "list.json")
+    with open(file_path, "w") as file:
+        file.write("[]")
+    with pytest.raises(FrewError):
+        load_data(file_path)
+
+
 def test_check_json_path_exists():
     with pytest.raises(FrewError):
         check_json_path("path_does_not_exists.json")
@@ -85,6 +99,38 @@ def test_check_json_path_extension():
         check_json_path(os.path.join(TEST_DATA, "test_model_1.fwd"))
 
 
+def test_strip_json_extension():
+    assert strip_json_extension("model.JSON.gz") == "model"
+    assert strip_json_extension("model.json.zst") == "model"
+    assert strip_json_extension("model.fwd") == "model.fwd"
+
+
+def test_copy_model_compressed(tmp_path):
+    file_path = os.path.join(TEST_DATA, "test_model_1.json")
+    gz_path = copy_model(file_path, os.path.join(tmp_path, "model.json.gz"))
+    with gzip.open(gz_path) as file:
+        assert file.read(1) == b"{"
+    assert load_data(gz_path) == load_data(file_path)
+    json_path = copy_model(gz_path, os.path.join(tmp_path, "model.json"))
+    with open(json_path, "rb") as json_file, open(file_path, "rb") as file:
+        assert json_file.read() == file.read()
+
+
+def test_copy_model_zstandard(tmp_path):
+    pytest.importorskip("zstandard")
+    file_path = os.path.join(TEST_DATA, "test_model_1.json")
+    zst_path = copy_model(file_path, os.path.join(tmp_path, "model.json.zst"))
+    assert load_data(zst_path) == load_data(file_path)
+
+
+def test_copy_model_extension(tmp_path):
+    with pytest.raises(FrewError):
+        copy_model(
+            os.path.join(TEST_DATA, "test_model_1.json"),
+            os.path.join(tmp_path, "model.txt"),
+        )
+
+
 def test_clear_results(json_data_with_results):
     json_data_without_results = clear_results(json_data_with_results)
     assert not json_data_without_results.get("Frew Results", False)
@@ -238,3 +284,37 @@ def test_check_results_present_none(json_data):
 def test_check_results_present(json_data_with_results):
     check_results_present(json_data_with_results)
     assert True
+
+
+def test_get_node_results(json_data_with_results):
+    node_results = get_node_results(
+        json_data_with_results, ["bending", "water_left"]
+    )
+    assert node_results["bending"].shape == (11, 1, 68)
+    assert node_results["water_left"][10, 0, 9] == pytest.approx(2.207249)
+
+
+def test_get_node_results_invalid_field(json_data_with_results):
+    with pytest.raises(FrewError):
+        get_node_results(json_data_with_results, ["moment"])
+
+
+def test_get_node_results_float32(json_data_with_results):
+    node_results = get_node_results(json_data_with_results, ["bending"])
+    float32_results = get_node_results(
+        json_data_with_results, ["bending"], dtype="float32"
+    )
+    assert float32_results["bending"].dtype == np.float32
+    error = get_float32_error(node_results)["bending"]
+    assert 0 < error < 1e-4
+    assert (
+        np.abs(float32_results["bending"] - node_results["bending"]).max(
+            initial=0.0
+        )
+        <= error
+    )
+
+
+def test_get_node_results_invalid_dtype(json_data_with_results):
+    with pytest.raises(FrewError):
+        get_node_results(json_data_with_results, ["bending"], dtype="int8")
@@ -0,0 +1,159 @@
+import os
+import json
+import pickle
+
+import pytest
+
+from test_config import TEST_DATA
+from frewpy.models import Wall
+from frewpy.models.plot import FrewMPL
+from frewpy.utils import get_titles
+from frewpy.models.exceptions import FrewError
+
+
+@pytest.fixture
+def wall_model():
+    with open(os.path.join(TEST_DATA, "test_model_with_results.json")) as file:
+        loaded_data = json.loads(file.read())
+    return Wall(loaded_data)
+
+
+def test_at_levels_shape(wall_model):
+    level_results = wall_model.at_levels([0.0, -5.0, -10.0])
+    assert list(level_results.keys()) == ["shear", "bending", "displacement"]
+    assert level_results["bending"].shape == (11, 1, 3)
+
+
+def test_at_levels_node_level(wall_model):
+    node_levels = wall_model.get_node_levels()
+    wall_results = wall_model.get_results()
+    level_results = wall_model.at_levels(node_levels[20], fields=["bending"])
+    assert level_results["bending"][9, 0, 0] == pytest.approx(
+        wall_results[9]["SLS"]["bending"][20]
+    )
+
+
+def test_at_levels_between_nodes(wall_model):
+    node_levels = wall_model.get_node_levels()
+    wall_results = wall_model.get_results()
+    level = (node_levels[30] + node_levels[31]) / 2
+    level_results = wall_model.at_levels(level, fields=["displacement"])
+    disp = wall_results[6]["SLS"]["displacement"]
+    assert level_results["displacement"][6, 0, 0] == pytest.approx(
+        (disp[30] + disp[31]) / 2
+    )
+
+
+def test_at_levels_toe(wall_model):
+    toe_level = wall_model.get_node_levels()[-1]
+    level_results = wall_model.at_levels(toe_level, fields=["shear"])
+    assert level_results["shear"][10, 0, 0] == pytest.approx(
+        wall_model.get_results()[10]["SLS"]["shear"][-1]
+    )
+
+
+def test_at_levels_outside_wall(wall_model):
+    with pytest.raises(FrewError):
+        wall_model.at_levels([10.0])
+
+
+def test_at_levels_invalid_field(wall_model):
+    with pytest.raises(FrewError):
+        wall_model.at_levels([0.0], fields=["moment"])
+
+
+def test_find_extremes(wall_model):
+    extremes = wall_model.find_extremes(fields=["bending"], num_values=3)
+    envelopes = wall_model.get_envelopes()
+    maximum = extremes["bending"]["maximum"]
+    assert len(maximum) == 3
+    assert maximum[0]["value"] == pytest.approx(
+        max(envelopes["SLS"]["maximum"]["bending"])
+    )
+    assert maximum[0]["value"] >= maximum[1]["value"] >= maximum[2]["value"]
+    assert extremes["bending"]["minimum"][0]["value"] == pytest.approx(
+        min(envelopes["SLS"]["minimum"]["bending"])
+    )
+
+
+def test_find_extremes_record(wall_model):
+    record = wall_model.find_extremes(fields=["displacement"])["displacement"][
+        "maximum"
+    ][0]
+    wall_results = wall_model.get_results()
+    assert record["design case"] == "SLS"
+    assert record["level"] == wall_model.get_node_levels()[record["node"] - 1]
+    assert record["value"] == pytest.approx(
+        wall_results[record["stage"]]["SLS"]["displacement"][
+            record["node"] - 1
+        ]
+    )
+
+
+def test_find_extremes_float32(wall_model):
+    float32_wall = Wall(wall_model.json_data, result_dtype="float32")
+    extremes = wall_model.find_extremes(num_values=5)
+    float32_extremes = float32_wall.find_extremes(num_values=5)
+    for field, records in extremes.items():
+        for extreme in ["maximum", "minimum"]:
+            for record, float32_record in zip(
+                records[extreme], float32_extremes[field][extreme]
+            ):
+                assert float32_record["value"] == pytest.approx(
+                    record["value"], rel=1e-7, abs=1e-12
+                )
+
+
+def test_plot_results_pdf(wall_model, tmp_path):
+    wall_model.plot_results_pdf(str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_plot_results_pdf_workers(wall_model, tmp_path):
+    pypdf = pytest.importorskip("pypdf")
+    wall_model.plot_results_pdf(str(tmp_path), workers=2, max_pending=1)
+    pdf_path = os.path.join(tmp_path, os.listdir(tmp_path)[0])
+    assert len(pypdf.PdfReader(pdf_path).pages) == 11
+
+
+def test_plot_results_html_compact(wall_model, tmp_path, monkeypatch):
+    from bokeh.io import save
+    import frewpy.models.plot
+
+    monkeypatch.setattr(frewpy.models.plot, "show", save)
+    wall_model.plot_results_html(str(tmp_path), compact=True)
+    wall_model.plot_results_html(str(tmp_path))
+    sizes = sorted(
+        os.path.getsize(os.path.join(tmp_path, file))
+        for file in os.listdir(tmp_path)
+    )
+    assert len(sizes) == 2
+    assert sizes[0] < sizes[1] / 2
+
+
+def test_pickle_result_arrays(wall_model):
+    wall_model.find_extremes(["bending"])
+    wall = pickle.loads(pickle.dumps(wall_model))
+    assert wall.json_data == wall_model.json_data
+    assert list(wall._result_arrays) == ["bending"]
+    assert wall._results_source is wall.json_data["Frew Results"]
+
+
+def test_frew_mpl_stage(wall_model):
+    wall_results = wall_model.get_results()
+    frew_mpl = FrewMPL(
+        get_titles(wall_model.json_data),
+        3,
+        "Stage three",
+        wall_results,
+        wall_model.get_node_levels(),
+        wall_model.get_envelopes(wall_results),
+    )
+    assert "Stage three" in frew_mpl.fig_title.get_text()
+    assert list(frew_mpl.result_lines[1][0].get_xdata()) == (
+        wall_results[3]["SLS"]["bending"]
+    )
+    frew_mpl.plot_stage(4, "Stage four")
+    assert list(frew_mpl.result_lines[1][0].get_xdata()) == (
+        wall_results[4]["SLS"]["bending"]
+    )
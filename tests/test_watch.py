@@ -0,0 +1,96 @@
+import os
+import json
+import shutil
+
+import pandas as pd
+import pytest
+
+from test_config import TEST_DATA
+from frewpy.watch import FolderWatcher
+from frewpy.models.exceptions import FrewError
+
+
+@pytest.fixture
+def model_folder(tmp_path):
+    shutil.copy(
+        os.path.join(TEST_DATA, "test_model_with_results.json"),
+        os.path.join(tmp_path, "model.json"),
+    )
+    return str(tmp_path)
+
+
+@pytest.fixture
+def watcher(model_folder):
+    with FolderWatcher(
+        model_folder, formats=["csv"], debounce=0, workers=1
+    ) as watcher:
+        yield watcher
+
+
+def _change_stage_name(file_path, name):
+    with open(file_path) as file:
+        json_data = json.load(file)
+    json_data["Stages"][0]["Name"] = name
+    with open(file_path, "w") as file:
+        json.dump(json_data, file)
+
+
+def test_regenerate_changed(watcher, model_folder):
+    file_path = os.path.join(model_folder, "model.json")
+    assert watcher.poll() == [file_path]
+    assert watcher.regenerate([file_path]) == {file_path: None}
+    csv_path = watcher.get_out_paths(file_path)["csv"]
+    assert len(pd.read_csv(csv_path)) == 11 * 68
+    assert watcher.poll() == []
+
+    _change_stage_name(file_path, "Changed")
+    assert watcher.poll() == [file_path]
+
+
+def test_touched_model_skipped(watcher, model_folder):
+    file_path = os.path.join(model_folder, "model.json")
+    watcher.run(max_polls=1)
+    stat = os.stat(file_path)
+    os.utime(file_path, (stat.st_atime, stat.st_mtime + 1))
+    assert watcher.poll() == []
+
+
+def test_up_to_date_outputs_skipped(watcher, model_folder):
+    watcher.run(max_polls=1)
+    with FolderWatcher(model_folder, formats=["csv"], debounce=0) as other:
+        assert other.poll() == []
+
+
+def test_debounce(model_folder):
+    with FolderWatcher(model_folder, formats=["csv"], debounce=60) as watcher:
+        _change_stage_name(os.path.join(model_folder, "model.json"), "New")
+        assert watcher.poll() == []
+
+
+def test_failure_reported(watcher, model_folder):
+    file_path = os.path.join(model_folder, "no_results.json")
+    shutil.copy(os.path.join(TEST_DATA, "test_model_1.json"), file_path)
+    errors = {}
+    watcher.run(callback=errors.update, max_polls=1)
+    assert errors[file_path] is not None
+    assert errors[os.path.join(model_folder, "model.json")] is None
+
+
+def test_unexpected_error_reported(watcher, model_folder):
+    with open(os.path.join(model_folder, "model.json")) as file:
+        json_data = json.load(file)
+    del json_data["Frew Results"][0]["Stageresults"][0]["Noderesults"][0][
+        "Shear"
+    ]
+    file_path = os.path.join(model_folder, "no_shear.json")
+    with open(file_path, "w") as file:
+        json.dump(json_data, file)
+    errors = {}
+    watcher.run(interval=0, callback=errors.update, max_polls=2)
+    assert errors[file_path].startswith("KeyError")
+    assert errors[os.path.join(model_folder, "model.json")] is None
+
+
+def test_unknown_format(model_folder):
+    with pytest.raises(FrewError):
+        FolderWatcher(model_folder, formats=["docx"])
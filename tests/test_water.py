@@ -1,6 +1,7 @@
 import os
 import json
 
+import numpy as np  # type: ignore
 import pytest
 
 from test_config import TEST_DATA
@@ -19,3 +20,53 @@ def test_get_water_pressures(water_model):
     assert len(list(water_pressure.keys())) == 11
     assert water_pressure[10]["SLS"]["left"][9] == pytest.approx(2.207249)
     assert water_pressure[9]["SLS"]["right"][-1] == pytest.approx(282.131010)
+
+
+def test_find_extremes(water_model):
+    extremes = water_model.find_extremes()
+    assert extremes["water_right"]["maximum"][0]["value"] == pytest.approx(
+        282.131010
+    )
+    assert extremes["water_right"]["maximum"][0]["node"] == 68
+
+
+def test_get_groundwater_profiles(water_model):
+    profiles = water_model.get_groundwater_profiles()
+    right = profiles["water_right"]
+    assert right["levels"].shape == (11, 2)
+    assert right["levels"][10] == pytest.approx([-11.9, -11.9])
+    assert right["pressures"][10] == pytest.approx([0.0, 134.0])
+    assert np.isnan(right["levels"][0, 1])
+    assert right["unit_weight"][10] == pytest.approx(9.81)
+
+
+def test_get_input_pressures(water_model):
+    input_pressures = water_model.get_input_pressures([0.0, -1.3, -12.9])
+    assert input_pressures["water_left"].shape == (11, 3)
+    assert input_pressures["water_left"][10] == pytest.approx(
+        [0.0, 9.81, 123.606], abs=1e-5
+    )
+    assert input_pressures["water_right"][10] == pytest.approx(
+        [0.0, 0.0, 143.81], abs=1e-5
+    )
+
+
+def test_get_input_pressures_step(water_model):
+    # A point between the others, with a step in pressure at -5m.
+    water_model.json_data["Stages"][0]["GeoGroundWater"][0]["Points"] = [
+        {"X": "NaN", "Y": -1.0, "Z": 0.0},
+        {"X": "NaN", "Y": -5.0, "Z": 20000.0},
+        {"X": "NaN", "Y": -5.0, "Z": 50000.0},
+    ]
+    input_pressures = water_model.get_input_pressures([-3.0, -5.0, -6.0])
+    assert input_pressures["water_left"][0] == pytest.approx(
+        [10.0, 50.0, 59.8], abs=1e-5
+    )
+
+
+def test_compare_pressures(water_model):
+    differences = water_model.compare_pressures()
+    assert differences["water_left"].shape == (11, 1, 68)
+    assert np.abs(differences["water_right"][10]).max() < 1e-6
+    # The results of the undrained clay differ from the input groundwater.
+    assert np.abs(differences["water_left"][3]).max() > 100.0
@@ -0,0 +1,16 @@
+from frewpy.workers import run_task
+from frewpy.models.exceptions import FrewError
+
+
+def _raise_error(error):
+    raise error
+
+
+def test_run_task():
+    assert run_task(len, "model.json") is None
+
+
+def test_run_task_error():
+    assert run_task(_raise_error, KeyError("Shear")) == "KeyError: 'Shear'"
+    error = FrewError("\n    Multi line\n    message.\n")
+    assert run_task(_raise_error, error) == "FrewError: Multi line message."